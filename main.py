@@ -1,7 +1,14 @@
-from src.menu import Menu
+import sys
 
 
 def main() -> None:
+    if len(sys.argv) > 1:
+        from src.cli import main as cli_main
+
+        sys.exit(cli_main())
+
+    from src.menu import Menu
+
     menu = Menu()
     menu.run()
 
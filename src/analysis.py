@@ -0,0 +1,140 @@
+import math
+from collections import Counter
+from functools import lru_cache
+from itertools import islice, product, repeat
+from operator import add, mul
+
+from src.cipher import cipher_factory
+from src.constants import ANALYSIS_REFINE, ANALYSIS_SAMPLE_SIZE, CAESAR, ROT13, ROT47
+from src.text import Text
+
+CANDIDATES = (ROT13, ROT47, *(f"{CAESAR}:{shift}" for shift in range(1, 26) if shift != 13))
+
+LETTER_FREQUENCIES = {
+    "e": 12.7, "t": 9.1, "a": 8.2, "o": 7.5, "i": 7.0, "n": 6.7, "s": 6.3, "h": 6.1, "r": 6.0,
+    "d": 4.3, "l": 4.0, "c": 2.8, "u": 2.8, "m": 2.4, "w": 2.4, "f": 2.2, "g": 2.0, "y": 2.0,
+    "p": 1.9, "b": 1.5, "v": 1.0, "k": 0.8, "j": 0.15, "x": 0.15, "q": 0.1, "z": 0.07,
+}  # fmt: skip
+
+BIGRAM_FREQUENCIES = {
+    "th": 3.56, "he": 3.07, "in": 2.43, "er": 2.05, "an": 1.99, "re": 1.85, "on": 1.76,
+    "at": 1.49, "en": 1.45, "nd": 1.35, "ti": 1.34, "es": 1.34, "or": 1.28, "te": 1.20,
+    "of": 1.17, "ed": 1.17, "is": 1.13, "it": 1.12, "al": 1.09, "ar": 1.07, "st": 1.05,
+    "to": 1.04, "nt": 1.04, "ng": 0.95, "se": 0.93, "ha": 0.93, "as": 0.87, "ou": 0.87,
+    "io": 0.83, "le": 0.83, "ve": 0.83, "co": 0.79, "me": 0.79, "de": 0.76, "hi": 0.76,
+    "ri": 0.73, "ro": 0.73, "ic": 0.70, "ne": 0.69, "ea": 0.69, "ra": 0.69, "ce": 0.65,
+    "li": 0.62, "ch": 0.60, "ll": 0.58, "be": 0.58, "ma": 0.57, "si": 0.55, "om": 0.55,
+    "ur": 0.54, "ca": 0.54, "el": 0.53, "ta": 0.53, "la": 0.53, "ns": 0.51, "di": 0.49,
+    "fo": 0.48, "ho": 0.48, "pe": 0.47, "ec": 0.46, "pr": 0.45, "no": 0.45, "ct": 0.44,
+    "us": 0.44, "ac": 0.43, "ot": 0.42, "il": 0.42, "tr": 0.42, "ly": 0.42, "nc": 0.41,
+    "et": 0.41, "ut": 0.41, "ss": 0.41, "so": 0.40, "rs": 0.40, "un": 0.39, "lo": 0.39,
+    "wa": 0.39, "ge": 0.39, "ie": 0.39, "wh": 0.38, "ee": 0.38, "wi": 0.37, "em": 0.37,
+    "ad": 0.37, "ol": 0.36, "rt": 0.36, "po": 0.35, "we": 0.35, "na": 0.35, "ul": 0.35,
+    "ni": 0.34, "ts": 0.34, "mo": 0.33, "ow": 0.33, "pa": 0.32, "im": 0.32, "mi": 0.32,
+    "ai": 0.32, "sh": 0.32, "ir": 0.32, "su": 0.31, "id": 0.30, "os": 0.30, "iv": 0.29,
+    "ia": 0.29, "am": 0.29, "fi": 0.29, "ci": 0.28, "vi": 0.27, "pl": 0.27, "ig": 0.26,
+    "tu": 0.26, "ev": 0.26, "ld": 0.25, "ry": 0.25, "mp": 0.25, "fe": 0.24, "bl": 0.24,
+    "ab": 0.23, "gh": 0.23, "ty": 0.23, "op": 0.23, "wo": 0.22, "sa": 0.22, "ay": 0.22,
+    "ex": 0.22, "ke": 0.22, "fr": 0.21, "oo": 0.21, "av": 0.21, "ag": 0.21, "if": 0.20,
+    "ap": 0.20, "gr": 0.20, "od": 0.20, "bo": 0.20, "sp": 0.19, "rd": 0.19, "do": 0.19,
+    "uc": 0.19, "bu": 0.19, "ei": 0.18, "ov": 0.18, "by": 0.18, "rm": 0.18, "ep": 0.17,
+    "tt": 0.17, "oc": 0.17, "fa": 0.17, "ef": 0.17, "cu": 0.17, "rn": 0.16, "sc": 0.16,
+    "gi": 0.16, "da": 0.16, "yo": 0.16, "cr": 0.16, "cl": 0.16, "du": 0.16, "ga": 0.16,
+}  # fmt: skip
+
+SPACE_WEIGHT = 18.0
+DIGIT_WEIGHT = 0.3
+PUNCTUATION_WEIGHT = 0.5
+SYMBOL_WEIGHT = 0.02
+UPPERCASE_RATIO = 0.1
+COMMON_PUNCTUATION = ".,'\"-!?:;()\n\t"
+UNKNOWN_BIGRAM_SCORE = -1.0
+
+
+def _unigram_log_probs() -> list[float]:
+    weights = [SYMBOL_WEIGHT] * 128
+    weights[ord(" ")] = SPACE_WEIGHT
+    for char in COMMON_PUNCTUATION:
+        weights[ord(char)] = PUNCTUATION_WEIGHT
+    for char in "0123456789":
+        weights[ord(char)] = DIGIT_WEIGHT
+    for char, frequency in LETTER_FREQUENCIES.items():
+        weights[ord(char)] = frequency * (1 - UPPERCASE_RATIO)
+        weights[ord(char.upper())] = frequency * UPPERCASE_RATIO
+
+    total = sum(weights)
+    return [math.log(weight / total) for weight in weights]
+
+
+def _bigram_log_odds() -> dict[str, float]:
+    expected = 100 / len(LETTER_FREQUENCIES) ** 2
+    return {pair: math.log(frequency / expected) for pair, frequency in BIGRAM_FREQUENCIES.items()}
+
+
+UNIGRAM_LOG_PROBS = _unigram_log_probs()
+BIGRAM_LOG_ODDS = _bigram_log_odds()
+
+
+@lru_cache(maxsize=None)
+def _decode_table(rot_type: str) -> str:
+    ascii_chars = "".join(map(chr, range(128)))
+    return cipher_factory(rot_type).inverse().cipher(Text(text=ascii_chars, rot_type="", status=""))
+
+
+@lru_cache(maxsize=None)
+def _unigram_scores(rot_type: str) -> dict[str, float]:
+    decode = _decode_table(rot_type)
+    return {chr(code): UNIGRAM_LOG_PROBS[ord(plain)] for code, plain in enumerate(decode)}
+
+
+@lru_cache(maxsize=None)
+def _bigram_scores(rot_type: str) -> dict[str, float]:
+    decode = _decode_table(rot_type)
+    letters = [chr(code) for code, plain in enumerate(decode) if plain.isalpha()]
+    return {
+        first + second: BIGRAM_LOG_ODDS.get(
+            (decode[ord(first)] + decode[ord(second)]).lower(), UNKNOWN_BIGRAM_SCORE
+        )
+        for first, second in product(letters, repeat=2)
+    }
+
+
+def histogram(text: str) -> Counter[str]:
+    return Counter(text[:ANALYSIS_SAMPLE_SIZE])
+
+
+def bigram_histogram(text: str) -> Counter[str]:
+    sample = text[:ANALYSIS_SAMPLE_SIZE]
+    return Counter(map(add, sample, islice(sample, 1, None)))
+
+
+def rank_ciphers(text: str, refine: int = ANALYSIS_REFINE) -> list[tuple[str, float]]:
+    counts = {char: count for char, count in histogram(text).items() if char < "\x80"}
+    if not any("!" <= char <= "~" for char in counts):
+        return []
+
+    chars, weights = list(counts), list(counts.values())
+    total = sum(weights)
+    scores = sorted(
+        (
+            sum(map(mul, weights, map(_unigram_scores(rot_type).__getitem__, chars))) / total,
+            rot_type,
+        )
+        for rot_type in CANDIDATES
+    )[::-1]
+
+    if refine > 0:
+        bigrams = bigram_histogram(text)
+        pairs, pair_counts = list(bigrams), list(bigrams.values())
+        refined = []
+        for score, rot_type in scores[:refine]:
+            pair_scores = map(_bigram_scores(rot_type).get, pairs, repeat(0.0))
+            refined.append((score + sum(map(mul, pair_counts, pair_scores)) / total, rot_type))
+        scores[:refine] = sorted(refined, reverse=True)
+
+    return [(rot_type, score) for score, rot_type in scores]
+
+
+def detect_cipher(text: str) -> str | None:
+    ranking = rank_ciphers(text)
+    return ranking[0][0] if ranking else None
@@ -0,0 +1,270 @@
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from src.buffer import Buffer, ColumnarBuffer
+from src.cipher import Cipher, cipher_factory
+from src.constants import (
+    BENCHMARK_PAYLOADS,
+    BENCHMARK_SIZES,
+    BZ2_EXTENSION,
+    COMPRESSION_LEVEL,
+    GZIP_EXTENSION,
+    JSON_EXTENSION,
+    ROT13,
+    ROT47,
+    STATUS_DECRYPTED,
+    STATUS_ENCRYPTED,
+    XZ_EXTENSION,
+    ZLIB_EXTENSION,
+)
+from src.file_handler import FileHandler
+from src.text import Text
+
+PAYLOADS = BENCHMARK_PAYLOADS
+
+Engine = Callable[[str], Callable[[], object]]
+
+
+@dataclass
+class _DictText:
+    text: str
+    rot_type: str
+    status: str
+
+
+@dataclass
+class CompressionResult:
+    codec: str
+    level: int
+    size: int
+    ratio: float
+    save_seconds: float
+    load_seconds: float
+
+
+@dataclass
+class BenchmarkResult:
+    engine: str
+    payload: str
+    size: int
+    seconds: float
+    chars_per_sec: float
+    mb_per_sec: float
+
+
+def make_payload(kind: str, size: int) -> str:
+    pattern = PAYLOADS[kind]
+    return (pattern * (size // len(pattern) + 1))[:size]
+
+
+def text_engine(cipher: Cipher) -> Engine:
+    def prepare(payload: str) -> Callable[[], object]:
+        text_obj = Text(text=payload, rot_type="", status="")
+        return lambda: cipher.cipher(text_obj)
+
+    return prepare
+
+
+def bytes_engine(cipher: Cipher) -> Engine:
+    def prepare(payload: str) -> Callable[[], object]:
+        data = payload.encode("utf-8")
+        return lambda: cipher.cipher_bytes(data)
+
+    return prepare
+
+
+def default_engines() -> dict[str, Engine]:
+    engines = {
+        ROT13: text_engine(cipher_factory(ROT13)),
+        ROT47: text_engine(cipher_factory(ROT47)),
+        "caesar:3": text_engine(cipher_factory("caesar:3")),
+        f"{ROT13}-bytes": bytes_engine(cipher_factory(ROT13)),
+        f"{ROT47}-bytes": bytes_engine(cipher_factory(ROT47)),
+    }
+
+    from src.cipher_numpy import numpy_available, numpy_cipher
+
+    if numpy_available():
+        engines[f"{ROT13}-numpy"] = text_engine(numpy_cipher(cipher_factory(ROT13)))
+        engines[f"{ROT47}-numpy"] = text_engine(numpy_cipher(cipher_factory(ROT47)))
+
+    return engines
+
+
+def measure(func: Callable[[], object], min_time: float = 0.2, repeat: int = 3) -> float:
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 10
+
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, (time.perf_counter() - start) / loops)
+
+    return best
+
+
+def run_benchmarks(
+    engines: dict[str, Engine],
+    payloads: Iterable[str] = tuple(PAYLOADS),
+    sizes: Iterable[int] = BENCHMARK_SIZES,
+    min_time: float = 0.2,
+    repeat: int = 3,
+) -> list[BenchmarkResult]:
+    results = []
+    for kind in payloads:
+        for size in sizes:
+            payload = make_payload(kind, size)
+            encoded_size = len(payload.encode("utf-8"))
+            for name, prepare in engines.items():
+                seconds = measure(prepare(payload), min_time=min_time, repeat=repeat)
+                results.append(
+                    BenchmarkResult(
+                        engine=name,
+                        payload=kind,
+                        size=size,
+                        seconds=seconds,
+                        chars_per_sec=size / seconds,
+                        mb_per_sec=encoded_size / seconds / 1_000_000,
+                    )
+                )
+
+    return results
+
+
+def results_to_dict(results: list[BenchmarkResult]) -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def save_results(filename: str, results: list[BenchmarkResult]) -> None:
+    with open(filename, "w") as save_file:
+        json.dump(results_to_dict(results), save_file, indent=4)
+
+
+def load_results(filename: str) -> list[BenchmarkResult]:
+    with open(filename, "r") as read_file:
+        data = json.load(read_file)
+
+    return [BenchmarkResult(**result) for result in data["results"]]
+
+
+def compare_results(
+    current: list[BenchmarkResult], baseline: list[BenchmarkResult], tolerance: float = 0.1
+) -> list[str]:
+    reference = {(r.engine, r.payload, r.size): r for r in baseline}
+    regressions = []
+
+    for result in current:
+        base = reference.get((result.engine, result.payload, result.size))
+        if base is None:
+            continue
+        if result.mb_per_sec < base.mb_per_sec * (1 - tolerance):
+            change = (result.mb_per_sec / base.mb_per_sec - 1) * 100
+            regressions.append(
+                f"{result.engine} {result.payload} {result.size}: "
+                f"{base.mb_per_sec:.1f} -> {result.mb_per_sec:.1f} MB/s ({change:+.1f}%)"
+            )
+
+    return regressions
+
+
+def buffer_memory(buffer: Buffer, entries: int, text_cls: Callable[..., object] = Text) -> int:
+    tracemalloc.start()
+    try:
+        for i in range(entries):
+            text_obj = text_cls(
+                text=f"entry {i}",
+                rot_type="".join(("rot", "13")),
+                status="".join(("en", "crypted")),
+            )
+            buffer.add(text_obj)  # type: ignore[arg-type]
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def memory_report(entries: int = 1_000_000) -> dict[str, int]:
+    return {
+        "list[dataclass]": buffer_memory(Buffer(history_bytes=0), entries, text_cls=_DictText),
+        "list[Text]": buffer_memory(Buffer(history_bytes=0), entries),
+        "ColumnarBuffer": buffer_memory(ColumnarBuffer(history_bytes=0), entries),
+    }
+
+
+def make_buffer_records(entries: int, seed: int = 0) -> list[dict[str, str]]:
+    rng = random.Random(seed)
+    words = " ".join(PAYLOADS.values()).split()
+    cipher = cipher_factory(ROT13)
+    records = []
+    for i in range(entries):
+        text_obj = Text(
+            text=" ".join(rng.choices(words, k=rng.randint(3, 30))), rot_type="", status=""
+        )
+        if i % 2:
+            text_obj = Text(text=cipher.cipher(text_obj), rot_type=ROT13, status=STATUS_ENCRYPTED)
+        else:
+            text_obj.status = STATUS_DECRYPTED
+        records.append(
+            {"text": text_obj.text, "rot_type": text_obj.rot_type, "status": text_obj.status}
+        )
+
+    return records
+
+
+def compression_report(
+    entries: int = 100_000,
+    level: int = COMPRESSION_LEVEL,
+    codecs: Iterable[str] = ("", GZIP_EXTENSION, BZ2_EXTENSION, XZ_EXTENSION, ZLIB_EXTENSION),
+) -> list[CompressionResult]:
+    records = make_buffer_records(entries)
+    file_handler = FileHandler(compression_level=level)
+    results: list[CompressionResult] = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        for codec in codecs:
+            filename = os.path.join(directory, f"buffer{JSON_EXTENSION}{codec}")
+
+            start = time.perf_counter()
+            file_handler.save_to_file(filename, records)
+            save_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in file_handler.iter_json_array(filename):
+                pass
+            load_seconds = time.perf_counter() - start
+
+            size = os.path.getsize(filename)
+            baseline = results[0].size if results else size
+            results.append(
+                CompressionResult(
+                    codec=codec or "none",
+                    level=level,
+                    size=size,
+                    ratio=baseline / size,
+                    save_seconds=save_seconds,
+                    load_seconds=load_seconds,
+                )
+            )
+
+    return results
@@ -1,34 +1,326 @@
+from array import array
+from collections.abc import Iterable, Iterator
 from dataclasses import asdict
+from typing import Protocol
 
+from src.constants import HISTORY_MAX_BYTES
 from src.exceptions import EmptyBufferError
+from src.history import History
 from src.text import Text
 
 
+class RecordSource(Protocol):
+    def __len__(self) -> int: ...
+
+    def record(self, index: int) -> dict[str, str]: ...
+
+    def meta(self, index: int) -> tuple[str, str]: ...
+
+
+class MappedTexts:
+    def __init__(self, source: RecordSource) -> None:
+        self.source = source
+        self.changed: dict[int, Text] = {}
+        self.added: list[Text] = []
+
+    def __len__(self) -> int:
+        return len(self.source) + len(self.added)
+
+    def __getitem__(self, index: int) -> Text:
+        if index < 0:
+            index += len(self)
+        if index >= len(self.source):
+            return self.added[index - len(self.source)]
+
+        text_obj = self.changed.get(index)
+        if text_obj is None:
+            text_obj = Text(**self.source.record(index))
+        return text_obj
+
+    def __setitem__(self, index: int, text_obj: Text) -> None:
+        if index < 0:
+            index += len(self)
+        if index < 0:
+            raise IndexError("Invalid index")
+        if index >= len(self.source):
+            self.added[index - len(self.source)] = text_obj
+        else:
+            self.changed[index] = text_obj
+
+    def __iter__(self) -> Iterator[Text]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, MappedTexts)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def append(self, text_obj: Text) -> None:
+        self.added.append(text_obj)
+
+    def pop(self) -> Text:
+        return self.added.pop()
+
+
 class Buffer:
-    def __init__(self) -> None:
-        self.texts: list[Text] = []
+    texts: list[Text] | MappedTexts
 
-    def add(self, text_obj: Text) -> None:
+    def __init__(self, history_bytes: int = HISTORY_MAX_BYTES) -> None:
+        self._reset(())
+        self.history = History(max_bytes=history_bytes)
+        self.shrunk = False
+        self._clear_indexes()
+        self._dirty: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __iter__(self) -> Iterator[Text]:
+        return iter(self.texts)
+
+    def _append(self, text_obj: Text) -> None:
         self.texts.append(text_obj)
 
+    def _load(self, index: int) -> Text:
+        return self.texts[index]
+
+    def _store(self, index: int, text_obj: Text) -> None:
+        self.texts[index] = text_obj
+
+    def _pop(self) -> None:
+        self.texts.pop()
+
+    def _reset(self, texts: Iterable[Text]) -> None:
+        self.texts = list(texts)
+
+    def _clear_indexes(self) -> None:
+        self._by_status: dict[str, set[int]] = {}
+        self._by_rot_type: dict[str, set[int]] = {}
+
+    def _index(self, index: int, text_obj: Text) -> None:
+        self._index_values(index, text_obj.rot_type, text_obj.status)
+
+    def _index_values(self, index: int, rot_type: str, status: str) -> None:
+        self._by_status.setdefault(status, set()).add(index)
+        self._by_rot_type.setdefault(rot_type, set()).add(index)
+
+    def _unindex(self, index: int, text_obj: Text) -> None:
+        self._by_status[text_obj.status].discard(index)
+        self._by_rot_type[text_obj.rot_type].discard(index)
+
+    def add(self, text_obj: Text) -> None:
+        self.history.record(len(self), None, text_obj)
+        self._add(text_obj)
+
+    def _add(self, text_obj: Text) -> None:
+        self._append(text_obj)
+        self._index(len(self) - 1, text_obj)
+        self._dirty.add(len(self) - 1)
+
+    def _remove_last(self) -> None:
+        index = len(self) - 1
+        self._unindex(index, self._load(index))
+        self._pop()
+        self._dirty.discard(index)
+        self.shrunk = True
+
     def get(self, index: int) -> Text:
-        if index < 0 or index >= len(self.texts):
+        if index < 0 or index >= len(self):
             raise IndexError("Invalid index")
-        return self.texts[index]
+        return self._load(index)
 
     def update(self, index: int, text_obj: Text) -> None:
-        self.texts[index] = text_obj
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("Invalid index")
+        old = self._load(index)
+        self.history.record(index, old, text_obj)
+        self._replace(index, old, text_obj)
+
+    def _replace(self, index: int, old: Text, text_obj: Text) -> None:
+        self._store(index, text_obj)
+        self._unindex(index, old)
+        self._index(index, text_obj)
+        self._dirty.add(index)
+
+    def _apply(self, index: int, text_obj: Text | None) -> None:
+        if text_obj is None:
+            self._remove_last()
+        elif index == len(self):
+            self._add(text_obj)
+        else:
+            self._replace(index, self._load(index), text_obj)
+
+    def undo(self) -> list[int]:
+        changes = self.history.undo()
+        for index, before, _ in reversed(changes):
+            self._apply(index, before)
+        return sorted({index for index, _, _ in changes})
+
+    def redo(self) -> list[int]:
+        changes = self.history.redo()
+        for index, _, after in changes:
+            self._apply(index, after)
+        return sorted({index for index, _, _ in changes})
+
+    def indices_by_status(self, status: str) -> list[int]:
+        return sorted(self._by_status.get(status, ()))
+
+    def indices_by_rot_type(self, rot_type: str) -> list[int]:
+        return sorted(self._by_rot_type.get(rot_type, ()))
+
+    def find(self, status: str | None = None, rot_type: str | None = None) -> list[int]:
+        if rot_type is None:
+            return list(range(len(self))) if status is None else self.indices_by_status(status)
+        if status is None:
+            return self.indices_by_rot_type(rot_type)
+
+        by_status = self._by_status.get(status, set())
+        by_rot_type = self._by_rot_type.get(rot_type, set())
+        return sorted(by_status & by_rot_type)
 
     def all_strings(self) -> list[str]:
-        if self.texts:
-            return [
-                f"{i}. {t.text} - rot type: {t.rot_type}, {t.status}"
-                for i, t in enumerate(self.texts, start=1)
-            ]
+        if len(self):
+            return [self._format(i, t) for i, t in enumerate(self)]
         raise EmptyBufferError("Buffer is empty")
 
+    def page_count(self, page_size: int) -> int:
+        return -(-len(self) // page_size)
+
+    def page_strings(
+        self, page: int, page_size: int, preview_width: int | None = None
+    ) -> Iterator[str]:
+        if not len(self):
+            raise EmptyBufferError("Buffer is empty")
+
+        start = page * page_size
+        stop = min(start + page_size, len(self))
+        return (self._format(i, self._load(i), preview_width) for i in range(start, stop))
+
+    @staticmethod
+    def _format(index: int, text_obj: Text, preview_width: int | None = None) -> str:
+        text = text_obj.text
+        if preview_width is not None and len(text) > preview_width:
+            text = f"{text[: max(preview_width - 3, 0)]}..."
+        return f"{index + 1}. {text} - rot type: {text_obj.rot_type}, {text_obj.status}"
+
+    def iter_dicts(self) -> Iterator[dict]:
+        return (asdict(text_obj) for text_obj in self)
+
     def to_dict_list(self) -> list[dict]:
-        return [asdict(text_obj) for text_obj in self.texts]
+        return list(self.iter_dicts())
+
+    def from_dict_list(self, data: Iterable[dict[str, str]]) -> None:
+        self._reset(Text(**d) for d in data)
+        self._reindex()
+
+    def replay(self, records: Iterable[tuple[int, dict[str, str]]]) -> None:
+        texts: list[Text] = []
+        for index, record in records:
+            if index == len(texts):
+                texts.append(Text(**record))
+            elif 0 <= index < len(texts):
+                texts[index] = Text(**record)
+            else:
+                raise ValueError(f"Record {index} is out of order")
+
+        self._reset(texts)
+        self._reindex()
+
+    def from_source(self, source: RecordSource) -> None:
+        self.texts = MappedTexts(source)
+        self._clear_indexes()
+        self._dirty.clear()
+        self.history.clear()
+        self.shrunk = False
+        for index in range(len(source)):
+            self._index_values(index, *source.meta(index))
+
+    def _reindex(self) -> None:
+        self._clear_indexes()
+        self._dirty.clear()
+        self.history.clear()
+        self.shrunk = False
+        for index, text_obj in enumerate(self):
+            self._index(index, text_obj)
+
+    def dirty_records(self) -> list[tuple[int, dict]]:
+        return [(index, asdict(self._load(index))) for index in sorted(self._dirty)]
+
+    def mark_clean(self) -> None:
+        self._dirty.clear()
+        self.shrunk = False
+
+
+class ColumnarBuffer(Buffer):
+    def __init__(self, history_bytes: int = HISTORY_MAX_BYTES) -> None:
+        self.values: list[str] = []
+        self.codes: dict[str, int] = {}
+        super().__init__(history_bytes)
+
+    @property
+    def texts(self) -> list[Text]:  # type: ignore[override]
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.bodies)
+
+    def __iter__(self) -> Iterator[Text]:
+        values = self.values
+        for body, rot_type, status in zip(self.bodies, self.rot_type_codes, self.status_codes):
+            yield Text(text=body, rot_type=values[rot_type], status=values[status])
+
+    def _encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def _append(self, text_obj: Text) -> None:
+        self.bodies.append(text_obj.text)
+        self.rot_type_codes.append(self._encode(text_obj.rot_type))
+        self.status_codes.append(self._encode(text_obj.status))
+
+    def _load(self, index: int) -> Text:
+        return Text(
+            text=self.bodies[index],
+            rot_type=self.values[self.rot_type_codes[index]],
+            status=self.values[self.status_codes[index]],
+        )
+
+    def _store(self, index: int, text_obj: Text) -> None:
+        self.bodies[index] = text_obj.text
+        self.rot_type_codes[index] = self._encode(text_obj.rot_type)
+        self.status_codes[index] = self._encode(text_obj.status)
+
+    def _pop(self) -> None:
+        self.bodies.pop()
+        self.rot_type_codes.pop()
+        self.status_codes.pop()
+
+    def _reset(self, texts: Iterable[Text]) -> None:
+        bodies: list[str] = []
+        rot_type_codes = array("H")
+        status_codes = array("H")
+        for text_obj in texts:
+            bodies.append(text_obj.text)
+            rot_type_codes.append(self._encode(text_obj.rot_type))
+            status_codes.append(self._encode(text_obj.status))
+
+        self.bodies = bodies
+        self.rot_type_codes = rot_type_codes
+        self.status_codes = status_codes
+
+    def from_source(self, source: RecordSource) -> None:
+        self._reset(Text(**source.record(index)) for index in range(len(source)))
+        self._reindex()
 
-    def from_dict_list(self, data: list[dict[str, str]]) -> None:
-        self.texts = [Text(**d) for d in data]
+    def iter_dicts(self) -> Iterator[dict]:
+        values = self.values
+        return (
+            {"text": body, "rot_type": values[rot_type], "status": values[status]}
+            for body, rot_type, status in zip(self.bodies, self.rot_type_codes, self.status_codes)
+        )
@@ -0,0 +1,59 @@
+import sys
+from collections import OrderedDict
+
+from src.constants import CACHE_MAX_BYTES, CACHE_MAX_ENTRIES
+
+CacheKey = tuple[str, str, str]
+
+
+class ResultCache:
+    def __init__(
+        self, max_entries: int = CACHE_MAX_ENTRIES, max_bytes: int = CACHE_MAX_BYTES
+    ) -> None:
+        if max_entries < 0 or max_bytes < 0:
+            raise ValueError("Cache limits must not be negative")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[CacheKey, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _size(key: CacheKey, value: str) -> int:
+        return sys.getsizeof(key[2]) + sys.getsizeof(value)
+
+    def get(self, key: CacheKey) -> str | None:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: CacheKey, value: str) -> None:
+        size = self._size(key, value)
+        if self.max_entries == 0 or size > self.max_bytes:
+            return
+
+        old_value = self._entries.pop(key, None)
+        if old_value is not None:
+            self.size_bytes -= self._size(key, old_value)
+
+        self._entries[key] = value
+        self.size_bytes += size
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            old_key, old_value = self._entries.popitem(last=False)
+            self.size_bytes -= self._size(old_key, old_value)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size_bytes = 0
@@ -1,9 +1,71 @@
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from functools import lru_cache, reduce
+from string import ascii_lowercase, ascii_uppercase, digits
+from typing import TYPE_CHECKING, TypeVar
 
-from src.constants import ROT13, ROT47
+from src.constants import (
+    ALPHABET_DIGITS,
+    ALPHABET_LETTERS,
+    ALPHABET_PRINTABLE,
+    BYTES_CHUNK_SIZE,
+    CAESAR,
+    CAESAR_TABLE_CACHE_SIZE,
+    CHAIN_SEPARATOR,
+    CIPHER_ENTRY_POINT_GROUP,
+    NUMPY_THRESHOLD,
+    ROT5,
+    ROT13,
+    ROT18,
+    ROT47,
+    ROT8000,
+)
 from src.exceptions import UnsupportedCipherError
 from src.text import Text
 
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+BytesLike = bytes | bytearray | memoryview
+CipherFactory = Callable[[], "Cipher"]
+F = TypeVar("F", bound=CipherFactory)
+
+ALPHABETS: dict[str, tuple[str, ...]] = {
+    ALPHABET_LETTERS: (ascii_lowercase, ascii_uppercase),
+    ALPHABET_DIGITS: (digits,),
+    ALPHABET_PRINTABLE: ("".join(chr(code) for code in range(33, 127)),),
+}
+
+BMP_SIZE = 0x10000
+ROT8000_HIDDEN_BLOCKS = (
+    (0x0000, 0x0020),
+    (0x007F, 0x00A0),
+    (0x00AD, 0x00AD),
+    (0x1680, 0x1680),
+    (0x2000, 0x200F),
+    (0x2028, 0x202F),
+    (0x205F, 0x206F),
+    (0x3000, 0x3000),
+    (0xD800, 0xF8FF),
+    (0xFEFF, 0xFEFF),
+    (0xFFF0, 0xFFFF),
+)
+
+
+def _rotate(alphabet: str, shift: int) -> str:
+    shift %= len(alphabet)
+    return alphabet[shift:] + alphabet[:shift]
+
+
+@lru_cache(maxsize=CAESAR_TABLE_CACHE_SIZE)
+def compile_tables(alphabet: str, shift: int) -> tuple[dict[int, int], bytes]:
+    groups = ALPHABETS[alphabet]
+    source = "".join(groups)
+    target = "".join(_rotate(group, shift) for group in groups)
+
+    return str.maketrans(source, target), bytes.maketrans(source.encode(), target.encode())
+
 
 class Cipher(ABC):
     @abstractmethod
@@ -15,41 +77,280 @@ class Cipher(ABC):
 
         return Text(text=transformed, rot_type=rot_type, status=status)
 
+    def cipher_bytes(self, data: BytesLike) -> BytesLike:
+        raise UnsupportedCipherError(f"{type(self).__name__} does not support byte input")
+
+    def inverse(self) -> "Cipher":
+        return self
+
+
+class TableCipher(Cipher):
+    table: dict[int, int] = {}
+    byte_table: bytes = bytes(range(256))
 
-class CipherRot13(Cipher):
     def cipher(self, text_obj: Text) -> str:
-        new_text = ""
+        return text_obj.text.translate(self.table)
+
+    def cipher_bytes(self, data: BytesLike) -> BytesLike:
+        if isinstance(data, bytes):
+            return data.translate(self.byte_table)
+
+        view = memoryview(data).cast("B")
+        if view.readonly:
+            return view.tobytes().translate(self.byte_table)
+
+        for start in range(0, len(view), BYTES_CHUNK_SIZE):
+            chunk = view[start : start + BYTES_CHUNK_SIZE]
+            chunk[:] = chunk.tobytes().translate(self.byte_table)
+
+        return data
+
+
+_factories: dict[str, CipherFactory] = {}
+_instances: dict[str, Cipher] = {}
+_large_instances: dict[str, Cipher] = {}
+_entry_points_loaded = False
+
+
+def register_cipher(name: str) -> Callable[[F], F]:
+    def decorator(factory: F) -> F:
+        _factories[name] = factory
+        _instances.pop(name, None)
+        _large_instances.pop(name, None)
+        return factory
+
+    return decorator
+
+
+def _entry_point_factory(entry_point: "EntryPoint") -> CipherFactory:
+    def factory() -> "Cipher":
+        cipher: Cipher = entry_point.load()()
+        return cipher
+
+    return factory
+
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=CIPHER_ENTRY_POINT_GROUP):
+        if entry_point.name not in _factories:
+            _factories[entry_point.name] = _entry_point_factory(entry_point)
+
+
+@register_cipher(ROT13)
+class CipherRot13(TableCipher):
+    table, byte_table = compile_tables(ALPHABET_LETTERS, 13)
+
+
+@register_cipher(ROT47)
+class CipherRot47(TableCipher):
+    table, byte_table = compile_tables(ALPHABET_PRINTABLE, 47)
+
+
+@register_cipher(ROT5)
+class CipherRot5(TableCipher):
+    table, byte_table = compile_tables(ALPHABET_DIGITS, 5)
+
+
+@register_cipher(ROT18)
+class CipherRot18(TableCipher):
+    table = {**CipherRot13.table, **CipherRot5.table}
+    byte_table = CipherRot13.byte_table.translate(CipherRot5.byte_table)
+
+
+class RangeTable:
+    def __init__(self, hidden_blocks: tuple[tuple[int, int], ...], size: int = BMP_SIZE) -> None:
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.offsets: list[int] = []
+        count = start = 0
+        for hidden_start, hidden_end in (*sorted(hidden_blocks), (size, size)):
+            if start < hidden_start:
+                self.starts.append(start)
+                self.ends.append(hidden_start - 1)
+                self.offsets.append(count)
+                count += hidden_start - start
+            start = max(start, hidden_end + 1)
+        self.count = count
+
+    def position(self, code: int) -> int | None:
+        block = bisect_right(self.starts, code) - 1
+        if block < 0 or code > self.ends[block]:
+            return None
+        return self.offsets[block] + code - self.starts[block]
 
-        for char in text_obj.text:
-            if "a" <= char <= "z":
-                new_text += chr((ord(char) - ord("a") + 13) % 26 + ord("a"))
-            elif "A" <= char <= "Z":
-                new_text += chr((ord(char) - ord("A") + 13) % 26 + ord("A"))
-            else:
-                new_text += char
+    def code(self, position: int) -> int:
+        block = bisect_right(self.offsets, position) - 1
+        return self.starts[block] + position - self.offsets[block]
 
-        return new_text
 
+class RotationTable(dict[int, int]):
+    def __init__(self, ranges: RangeTable, shift: int) -> None:
+        super().__init__()
+        self.ranges = ranges
+        self.shift = shift % ranges.count
+
+    def __missing__(self, code: int) -> int:
+        position = self.ranges.position(code)
+        target = (
+            code
+            if position is None
+            else self.ranges.code((position + self.shift) % self.ranges.count)
+        )
+        self[code] = target
+        return target
+
+    def __reduce__(self) -> tuple:
+        return type(self), (self.ranges, self.shift)
+
+
+class RangeCipher(Cipher):
+    def __init__(self, ranges: RangeTable, shift: int) -> None:
+        self.ranges = ranges
+        self.table = RotationTable(ranges, shift)
+
+    def cipher(self, text_obj: Text) -> str:
+        return text_obj.text.translate(self.table)
+
+    def inverse(self) -> "RangeCipher":
+        if 2 * self.table.shift % self.ranges.count == 0:
+            return self
+        return RangeCipher(ranges=self.ranges, shift=-self.table.shift)
+
+
+ROT8000_RANGES = RangeTable(ROT8000_HIDDEN_BLOCKS)
+
+
+@register_cipher(ROT8000)
+class CipherRot8000(RangeCipher):
+    def __init__(self) -> None:
+        super().__init__(ranges=ROT8000_RANGES, shift=ROT8000_RANGES.count // 2)
+
+
+class CipherCaesar(TableCipher):
+    def __init__(self, shift: int, alphabet: str = ALPHABET_LETTERS) -> None:
+        if alphabet not in ALPHABETS:
+            raise UnsupportedCipherError(f"Unsupported alphabet: {alphabet}")
+
+        self.alphabet = alphabet
+        self.shift = shift % len(ALPHABETS[alphabet][0])
+        self.table, self.byte_table = compile_tables(alphabet, self.shift)
+
+    def inverse(self) -> "CipherCaesar":
+        return CipherCaesar(shift=-self.shift, alphabet=self.alphabet)
+
+
+def fuse_tables(tables: Sequence[dict[int, int]]) -> dict[int, int]:
+    fused = {}
+    for code in set().union(*tables):
+        target = code
+        for table in tables:
+            target = table.get(target, target)
+        if target != code:
+            fused[code] = target
+    return fused
+
+
+class FusedCipher(TableCipher):
+    def __init__(self, parts: Sequence[TableCipher]) -> None:
+        self.parts = tuple(parts)
+        self.table = fuse_tables([part.table for part in self.parts])
+        self.byte_table = reduce(bytes.translate, (part.byte_table for part in self.parts))
+        self._inverse: Cipher | None = None
+
+    def inverse(self) -> Cipher:
+        if self._inverse is None:
+            inverse = compose([part.inverse() for part in reversed(self.parts)])
+            same = isinstance(inverse, TableCipher) and inverse.table == self.table
+            self._inverse = self if same else inverse
+        return self._inverse
+
+
+class CompositeCipher(Cipher):
+    def __init__(self, steps: Sequence[Cipher]) -> None:
+        self.steps = tuple(steps)
+        self._inverse: Cipher | None = None
 
-class CipherRot47(Cipher):
     def cipher(self, text_obj: Text) -> str:
-        new_text = ""
-
-        for char in text_obj.text:
-            ascii_code = ord(char)
-            if 33 <= ascii_code <= 126:
-                new_char = chr(33 + ((ascii_code - 33 + 47) % 94))
-                new_text += new_char
-            else:
-                new_text += char
-
-        return new_text
-
-
-def cipher_factory(rot_type: str) -> Cipher:
-    if rot_type == ROT13:
-        return CipherRot13()
-    elif rot_type == ROT47:
-        return CipherRot47()
-    else:
-        raise UnsupportedCipherError(f"Unsupported rot type: {rot_type}")
+        text = text_obj.text
+        for step in self.steps:
+            text = step.cipher(Text(text=text, rot_type="", status=""))
+        return text
+
+    def cipher_bytes(self, data: BytesLike) -> BytesLike:
+        for step in self.steps:
+            data = step.cipher_bytes(data)
+        return data
+
+    def inverse(self) -> Cipher:
+        if self._inverse is None:
+            self._inverse = compose([step.inverse() for step in reversed(self.steps)])
+        return self._inverse
+
+
+def compose(parts: Sequence[Cipher]) -> Cipher:
+    steps: list[Cipher] = []
+    tables: list[TableCipher] = []
+    for part in (*parts, None):
+        if isinstance(part, TableCipher):
+            tables.append(part)
+            continue
+        if tables:
+            steps.append(tables[0] if len(tables) == 1 else FusedCipher(tables))
+            tables = []
+        if part is not None:
+            steps.append(part)
+
+    if not steps:
+        raise UnsupportedCipherError("Cipher chain is empty")
+    return steps[0] if len(steps) == 1 else CompositeCipher(steps)
+
+
+@lru_cache(maxsize=CAESAR_TABLE_CACHE_SIZE)
+def _parameterized_cipher(rot_type: str) -> Cipher:
+    if CHAIN_SEPARATOR in rot_type:
+        return compose([cipher_factory(part) for part in rot_type.split(CHAIN_SEPARATOR)])
+    if rot_type.startswith(f"{CAESAR}:"):
+        _, _, params = rot_type.partition(":")
+        shift, _, alphabet = params.partition(":")
+        try:
+            return CipherCaesar(shift=int(shift), alphabet=alphabet or ALPHABET_LETTERS)
+        except ValueError:
+            pass
+    elif rot_type.startswith("rot") and rot_type[3:].isdigit() and 0 < int(rot_type[3:]) < 26:
+        return CipherCaesar(shift=int(rot_type[3:]))
+
+    raise UnsupportedCipherError(f"Unsupported rot type: {rot_type}")
+
+
+def _resolve_cipher(rot_type: str) -> Cipher:
+    if rot_type not in _factories:
+        _load_entry_points()
+
+    factory = _factories.get(rot_type)
+    if factory is None:
+        return _parameterized_cipher(rot_type)
+
+    cipher = _instances[rot_type] = factory()
+    return cipher
+
+
+def cipher_factory(rot_type: str, size: int = 0) -> Cipher:
+    if size >= NUMPY_THRESHOLD:
+        cipher = _large_instances.get(rot_type)
+        if cipher is None:
+            from src.cipher_numpy import numpy_cipher
+
+            cipher = _large_instances[rot_type] = numpy_cipher(cipher_factory(rot_type))
+        return cipher
+
+    cipher = _instances.get(rot_type)
+    if cipher is None:
+        cipher = _resolve_cipher(rot_type)
+    return cipher
@@ -0,0 +1,44 @@
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None  # type: ignore[assignment]
+
+from src.cipher import BytesLike, Cipher, TableCipher
+from src.text import Text
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+class NumpyCipher(Cipher):
+    def __init__(self, inner: TableCipher) -> None:
+        if np is None:
+            raise ImportError("NumpyCipher requires numpy")
+
+        self.inner = inner
+        self.lut = np.frombuffer(inner.byte_table, dtype=np.uint8)
+
+    def cipher(self, text_obj: Text) -> str:
+        text = text_obj.text
+        if text.isascii():
+            return self.inner.cipher(text_obj)
+
+        try:
+            encoded = text.encode("utf-8")
+        except UnicodeEncodeError:
+            return self.inner.cipher(text_obj)
+
+        return self.lut[np.frombuffer(encoded, dtype=np.uint8)].tobytes().decode("utf-8")
+
+    def cipher_bytes(self, data: BytesLike) -> BytesLike:
+        return self.inner.cipher_bytes(data)
+
+    def inverse(self) -> Cipher:
+        return numpy_cipher(self.inner.inverse())
+
+
+def numpy_cipher(cipher: Cipher) -> Cipher:
+    if np is None or not isinstance(cipher, TableCipher):
+        return cipher
+    return NumpyCipher(cipher)
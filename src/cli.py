@@ -0,0 +1,328 @@
+import argparse
+import io
+import os
+import sys
+from typing import TYPE_CHECKING, cast
+
+from src.constants import (
+    ANALYSIS_SAMPLE_SIZE,
+    BENCHMARK_PAYLOADS,
+    BENCHMARK_SIZES,
+    COMPRESSION_LEVEL,
+    MMAP_WINDOW_SIZE,
+    ROT13,
+    ROT47,
+    SERVICE_BATCH_DELAY,
+    SERVICE_BATCH_SIZE,
+    SERVICE_HOST,
+    SERVICE_MAX_PENDING,
+    SERVICE_PORT,
+    STREAM_CHUNK_SIZE,
+)
+from src.exceptions import UnsupportedCipherError
+
+if TYPE_CHECKING:
+    from src.cipher import Cipher
+    from src.manager import Manager
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="ROT cipher command line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, action in (("encrypt", "encrypt"), ("decrypt", "decrypt")):
+        pipe = commands.add_parser(name, help=f"{action} stdin to stdout")
+        pipe.add_argument("--rot", default=ROT13, help=f"rot type ({ROT13}, {ROT47}, caesar:N)")
+        pipe.add_argument("--chunk-size", type=int, default=STREAM_CHUNK_SIZE)
+
+    detect = commands.add_parser("detect", help="guess the rot type of text read from stdin")
+    detect.add_argument("--top", type=int, default=1, help="number of candidates to print")
+
+    convert = commands.add_parser("convert", help="convert a saved buffer between file formats")
+    convert.add_argument("input", help="buffer file to read (.json, .jsonl, .bin, compressed)")
+    convert.add_argument("output", help="buffer file to write, format taken from the extension")
+
+    stream = commands.add_parser("stream", help="cipher a file into another file in chunks")
+    stream.add_argument("input", help="path of the file to read")
+    stream.add_argument("output", help="path of the file to write")
+    stream.add_argument("--rot", default=ROT13, help=f"rot type ({ROT13}, {ROT47})")
+    stream.add_argument("--chunk-size", type=int, default=STREAM_CHUNK_SIZE)
+    stream.add_argument("--workers", type=int, default=1, help="worker processes")
+
+    in_place = commands.add_parser("inplace", help="cipher a file in place through mmap")
+    in_place.add_argument("file", help="path of the file to rewrite")
+    in_place.add_argument("--rot", default=ROT13, help=f"rot type ({ROT13}, {ROT47})")
+    in_place.add_argument("--window-size", type=int, default=MMAP_WINDOW_SIZE)
+
+    bench = commands.add_parser("bench", help="measure cipher throughput")
+    bench.add_argument("--sizes", type=int, nargs="+", default=list(BENCHMARK_SIZES))
+    bench.add_argument(
+        "--payloads",
+        nargs="+",
+        choices=list(BENCHMARK_PAYLOADS),
+        default=list(BENCHMARK_PAYLOADS),
+    )
+    bench.add_argument("--engines", nargs="+", help="engine names to run (default: all)")
+    bench.add_argument("--min-time", type=float, default=0.2, help="seconds per measurement")
+    bench.add_argument("--repeat", type=int, default=3)
+    bench.add_argument("--output", help="write results as JSON to this file")
+    bench.add_argument("--compare", help="baseline JSON results to check for regressions")
+    bench.add_argument("--tolerance", type=float, default=0.1, help="allowed slowdown (0.1 = 10%%)")
+    bench.add_argument(
+        "--memory", type=int, metavar="ENTRIES", help="report buffer memory use instead"
+    )
+    bench.add_argument(
+        "--compression",
+        type=int,
+        metavar="ENTRIES",
+        help="report saved buffer size and speed for each codec instead",
+    )
+    bench.add_argument("--level", type=int, default=COMPRESSION_LEVEL, help="compression level")
+
+    service = commands.add_parser("serve", help="run the local cipher service")
+    service.add_argument("--host", default=SERVICE_HOST)
+    service.add_argument("--port", type=int, default=SERVICE_PORT)
+    service.add_argument("--batch-size", type=int, default=SERVICE_BATCH_SIZE)
+    service.add_argument("--batch-delay", type=float, default=SERVICE_BATCH_DELAY, help="seconds")
+    service.add_argument("--max-pending", type=int, default=SERVICE_MAX_PENDING)
+
+    load = commands.add_parser("loadgen", help="send encrypt requests to a running service")
+    load.add_argument("--host", default=SERVICE_HOST)
+    load.add_argument("--port", type=int, default=SERVICE_PORT)
+    load.add_argument("--requests", type=int, default=10_000)
+    load.add_argument("--connections", type=int, default=8)
+    load.add_argument("--pipeline", type=int, default=16, help="requests in flight per connection")
+    load.add_argument("--payload-size", type=int, default=64)
+    load.add_argument("--rot", default=ROT13, help=f"rot type ({ROT13}, {ROT47})")
+
+    return parser
+
+
+def create_manager(workers: int = 1) -> "Manager":
+    from src.buffer import Buffer
+    from src.file_handler import FileHandler
+    from src.manager import Manager
+
+    return Manager(buffer=Buffer(), file_handler=FileHandler(), workers=workers)
+
+
+def _pipe_text(
+    cipher: "Cipher", stdin: io.BufferedIOBase, stdout: io.BufferedIOBase, chunk_size: int
+) -> None:
+    import codecs
+
+    from src.text import Text
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    while True:
+        chunk = stdin.read1(chunk_size)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            stdout.write(cipher.cipher(Text(text=text, rot_type="", status="")).encode("utf-8"))
+        if not chunk:
+            return
+
+
+def run_pipe(args: argparse.Namespace) -> int:
+    from src.cipher import cipher_factory
+
+    if args.chunk_size <= 0:
+        raise ValueError(f"Chunk size must be positive, got {args.chunk_size}")
+
+    cipher = cipher_factory(rot_type=args.rot)
+    if args.command == "decrypt":
+        cipher = cipher.inverse()
+
+    stdin = cast(io.BufferedIOBase, sys.stdin.buffer)
+    stdout = cast(io.BufferedIOBase, sys.stdout.buffer)
+    try:
+        try:
+            cipher.cipher_bytes(b"")
+        except UnsupportedCipherError:
+            _pipe_text(cipher, stdin, stdout, args.chunk_size)
+        else:
+            while chunk := stdin.read1(args.chunk_size):
+                stdout.write(cipher.cipher_bytes(chunk))
+        stdout.flush()
+    except BrokenPipeError:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, stdout.fileno())
+        return 1
+
+    return 0
+
+
+def run_detect(args: argparse.Namespace) -> int:
+    from src.analysis import rank_ciphers
+
+    text = sys.stdin.buffer.read(ANALYSIS_SAMPLE_SIZE).decode("utf-8", errors="replace")
+    ranking = rank_ciphers(text)
+    if not ranking:
+        raise ValueError("No printable ASCII text to analyse")
+
+    for rot_type, score in ranking[: args.top]:
+        print(f"{rot_type:<12} {score:>8.3f}")
+    return 0
+
+
+def run_convert(args: argparse.Namespace) -> int:
+    manager = create_manager()
+    try:
+        manager.load_from_path(args.input)
+        manager.save_to_path(args.output)
+    finally:
+        manager.close()
+    print(f"{len(manager.buffer)} entries written to {args.output}", file=sys.stderr)
+    return 0
+
+
+def run_stream(args: argparse.Namespace) -> int:
+    manager = create_manager(workers=args.workers)
+    try:
+        written = manager.stream_cipher(
+            input_path=args.input,
+            output_path=args.output,
+            rot_type=args.rot,
+            chunk_size=args.chunk_size,
+        )
+    finally:
+        manager.close()
+    print(f"{written} bytes written to {args.output}", file=sys.stderr)
+    return 0
+
+
+def run_in_place(args: argparse.Namespace) -> int:
+    manager = create_manager()
+    processed = manager.cipher_file_in_place(
+        filename=args.file, rot_type=args.rot, window_size=args.window_size
+    )
+    print(f"{processed} bytes processed in {args.file}", file=sys.stderr)
+    return 0
+
+
+def run_bench(args: argparse.Namespace) -> int:
+    from src.benchmark import (
+        compare_results,
+        compression_report,
+        default_engines,
+        load_results,
+        memory_report,
+        run_benchmarks,
+        save_results,
+    )
+
+    if args.memory:
+        report = memory_report(args.memory)
+        baseline = report["list[dataclass]"]
+        for layout, size in report.items():
+            saving = (1 - size / baseline) * 100
+            print(f"{layout:<16} {size / 1_000_000:>10.1f} MB {saving:>6.1f}% saved")
+        return 0
+
+    if args.compression:
+        for row in compression_report(args.compression, level=args.level):
+            print(
+                f"{row.codec:<6} level {row.level} {row.size / 1_000_000:>9.2f} MB "
+                f"x{row.ratio:>5.1f} save {row.save_seconds:>7.3f} s "
+                f"load {row.load_seconds:>7.3f} s"
+            )
+        return 0
+
+    engines = default_engines()
+    if args.engines:
+        unknown = set(args.engines) - set(engines)
+        if unknown:
+            raise ValueError(f"Unknown engines: {', '.join(sorted(unknown))}")
+        engines = {name: engines[name] for name in args.engines}
+
+    results = run_benchmarks(
+        engines,
+        payloads=args.payloads,
+        sizes=args.sizes,
+        min_time=args.min_time,
+        repeat=args.repeat,
+    )
+    for result in results:
+        print(
+            f"{result.engine:<12} {result.payload:<10} {result.size:>11} B "
+            f"{result.chars_per_sec:>14,.0f} chars/s {result.mb_per_sec:>10.1f} MB/s"
+        )
+
+    if args.output:
+        save_results(args.output, results)
+
+    if args.compare:
+        regressions = compare_results(results, load_results(args.compare), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    import asyncio
+
+    from src.service import CipherService, serve
+
+    manager = create_manager()
+    service = CipherService(
+        manager,
+        batch_size=args.batch_size,
+        batch_delay=args.batch_delay,
+        max_pending=args.max_pending,
+    )
+    print(f"Serving on {args.host}:{args.port}", file=sys.stderr)
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        manager.close()
+    return 0
+
+
+def run_loadgen(args: argparse.Namespace) -> int:
+    import asyncio
+
+    from src.loadgen import run_load
+
+    report = asyncio.run(
+        run_load(
+            host=args.host,
+            port=args.port,
+            requests=args.requests,
+            connections=args.connections,
+            pipeline=args.pipeline,
+            payload_size=args.payload_size,
+            rot_type=args.rot,
+        )
+    )
+    print(
+        f"{report.requests} requests in {report.seconds:.2f} s "
+        f"({report.requests_per_sec:,.0f} req/s), {report.errors} errors, "
+        f"p50 {report.p50_ms:.2f} ms, p99 {report.p99_ms:.2f} ms"
+    )
+    return 1 if report.errors else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    commands = {
+        "encrypt": run_pipe,
+        "decrypt": run_pipe,
+        "detect": run_detect,
+        "convert": run_convert,
+        "stream": run_stream,
+        "inplace": run_in_place,
+        "bench": run_bench,
+        "serve": run_serve,
+        "loadgen": run_loadgen,
+    }
+
+    try:
+        return commands[args.command](args)
+    except (OSError, ValueError, UnsupportedCipherError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
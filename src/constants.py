@@ -1,5 +1,73 @@
 STATUS_DECRYPTED = "decrypted"
 STATUS_ENCRYPTED = "encrypted"
 
+ROT5 = "rot5"
 ROT13 = "rot13"
+ROT18 = "rot18"
 ROT47 = "rot47"
+ROT8000 = "rot8000"
+
+BYTES_CHUNK_SIZE = 64 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+MMAP_WINDOW_SIZE = 16 * 1024 * 1024
+
+PARALLEL_THRESHOLD = 8 * 1024 * 1024
+PARALLEL_CHUNK_SIZE = 4 * 1024 * 1024
+
+NUMPY_THRESHOLD = 1024 * 1024
+
+CAESAR = "caesar"
+CHAIN_SEPARATOR = "+"
+ALPHABET_LETTERS = "letters"
+ALPHABET_DIGITS = "digits"
+ALPHABET_PRINTABLE = "printable"
+CAESAR_TABLE_CACHE_SIZE = 256
+
+CIPHER_ENTRY_POINT_GROUP = "caesar_cipher.ciphers"
+
+BENCHMARK_SIZES = (10, 1_000, 100_000, 10_000_000, 100_000_000)
+BENCHMARK_PAYLOADS = {
+    "ascii": "The quick brown fox jumps over the lazy dog 0123456789 ~!@#$%^&*()\n",
+    "mixed": "Zażółć gęślą jaźń, the quick brown fox 123 ~>@ Ünïcödé text\n",
+    "non_ascii": "Съешь же ещё этих мягких французских булок 東京 🙂 ąęść\n",
+}
+
+PAGE_SIZE = 20
+PREVIEW_WIDTH = 60
+
+DATA_DIR = "data"
+JSON_EXTENSION = ".json"
+JOURNAL_EXTENSION = ".jsonl"
+JOURNAL_COMPACT_RATIO = 2
+BINARY_EXTENSION = ".bin"
+
+GZIP_EXTENSION = ".gz"
+BZ2_EXTENSION = ".bz2"
+XZ_EXTENSION = ".xz"
+ZLIB_EXTENSION = ".zz"
+COMPRESSION_LEVEL = 6
+
+FSYNC_NEVER = "never"
+FSYNC_ALWAYS = "always"
+FSYNC_ON_CLOSE = "on-close"
+FSYNC_DEFERRED = "deferred"
+FSYNC_POLICIES = (FSYNC_NEVER, FSYNC_ALWAYS, FSYNC_ON_CLOSE, FSYNC_DEFERRED)
+
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+SERVICE_BATCH_SIZE = 256
+SERVICE_BATCH_DELAY = 0.0
+SERVICE_MAX_PENDING = 1024
+SERVICE_PIPELINE_DEPTH = 64
+SERVICE_OFFLOAD_THRESHOLD = 64 * 1024
+SERVICE_LINE_LIMIT = 64 * 1024 * 1024
+SERVICE_SHUTDOWN_TIMEOUT = 5.0
+
+CACHE_MAX_ENTRIES = 4096
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+HISTORY_MAX_BYTES = 64 * 1024 * 1024
+HISTORY_CHANGE_OVERHEAD = 128
+
+ANALYSIS_SAMPLE_SIZE = 64 * 1024
+ANALYSIS_REFINE = 3
@@ -1,14 +1,447 @@
+import bz2
+import gzip
+import io
 import json
-from typing import Any
+import lzma
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager, suppress
+from typing import IO, Any, cast
+
+from src.constants import (
+    BZ2_EXTENSION,
+    COMPRESSION_LEVEL,
+    FSYNC_ALWAYS,
+    FSYNC_DEFERRED,
+    FSYNC_ON_CLOSE,
+    FSYNC_POLICIES,
+    GZIP_EXTENSION,
+    MMAP_WINDOW_SIZE,
+    STREAM_CHUNK_SIZE,
+    XZ_EXTENSION,
+    ZLIB_EXTENSION,
+)
+
+_BINARY_MAGIC = b"ROTB"
+_BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct("<4sB3xQQQ")
+_BINARY_RECORD = struct.Struct("<BBI")
+_BINARY_OFFSET = struct.Struct("<Q")
+_BINARY_LENGTH = struct.Struct("<H")
+
+_WHITESPACE = " \t\n\r"
+_ARRAY_START, _ARRAY_FIRST, _ARRAY_VALUE, _ARRAY_SEPARATOR, _ARRAY_END = range(5)
+
+
+def _read_more(read_file: IO[str], buffer: str, pos: int, chunk_size: int) -> tuple[str, int, bool]:
+    chunk = read_file.read(chunk_size)
+    return buffer[pos:] + chunk, 0, not chunk
+
+
+class _ZlibIO(io.RawIOBase):
+    def __init__(self, filename: str, mode: str, level: int) -> None:
+        self._file = open(filename, mode)
+        self._writing = mode != "rb"
+        self._compressor = zlib.compressobj(level)
+        self._decompressor = zlib.decompressobj()
+        self._in_stream = False
+
+    def readable(self) -> bool:
+        return not self._writing
+
+    def writable(self) -> bool:
+        return self._writing
+
+    def readinto(self, b: Any) -> int:
+        while True:
+            if self._decompressor.eof:
+                data = self._decompressor.unused_data
+                self._decompressor = zlib.decompressobj()
+                self._in_stream = False
+            else:
+                data = self._decompressor.unconsumed_tail
+
+            data = data or self._file.read(STREAM_CHUNK_SIZE)
+            if not data:
+                if self._in_stream:
+                    raise EOFError("Compressed file ended before the end-of-stream marker")
+                return 0
+
+            self._in_stream = True
+            decompressed = self._decompressor.decompress(data, len(b))
+            if decompressed:
+                b[: len(decompressed)] = decompressed
+                return len(decompressed)
+
+    def write(self, b: Any) -> int:
+        self._file.write(self._compressor.compress(b))
+        return len(b)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._writing:
+                self._file.write(self._compressor.flush())
+        finally:
+            self._file.close()
+            super().close()
+
+
+def _open_zlib(filename: str, mode: str, level: int) -> IO[Any]:
+    raw = _ZlibIO(filename, f"{mode[0]}b", level)
+    buffered = io.BufferedReader(raw) if mode[0] == "r" else io.BufferedWriter(raw)
+    return buffered if "b" in mode else io.TextIOWrapper(buffered)
+
+
+def _open_gzip(filename: str, mode: str, level: int) -> IO[Any]:
+    return cast(IO[Any], gzip.open(filename, mode, compresslevel=level))
+
+
+def _open_bz2(filename: str, mode: str, level: int) -> IO[Any]:
+    return bz2.open(filename, mode, compresslevel=max(level, 1))
+
+
+def _open_lzma(filename: str, mode: str, level: int) -> IO[Any]:
+    return lzma.open(filename, mode, preset=None if mode[0] == "r" else level)
+
+
+_CODECS: dict[str, Callable[[str, str, int], IO[Any]]] = {
+    GZIP_EXTENSION: _open_gzip,
+    BZ2_EXTENSION: _open_bz2,
+    XZ_EXTENSION: _open_lzma,
+    ZLIB_EXTENSION: _open_zlib,
+}
+CODEC_ERRORS = (EOFError, OSError, lzma.LZMAError, zlib.error)
+
+
+def _fsync_path(path: str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_dir(filename: str) -> None:
+    if os.name != "nt":
+        _fsync_path(os.path.dirname(filename) or ".")
+
+
+def compression_suffix(filename: str) -> str:
+    suffix = os.path.splitext(filename)[1]
+    return suffix if suffix in _CODECS else ""
+
+
+class JournalReader:
+    def __init__(self, filename: str, open_file: Callable[[str, str], IO[Any]] = open) -> None:
+        self.filename = filename
+        self.lines = 0
+        self.torn = False
+        self._open_file = open_file
+
+    def __iter__(self) -> Iterator[tuple[int, dict]]:
+        with self._open_file(self.filename, "r") as journal_file:
+            try:
+                for line in journal_file:
+                    if not line.endswith("\n"):
+                        self.torn = True
+                        return
+
+                    record = json.loads(line)
+                    self.lines += 1
+                    yield record.pop("index"), record
+            except EOFError:
+                self.torn = True
+
+
+class BinaryBufferFile:
+    _count: int
+    _index_offset: int
+
+    def __init__(self, filename: str) -> None:
+        with open(filename, "rb") as read_file:
+            if os.fstat(read_file.fileno()).st_size < _BINARY_HEADER.size:
+                raise ValueError(f"{filename} is not a binary buffer file")
+            self._map = mmap.mmap(read_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._read_header(filename)
+        except (struct.error, ValueError):
+            self._map.close()
+            raise ValueError(f"{filename} is not a valid binary buffer file") from None
+
+    def _read_header(self, filename: str) -> None:
+        magic, version, self._count, self._index_offset, values_offset = _BINARY_HEADER.unpack_from(
+            self._map, 0
+        )
+        if magic != _BINARY_MAGIC or version != _BINARY_VERSION:
+            raise ValueError(f"{filename} is not a binary buffer file")
+        if self._index_offset + self._count * _BINARY_OFFSET.size > values_offset:
+            raise ValueError(f"{filename} has a truncated offset index")
+
+        (value_count,) = _BINARY_LENGTH.unpack_from(self._map, values_offset)
+        pos = values_offset + _BINARY_LENGTH.size
+        self._values: list[str] = []
+        for _ in range(value_count):
+            (length,) = _BINARY_LENGTH.unpack_from(self._map, pos)
+            pos += _BINARY_LENGTH.size
+            self._values.append(self._map[pos : pos + length].decode("utf-8"))
+            pos += length
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _offset(self, index: int) -> int:
+        if index < 0 or index >= self._count:
+            raise IndexError("Invalid index")
+        position = self._index_offset + index * _BINARY_OFFSET.size
+        offset: int = _BINARY_OFFSET.unpack_from(self._map, position)[0]
+        return offset
+
+    def meta(self, index: int) -> tuple[str, str]:
+        rot_type, status, _ = _BINARY_RECORD.unpack_from(self._map, self._offset(index))
+        return self._values[rot_type], self._values[status]
+
+    def record(self, index: int) -> dict[str, str]:
+        offset = self._offset(index)
+        rot_type, status, length = _BINARY_RECORD.unpack_from(self._map, offset)
+        start = offset + _BINARY_RECORD.size
+
+        return {
+            "text": self._map[start : start + length].decode("utf-8"),
+            "rot_type": self._values[rot_type],
+            "status": self._values[status],
+        }
+
+    def close(self) -> None:
+        self._map.close()
 
 
 class FileHandler:
+    def __init__(
+        self, compression_level: int = COMPRESSION_LEVEL, fsync: str = FSYNC_ON_CLOSE
+    ) -> None:
+        if not 0 <= compression_level <= 9:
+            raise ValueError(f"Compression level must be between 0 and 9, got {compression_level}")
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(
+                f"Fsync policy must be one of {', '.join(FSYNC_POLICIES)}, got {fsync}"
+            )
+
+        self.compression_level = compression_level
+        self.fsync = fsync
+        self._unsynced: set[str] = set()
+
+    def open_file(self, filename: str, mode: str = "r", codec: str | None = None) -> IO[Any]:
+        opener = _CODECS.get(compression_suffix(filename) if codec is None else codec)
+        if opener is None:
+            return open(filename, mode)
+
+        if "b" not in mode:
+            mode = f"{mode}t"
+        return opener(filename, mode, self.compression_level)
+
+    def _written(self, filename: str) -> None:
+        if self.fsync == FSYNC_ALWAYS:
+            _fsync_path(filename)
+            _fsync_dir(filename)
+        elif self.fsync in (FSYNC_ON_CLOSE, FSYNC_DEFERRED):
+            self._unsynced.add(filename)
+
+    @contextmanager
+    def _atomic_write(self, filename: str, mode: str = "w") -> Iterator[IO[Any]]:
+        tmp_filename = f"{filename}.tmp"
+        try:
+            with self.open_file(tmp_filename, mode, codec=compression_suffix(filename)) as tmp_file:
+                yield tmp_file
+            if self.fsync in (FSYNC_ALWAYS, FSYNC_ON_CLOSE):
+                _fsync_path(tmp_filename)
+            os.replace(tmp_filename, filename)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(tmp_filename)
+            raise
+
+        if self.fsync in (FSYNC_ALWAYS, FSYNC_ON_CLOSE):
+            _fsync_dir(filename)
+        elif self.fsync == FSYNC_DEFERRED:
+            self._unsynced.add(filename)
+
+    def close(self) -> None:
+        unsynced, self._unsynced = self._unsynced, set()
+        for filename in unsynced:
+            if os.path.exists(filename):
+                _fsync_path(filename)
+                _fsync_dir(filename)
+
     def save_to_file(self, filename: str, buffer: list[dict]) -> None:
-        with open(filename, "w") as safe_file:
+        with self._atomic_write(filename) as safe_file:
             json.dump(buffer, safe_file, indent=4)
 
     def load_from_file(self, filename: str) -> Any:
-        with open(filename, "r") as read_file:
+        with self.open_file(filename, "r") as read_file:
             loaded_data = json.load(read_file)
 
         return loaded_data
+
+    def append_journal(self, filename: str, records: Iterable[tuple[int, dict]]) -> int:
+        lines = [json.dumps({"index": index, **record}) + "\n" for index, record in records]
+        with self.open_file(filename, "a") as journal_file:
+            journal_file.writelines(lines)
+        self._written(filename)
+
+        return len(lines)
+
+    def write_journal(self, filename: str, buffer: list[dict]) -> None:
+        with self._atomic_write(filename) as journal_file:
+            journal_file.writelines(
+                json.dumps({"index": index, **record}) + "\n" for index, record in enumerate(buffer)
+            )
+
+    def save_binary(self, filename: str, buffer: Iterable[dict]) -> None:
+        if compression_suffix(filename):
+            raise ValueError("Binary buffer files are memory-mapped and cannot be compressed")
+
+        codes: dict[str, int] = {}
+        offsets = array("Q")
+
+        def code(value: str) -> int:
+            if value not in codes:
+                if len(codes) > 0xFF:
+                    raise ValueError("Binary format supports at most 256 rot types and statuses")
+                codes[value] = len(codes)
+            return codes[value]
+
+        with self._atomic_write(filename, "wb") as binary_file:
+            binary_file.write(bytes(_BINARY_HEADER.size))
+            pos = _BINARY_HEADER.size
+            for record in buffer:
+                body = record["text"].encode("utf-8")
+                offsets.append(pos)
+                binary_file.write(
+                    _BINARY_RECORD.pack(code(record["rot_type"]), code(record["status"]), len(body))
+                )
+                binary_file.write(body)
+                pos += _BINARY_RECORD.size + len(body)
+
+            if sys.byteorder == "big":
+                offsets.byteswap()
+            binary_file.write(offsets.tobytes())
+
+            values_offset = pos + len(offsets) * offsets.itemsize
+            binary_file.write(_BINARY_LENGTH.pack(len(codes)))
+            for value in codes:
+                encoded = value.encode("utf-8")
+                binary_file.write(_BINARY_LENGTH.pack(len(encoded)))
+                binary_file.write(encoded)
+
+            binary_file.seek(0)
+            binary_file.write(
+                _BINARY_HEADER.pack(
+                    _BINARY_MAGIC, _BINARY_VERSION, len(offsets), pos, values_offset
+                )
+            )
+
+    def open_binary(self, filename: str) -> BinaryBufferFile:
+        if compression_suffix(filename):
+            raise ValueError("Binary buffer files are memory-mapped and cannot be compressed")
+
+        return BinaryBufferFile(filename)
+
+    def read_journal(self, filename: str) -> "JournalReader":
+        return JournalReader(filename, self.open_file)
+
+    def iter_json_array(self, filename: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Any]:
+        decoder = json.JSONDecoder()
+        buffer = ""
+        pos = 0
+        eof = False
+        state = _ARRAY_START
+
+        with self.open_file(filename, "r") as read_file:
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                    pos += 1
+
+                if pos == len(buffer):
+                    if eof:
+                        if state == _ARRAY_END:
+                            return
+                        raise json.JSONDecodeError("Unexpected end of data", buffer, pos)
+                    buffer, pos, eof = _read_more(read_file, buffer, pos, chunk_size)
+                    continue
+
+                char = buffer[pos]
+                if state == _ARRAY_START:
+                    if char != "[":
+                        raise json.JSONDecodeError("Expecting '['", buffer, pos)
+                    pos += 1
+                    state = _ARRAY_FIRST
+                elif state == _ARRAY_END:
+                    raise json.JSONDecodeError("Extra data", buffer, pos)
+                elif state == _ARRAY_FIRST and char == "]":
+                    pos += 1
+                    state = _ARRAY_END
+                elif state in (_ARRAY_FIRST, _ARRAY_VALUE):
+                    try:
+                        value, end = decoder.raw_decode(buffer, pos)
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                        buffer, pos, eof = _read_more(read_file, buffer, pos, chunk_size)
+                        continue
+                    if end == len(buffer) and not eof:
+                        buffer, pos, eof = _read_more(read_file, buffer, pos, chunk_size)
+                        continue
+                    yield value
+                    pos = end
+                    state = _ARRAY_SEPARATOR
+                elif char == ",":
+                    pos += 1
+                    state = _ARRAY_VALUE
+                elif char == "]":
+                    pos += 1
+                    state = _ARRAY_END
+                else:
+                    raise json.JSONDecodeError("Expecting ',' or ']'", buffer, pos)
+
+    def read_chunks(self, filename: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        with self.open_file(filename, "rb") as read_file:
+            while chunk := read_file.read(chunk_size):
+                yield chunk
+
+    def write_chunks(self, filename: str, chunks: Iterable[bytes | bytearray | memoryview]) -> int:
+        written = 0
+        with self.open_file(filename, "wb") as write_file:
+            for chunk in chunks:
+                written += write_file.write(chunk)
+
+        return written
+
+    def map_in_place(
+        self,
+        filename: str,
+        transform: Callable[[memoryview], object],
+        window_size: int = MMAP_WINDOW_SIZE,
+    ) -> int:
+        granularity = mmap.ALLOCATIONGRANULARITY
+        window_size = -(-window_size // granularity) * granularity
+        processed = 0
+
+        with open(filename, "r+b") as map_file:
+            size = os.fstat(map_file.fileno()).st_size
+            for offset in range(0, size, window_size):
+                length = min(window_size, size - offset)
+                with mmap.mmap(map_file.fileno(), length, offset=offset) as window:
+                    with memoryview(window) as view:
+                        transform(view)
+                    window.flush()
+                processed += length
+
+        return processed
@@ -0,0 +1,89 @@
+import sys
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from src.constants import HISTORY_CHANGE_OVERHEAD, HISTORY_MAX_BYTES
+from src.text import Text
+
+Change = tuple[int, Text | None, Text | None]
+Operation = tuple[list[Change], int]
+
+
+class History:
+    def __init__(self, max_bytes: int = HISTORY_MAX_BYTES) -> None:
+        if max_bytes < 0:
+            raise ValueError("History size must not be negative")
+
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._undo: deque[Operation] = deque()
+        self._redo: list[Operation] = []
+        self._group: list[Change] | None = None
+
+    @property
+    def undo_depth(self) -> int:
+        return len(self._undo)
+
+    @property
+    def redo_depth(self) -> int:
+        return len(self._redo)
+
+    @staticmethod
+    def _size(changes: list[Change]) -> int:
+        return sum(
+            HISTORY_CHANGE_OVERHEAD
+            + sum(sys.getsizeof(text_obj.text) for text_obj in (before, after) if text_obj)
+            for _, before, after in changes
+        )
+
+    def record(self, index: int, before: Text | None, after: Text | None) -> None:
+        if self._group is not None:
+            self._group.append((index, before, after))
+        else:
+            self._push([(index, before, after)])
+
+    @contextmanager
+    def group(self) -> Iterator[None]:
+        if self._group is not None:
+            yield
+            return
+
+        self._group = []
+        try:
+            yield
+        finally:
+            changes, self._group = self._group, None
+            if changes:
+                self._push(changes)
+
+    def _push(self, changes: list[Change]) -> None:
+        self.size_bytes -= sum(size for _, size in self._redo)
+        self._redo.clear()
+
+        size = self._size(changes)
+        self._undo.append((changes, size))
+        self.size_bytes += size
+        while self.size_bytes > self.max_bytes and self._undo:
+            self.size_bytes -= self._undo.popleft()[1]
+
+    def undo(self) -> list[Change]:
+        if not self._undo:
+            return []
+
+        operation = self._undo.pop()
+        self._redo.append(operation)
+        return operation[0]
+
+    def redo(self) -> list[Change]:
+        if not self._redo:
+            return []
+
+        operation = self._redo.pop()
+        self._undo.append(operation)
+        return operation[0]
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+        self.size_bytes = 0
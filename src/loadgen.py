@@ -0,0 +1,92 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+
+from src.benchmark import make_payload
+from src.constants import ROT13, SERVICE_HOST, SERVICE_LINE_LIMIT, SERVICE_PORT
+
+
+@dataclass
+class LoadReport:
+    requests: int
+    errors: int
+    seconds: float
+    requests_per_sec: float
+    p50_ms: float
+    p99_ms: float
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def _run_connection(
+    host: str, port: int, count: int, pipeline: int, request: dict, latencies: list[float]
+) -> int:
+    reader, writer = await asyncio.open_connection(host, port, limit=SERVICE_LINE_LIMIT)
+    window = asyncio.Semaphore(pipeline)
+    sent: dict[int, float] = {}
+
+    async def send() -> None:
+        for request_id in range(count):
+            await window.acquire()
+            sent[request_id] = time.perf_counter()
+            writer.write(json.dumps({**request, "id": request_id}).encode("utf-8") + b"\n")
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    errors = 0
+    try:
+        for _ in range(count):
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("Service closed the connection")
+            response = json.loads(line)
+            latencies.append(time.perf_counter() - sent.pop(response["id"]))
+            errors += not response["ok"]
+            window.release()
+        await sender
+    finally:
+        sender.cancel()
+        writer.close()
+        await writer.wait_closed()
+
+    return errors
+
+
+async def run_load(
+    host: str = SERVICE_HOST,
+    port: int = SERVICE_PORT,
+    requests: int = 10_000,
+    connections: int = 8,
+    pipeline: int = 16,
+    payload_size: int = 64,
+    rot_type: str = ROT13,
+) -> LoadReport:
+    if requests < 1 or connections < 1 or pipeline < 1:
+        raise ValueError("Requests, connections and pipeline must be at least 1")
+
+    request = {"op": "encrypt", "text": make_payload("ascii", payload_size), "rot_type": rot_type}
+    counts = [requests // connections + (i < requests % connections) for i in range(connections)]
+    latencies: list[float] = []
+
+    start = time.perf_counter()
+    errors = await asyncio.gather(
+        *(
+            _run_connection(host, port, count, pipeline, request, latencies)
+            for count in counts
+            if count
+        )
+    )
+    seconds = time.perf_counter() - start
+
+    return LoadReport(
+        requests=requests,
+        errors=sum(errors),
+        seconds=seconds,
+        requests_per_sec=requests / seconds,
+        p50_ms=percentile(latencies, 0.5) * 1000,
+        p99_ms=percentile(latencies, 0.99) * 1000,
+    )
@@ -1,51 +1,357 @@
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+
+from src.analysis import detect_cipher
 from src.buffer import Buffer
-from src.cipher import cipher_factory
-from src.constants import STATUS_DECRYPTED, STATUS_ENCRYPTED
-from src.exceptions import RotTypeMismatchError
-from src.file_handler import FileHandler
+from src.cache import ResultCache
+from src.cipher import BytesLike, Cipher, cipher_factory
+from src.constants import (
+    BINARY_EXTENSION,
+    CACHE_MAX_BYTES,
+    CACHE_MAX_ENTRIES,
+    DATA_DIR,
+    JOURNAL_COMPACT_RATIO,
+    JOURNAL_EXTENSION,
+    JSON_EXTENSION,
+    MMAP_WINDOW_SIZE,
+    NUMPY_THRESHOLD,
+    PARALLEL_THRESHOLD,
+    STATUS_DECRYPTED,
+    STATUS_ENCRYPTED,
+    STREAM_CHUNK_SIZE,
+)
+from src.exceptions import RotTypeMismatchError, UnsupportedCipherError
+from src.file_handler import FileHandler, compression_suffix
+from src.parallel import ParallelCipher, parallel_cipher_chunks
 from src.text import Text
 
 
+@dataclass
+class BatchResult:
+    processed: list[int] = field(default_factory=list)
+    failed: dict[int, str] = field(default_factory=dict)
+
+
 class Manager:
-    def __init__(self, buffer: Buffer, file_handler: FileHandler) -> None:
+    def __init__(
+        self,
+        buffer: Buffer,
+        file_handler: FileHandler,
+        workers: int = 1,
+        parallel_threshold: int = PARALLEL_THRESHOLD,
+        cache_entries: int = CACHE_MAX_ENTRIES,
+        cache_bytes: int = CACHE_MAX_BYTES,
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"Workers must be at least 1, got {workers}")
+
         self.buffer = buffer
         self.file_handler = file_handler
+        self.workers = workers
+        self.parallel_threshold = parallel_threshold
+        self.cache = ResultCache(max_entries=cache_entries, max_bytes=cache_bytes)
+        self._executor: ProcessPoolExecutor | None = None
+        self._writer: ThreadPoolExecutor | None = None
+        self._last_save: Future[None] | None = None
+        self._journal_path: str | None = None
+        self._journal_lines = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _cipher_key(self, rot_type: str, size: int) -> tuple[str, bool, bool]:
+        parallel = self.workers > 1 and size >= self.parallel_threshold
+        return rot_type, size >= NUMPY_THRESHOLD, parallel
+
+    def _get_cipher(self, rot_type: str, size: int = 0) -> Cipher:
+        if self.workers == 1 or size < self.parallel_threshold:
+            return cipher_factory(rot_type=rot_type, size=size)
+
+        return ParallelCipher(
+            inner=cipher_factory(rot_type=rot_type, size=size),
+            executor=self._get_executor(),
+            threshold=self.parallel_threshold,
+        )
+
+    def _get_writer(self) -> ThreadPoolExecutor:
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="buffer-writer")
+        return self._writer
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._writer is not None:
+            self._writer.shutdown()
+            self._writer = None
+        self.file_handler.close()
 
     def add_text(self, user_text: str) -> None:
         text_obj = Text(text=user_text, rot_type="", status=STATUS_DECRYPTED)
         self.buffer.add(text_obj)
 
-    def process_cipher(self, index: int, rot_type: str) -> Text:
-        text_obj = self.buffer.get(index=index)
-        cipher = cipher_factory(rot_type=rot_type)
+    def _cipher_text(self, text_obj: Text, cipher: Cipher, rot_type: str, decrypt: bool) -> str:
+        base = cipher_factory(rot_type=rot_type)
+        if base.inverse() is base:
+            forward = backward = STATUS_ENCRYPTED
+        elif decrypt:
+            forward, backward = STATUS_DECRYPTED, STATUS_ENCRYPTED
+        else:
+            forward, backward = STATUS_ENCRYPTED, STATUS_DECRYPTED
+
+        key = (rot_type, forward, text_obj.text)
+        result = self.cache.get(key)
+        if result is None:
+            result = (cipher.inverse() if decrypt else cipher).cipher(text_obj)
+            self.cache.put((rot_type, backward, result), text_obj.text)
+            self.cache.put(key, result)
 
+        return result
+
+    def _transform(self, text_obj: Text, cipher: Cipher, rot_type: str) -> Text:
         if text_obj.status == STATUS_DECRYPTED:
-            new_text_obj = cipher.process(
-                text_obj=text_obj, rot_type=rot_type, status=STATUS_ENCRYPTED
-            )
+            text = self._cipher_text(text_obj, cipher, rot_type, decrypt=False)
+            return Text(text=text, rot_type=rot_type, status=STATUS_ENCRYPTED)
 
-        elif text_obj.status == STATUS_ENCRYPTED:
+        if text_obj.status == STATUS_ENCRYPTED:
             if text_obj.rot_type and text_obj.rot_type != rot_type:
                 raise RotTypeMismatchError(
                     f"Mismatch rot type: expected {text_obj.rot_type}, got {rot_type}"
                 )
 
-            tmp = cipher.process(text_obj=text_obj, rot_type=rot_type, status=STATUS_DECRYPTED)
+            text = self._cipher_text(text_obj, cipher, rot_type, decrypt=True)
+            return Text(text=text, rot_type="", status=STATUS_DECRYPTED)
 
-            new_text_obj = Text(text=tmp.text, rot_type="", status=tmp.status)
-        else:
-            raise ValueError(f"Unknown status: {text_obj.status}")
+        raise ValueError(f"Unknown status: {text_obj.status}")
+
+    def detect_rot_type(self, index: int) -> str:
+        text_obj = self.buffer.get(index=index)
+        if text_obj.rot_type:
+            return text_obj.rot_type
+
+        rot_type = detect_cipher(text_obj.text)
+        if rot_type is None:
+            raise ValueError(f"Cannot detect rot type of text {index + 1}")
+        return rot_type
+
+    def classify_buffer(self) -> dict[int, str]:
+        detected: dict[int, str] = {}
+        for index in self.buffer.find(status=STATUS_ENCRYPTED, rot_type=""):
+            rot_type = detect_cipher(self.buffer.get(index=index).text)
+            if rot_type is not None:
+                detected[index] = rot_type
+
+        return detected
+
+    def process_cipher(self, index: int, rot_type: str) -> Text:
+        text_obj = self.buffer.get(index=index)
+        if not rot_type and text_obj.status == STATUS_ENCRYPTED:
+            rot_type = self.detect_rot_type(index)
+        cipher = self._get_cipher(rot_type=rot_type, size=len(text_obj.text))
 
+        new_text_obj = self._transform(text_obj=text_obj, cipher=cipher, rot_type=rot_type)
         self.buffer.update(index=index, text_obj=new_text_obj)
 
         return new_text_obj
 
+    def process_batch(self, indices: Iterable[int], rot_type: str | None = None) -> BatchResult:
+        ciphers: dict[tuple[str, bool, bool], Cipher] = {}
+        if rot_type is not None:
+            ciphers[self._cipher_key(rot_type, 0)] = self._get_cipher(rot_type=rot_type)
+
+        result = BatchResult()
+        with self.buffer.history.group():
+            for index in indices:
+                try:
+                    text_obj = self.buffer.get(index=index)
+                    entry_rot_type = rot_type if rot_type is not None else text_obj.rot_type
+                    size = len(text_obj.text)
+                    key = self._cipher_key(entry_rot_type, size)
+                    cipher = ciphers.get(key)
+                    if cipher is None:
+                        cipher = ciphers[key] = self._get_cipher(rot_type=entry_rot_type, size=size)
+
+                    new_text_obj = self._transform(
+                        text_obj=text_obj, cipher=cipher, rot_type=entry_rot_type
+                    )
+                except (IndexError, ValueError, RotTypeMismatchError, UnsupportedCipherError) as e:
+                    result.failed[index] = str(e)
+                    continue
+
+                self.buffer.update(index=index, text_obj=new_text_obj)
+                result.processed.append(index)
+
+        return result
+
+    def process_all(self, rot_type: str | None = None) -> BatchResult:
+        return self.process_batch(indices=range(len(self.buffer)), rot_type=rot_type)
+
+    def process_range(self, start: int, stop: int, rot_type: str | None = None) -> BatchResult:
+        indices = range(max(start, 0), min(stop, len(self.buffer)))
+        return self.process_batch(indices=indices, rot_type=rot_type)
+
+    def process_matching(
+        self,
+        rot_type: str | None = None,
+        status: str | None = None,
+        current_rot_type: str | None = None,
+    ) -> BatchResult:
+        indices = self.buffer.find(status=status, rot_type=current_rot_type)
+        return self.process_batch(indices=indices, rot_type=rot_type)
+
+    def _data_path(self, filename: str) -> str:
+        suffix = compression_suffix(filename)
+        stem = filename.removesuffix(suffix)
+        if stem.endswith((JSON_EXTENSION, JOURNAL_EXTENSION, BINARY_EXTENSION)):
+            return f"{DATA_DIR}/{filename}"
+        return f"{DATA_DIR}/{stem}{JSON_EXTENSION}{suffix}"
+
+    def _file_format(self, filename: str) -> str:
+        return os.path.splitext(filename.removesuffix(compression_suffix(filename)))[1]
+
+    @property
+    def saving(self) -> bool:
+        return self._last_save is not None and not self._last_save.done()
+
+    def wait_for_saves(self) -> None:
+        if self._last_save is not None:
+            self._last_save.exception()
+
+    def _run_save(self, write: Callable[[], object]) -> None:
+        try:
+            write()
+        except BaseException:
+            self._journal_path = None
+            raise
+
+    def _submit_save(self, write: Callable[[], object]) -> Future[None]:
+        self._last_save = self._get_writer().submit(self._run_save, write)
+        return self._last_save
+
+    def save_in_background(self, filename: str) -> Future[None]:
+        return self._save_path(self._data_path(filename))
+
+    def _save_path(self, filename: str) -> Future[None]:
+        file_format = self._file_format(filename)
+        if file_format == JOURNAL_EXTENSION:
+            return self._submit_save(self._snapshot_journal(filename))
+
+        texts = list(self.buffer)
+        save: Callable[[str, list[dict]], None]
+        if file_format == BINARY_EXTENSION:
+            save = self.file_handler.save_binary
+        else:
+            save = self.file_handler.save_to_file
+        return self._submit_save(lambda: save(filename, [asdict(text_obj) for text_obj in texts]))
+
     def save_to_file(self, filename: str) -> None:
-        filename = f"data/{filename}.json"
-        self.file_handler.save_to_file(filename, self.buffer.to_dict_list())
+        self.save_in_background(filename).result()
+
+    def save_to_path(self, path: str) -> None:
+        self._save_path(path).result()
+
+    def _snapshot_journal(self, filename: str) -> Callable[[], object]:
+        records = self.buffer.dirty_records()
+        lines = self._journal_lines + len(records)
+
+        if (
+            filename != self._journal_path
+            or self.buffer.shrunk
+            or lines > JOURNAL_COMPACT_RATIO * len(self.buffer)
+        ):
+            return self._snapshot_compaction(filename)
+
+        self._journal_lines = lines
+        self.buffer.mark_clean()
+        return lambda: self.file_handler.append_journal(filename, records)
+
+    def _snapshot_compaction(self, filename: str) -> Callable[[], object]:
+        texts = list(self.buffer)
+        self._journal_path = filename
+        self._journal_lines = len(texts)
+        self.buffer.mark_clean()
+        return lambda: self.file_handler.write_journal(
+            filename, [asdict(text_obj) for text_obj in texts]
+        )
+
+    def compact_journal(self, filename: str) -> None:
+        self._submit_save(self._snapshot_compaction(self._data_path(filename))).result()
 
     def load_from_file(self, filename: str) -> None:
-        filename = f"data/{filename}.json"
-        loaded_data = self.file_handler.load_from_file(filename)
+        self.load_from_path(self._data_path(filename))
+
+    def load_from_path(self, filename: str) -> None:
+        self.wait_for_saves()
+        file_format = self._file_format(filename)
+        if file_format == JOURNAL_EXTENSION:
+            journal = self.file_handler.read_journal(filename)
+            self.buffer.replay(journal)
+            self._journal_path = None if journal.torn else filename
+            self._journal_lines = journal.lines
+            return
+
+        if file_format == BINARY_EXTENSION:
+            self.buffer.from_source(self.file_handler.open_binary(filename))
+            self._journal_path = None
+            return
+
+        self.buffer.from_dict_list(self.file_handler.iter_json_array(filename))
+        self._journal_path = None
+
+    def iter_file(self, filename: str) -> Iterator[Text]:
+        self.wait_for_saves()
+        filename = self._data_path(filename)
+        file_format = self._file_format(filename)
+        if file_format == JOURNAL_EXTENSION:
+            return self._iter_journal(filename)
+
+        if file_format == BINARY_EXTENSION:
+            source = self.file_handler.open_binary(filename)
+            return (Text(**source.record(index)) for index in range(len(source)))
+
+        return (Text(**record) for record in self.file_handler.iter_json_array(filename))
+
+    def _iter_journal(self, filename: str) -> Iterator[Text]:
+        for count, (index, record) in enumerate(self.file_handler.read_journal(filename)):
+            if index != count:
+                raise ValueError(f"Journal {filename} must be compacted before lazy reading")
+            yield Text(**record)
+
+    def stream_cipher(
+        self,
+        input_path: str,
+        output_path: str,
+        rot_type: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> int:
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+
+        cipher = cipher_factory(rot_type=rot_type, size=chunk_size)
+        cipher.cipher_bytes(b"")
+        chunks = self.file_handler.read_chunks(input_path, chunk_size)
+
+        ciphered: Iterator[BytesLike]
+        if self.workers == 1:
+            ciphered = (cipher.cipher_bytes(chunk) for chunk in chunks)
+        else:
+            ciphered = parallel_cipher_chunks(
+                self._get_executor(), cipher, chunks, max_pending=self.workers * 2
+            )
+
+        return self.file_handler.write_chunks(output_path, ciphered)
+
+    def cipher_file_in_place(
+        self, filename: str, rot_type: str, window_size: int = MMAP_WINDOW_SIZE
+    ) -> int:
+        if window_size <= 0:
+            raise ValueError(f"Window size must be positive, got {window_size}")
+
+        cipher = cipher_factory(rot_type=rot_type, size=window_size)
 
-        self.buffer.from_dict_list(loaded_data)
+        return self.file_handler.map_in_place(filename, cipher.cipher_bytes, window_size)
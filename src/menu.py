@@ -1,13 +1,15 @@
 import json
 import sys
+from concurrent.futures import Future
 
 from src.buffer import Buffer
+from src.constants import PAGE_SIZE, PREVIEW_WIDTH
 from src.exceptions import (
     EmptyBufferError,
     RotTypeMismatchError,
     UnsupportedCipherError,
 )
-from src.file_handler import FileHandler
+from src.file_handler import CODEC_ERRORS, FileHandler
 from src.manager import Manager
 
 
@@ -16,12 +18,15 @@ class Menu:
         self.manager = Manager(buffer=Buffer(), file_handler=FileHandler())
         self.options = {
             "1": self.add_text,
-            "2": self.show_buffer,
+            "2": self.browse_buffer,
             "3": self.encrypt_decrypt,
             "4": self.save_to_file,
             "5": self.load_from_file,
             "6": self.exit_program,
+            "7": self.undo,
+            "8": self.redo,
         }
+        self.pending_saves: list[tuple[str, Future[None]]] = []
 
     def main_menu(self) -> None:
         print("\n--- MENU ---")
@@ -31,9 +36,12 @@ class Menu:
         print("4. Save to file")
         print("5. Load from file")
         print("6. Exit")
+        print("7. Undo")
+        print("8. Redo")
 
     def run(self) -> None:
         while True:
+            self.report_saves()
             self.main_menu()
             choice = input("Choose an option: ")
 
@@ -41,37 +49,65 @@ class Menu:
             if action:
                 action()
             else:
-                print("Invalid choice, choose (1-6)")
+                print("Invalid choice, choose (1-8)")
 
     def add_text(self) -> None:
         user_text = input("Enter text: ")
         self.manager.add_text(user_text)
         print(f"Text '{user_text}' has been added to the buffer")
 
-    def show_buffer(self) -> bool:
+    def show_buffer(self, page: int = 0) -> bool:
+        buffer = self.manager.buffer
         try:
-            lines = self.manager.buffer.all_strings()
-            print("Texts in buffer:")
-            for line in lines:
-                print(line)
-            return True
+            lines = buffer.page_strings(page=page, page_size=PAGE_SIZE, preview_width=PREVIEW_WIDTH)
         except EmptyBufferError as e:
             print(e)
             return False
 
+        pages = buffer.page_count(PAGE_SIZE)
+        sys.stdout.write(
+            "Texts in buffer:\n"
+            + "".join(f"{line}\n" for line in lines)
+            + f"Page {page + 1}/{pages}\n"
+        )
+        return True
+
+    def change_page(self, page: int, command: str) -> int:
+        pages = self.manager.buffer.page_count(PAGE_SIZE)
+        page = page + 1 if command == "n" else page - 1
+        return max(0, min(page, pages - 1))
+
+    def browse_buffer(self) -> None:
+        if not self.show_buffer():
+            return
+        page = 0
+
+        while (command := input("Next page (n), previous page (p), back (Enter): ")) in ("n", "p"):
+            page = self.change_page(page, command)
+            self.show_buffer(page)
+
     def encrypt_decrypt(self) -> None:
+        if not self.show_buffer():
+            return
+        page = 0
+
         while True:
-            if not self.show_buffer():
-                return
+            choice = input("Select text (n/p to change page): ")
+            if choice in ("n", "p"):
+                page = self.change_page(page, choice)
+                self.show_buffer(page)
+                continue
 
             try:
-                index = int(input("Select text: ")) - 1
+                index = int(choice) - 1
                 _ = self.manager.buffer.get(index)
             except (ValueError, IndexError):
                 print("Invalid index, try again\n")
                 continue
 
-            rot_type = input("Enter rot type(rot13, rot47): ")
+            rot_type = input(
+                "Enter rot type(rot13, rot47, rot5, rot18, rot8000, caesar:N, Enter to detect): "
+            )
             try:
                 status = self.manager.process_cipher(index=index, rot_type=rot_type).status
             except (ValueError, RotTypeMismatchError, UnsupportedCipherError) as e:
@@ -84,12 +120,20 @@ class Menu:
     def save_to_file(self) -> None:
         filename = input("Enter file name: ")
 
-        try:
-            self.manager.save_to_file(filename=filename)
-        except OSError as e:
-            print(f"Error saving file: {e}")
-        else:
-            print("File saved")
+        future = self.manager.save_in_background(filename=filename)
+        self.pending_saves.append((filename, future))
+        print(f"Saving '{filename}' in the background")
+
+    def report_saves(self) -> None:
+        pending = []
+        for filename, future in self.pending_saves:
+            if not future.done():
+                pending.append((filename, future))
+            elif (error := future.exception()) is not None:
+                print(f"Error saving file '{filename}': {error}")
+            else:
+                print(f"File '{filename}' saved")
+        self.pending_saves = pending
 
     def load_from_file(self) -> None:
         filename = input("Enter file name: ")
@@ -100,9 +144,29 @@ class Menu:
             print("File not found")
         except json.JSONDecodeError:
             print("File corrupted or invalid JSON")
+        except ValueError as e:
+            print(f"File corrupted: {e}")
+        except CODEC_ERRORS as e:
+            print(f"Cannot read file: {e}")
         else:
             print("File loaded")
 
+    def undo(self) -> None:
+        indices = self.manager.buffer.undo()
+        if indices:
+            print(f"Undone changes to {len(indices)} text(s)")
+        else:
+            print("Nothing to undo")
+
+    def redo(self) -> None:
+        indices = self.manager.buffer.redo()
+        if indices:
+            print(f"Redone changes to {len(indices)} text(s)")
+        else:
+            print("Nothing to redo")
+
     def exit_program(self) -> None:
+        self.manager.close()
+        self.report_saves()
         print("Good bye!")
         sys.exit(0)
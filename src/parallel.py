@@ -0,0 +1,69 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future
+from functools import partial
+
+from src.cipher import BytesLike, Cipher
+from src.constants import PARALLEL_CHUNK_SIZE, PARALLEL_THRESHOLD
+from src.text import Text
+
+
+def _cipher_text_chunk(cipher: Cipher, chunk: str) -> str:
+    return cipher.cipher(Text(text=chunk, rot_type="", status=""))
+
+
+def _cipher_bytes_chunk(cipher: Cipher, chunk: bytes) -> BytesLike:
+    return cipher.cipher_bytes(chunk)
+
+
+def parallel_cipher_chunks(
+    executor: Executor, cipher: Cipher, chunks: Iterable[bytes], max_pending: int
+) -> Iterator[BytesLike]:
+    pending: deque[Future[BytesLike]] = deque()
+
+    for chunk in chunks:
+        pending.append(executor.submit(_cipher_bytes_chunk, cipher, chunk))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+class ParallelCipher(Cipher):
+    def __init__(
+        self,
+        inner: Cipher,
+        executor: Executor,
+        threshold: int = PARALLEL_THRESHOLD,
+        chunk_size: int = PARALLEL_CHUNK_SIZE,
+    ) -> None:
+        self.inner = inner
+        self.executor = executor
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+
+    def cipher(self, text_obj: Text) -> str:
+        text = text_obj.text
+        if len(text) < self.threshold:
+            return self.inner.cipher(text_obj)
+
+        chunks = [text[i : i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
+
+        return "".join(self.executor.map(partial(_cipher_text_chunk, self.inner), chunks))
+
+    def cipher_bytes(self, data: BytesLike) -> BytesLike:
+        if len(data) < self.threshold or not isinstance(data, bytes):
+            return self.inner.cipher_bytes(data)
+
+        chunks = [data[i : i + self.chunk_size] for i in range(0, len(data), self.chunk_size)]
+
+        return b"".join(self.executor.map(partial(_cipher_bytes_chunk, self.inner), chunks))
+
+    def inverse(self) -> "ParallelCipher":
+        return ParallelCipher(
+            inner=self.inner.inverse(),
+            executor=self.executor,
+            threshold=self.threshold,
+            chunk_size=self.chunk_size,
+        )
@@ -0,0 +1,281 @@
+import asyncio
+import json
+import os
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
+from dataclasses import asdict
+from typing import Any
+
+from src.cipher import Cipher, cipher_factory
+from src.constants import (
+    PAGE_SIZE,
+    SERVICE_BATCH_DELAY,
+    SERVICE_BATCH_SIZE,
+    SERVICE_HOST,
+    SERVICE_LINE_LIMIT,
+    SERVICE_MAX_PENDING,
+    SERVICE_OFFLOAD_THRESHOLD,
+    SERVICE_PIPELINE_DEPTH,
+    SERVICE_PORT,
+    SERVICE_SHUTDOWN_TIMEOUT,
+)
+from src.manager import Manager
+from src.text import Text
+
+_Job = tuple[Cipher, str, asyncio.Future[str]]
+_SEPARATORS = tuple(sep for sep in ("/", os.sep, os.altsep) if sep)
+
+
+def _data_filename(request: dict) -> str:
+    filename = request["filename"]
+    if (
+        not isinstance(filename, str)
+        or not filename
+        or ".." in filename
+        or any(sep in filename for sep in _SEPARATORS)
+    ):
+        raise ValueError("File name must be a plain name inside the data directory")
+    return filename
+
+
+def _cipher_batch(jobs: list[tuple[Cipher, str]]) -> list[str | Exception]:
+    results: list[str | Exception] = []
+    for cipher, text in jobs:
+        try:
+            results.append(cipher.cipher(Text(text=text, rot_type="", status="")))
+        except Exception as e:
+            results.append(e)
+
+    return results
+
+
+def _cipher_chunked(cipher: Cipher, text: str, chunk_size: int) -> str:
+    return "".join(
+        cipher.cipher(Text(text=text[start : start + chunk_size], rot_type="", status=""))
+        for start in range(0, len(text), chunk_size)
+    )
+
+
+class CipherService:
+    def __init__(
+        self,
+        manager: Manager,
+        batch_size: int = SERVICE_BATCH_SIZE,
+        batch_delay: float = SERVICE_BATCH_DELAY,
+        max_pending: int = SERVICE_MAX_PENDING,
+        pipeline_depth: int = SERVICE_PIPELINE_DEPTH,
+        offload_threshold: int = SERVICE_OFFLOAD_THRESHOLD,
+        executor: Executor | None = None,
+    ) -> None:
+        if batch_size < 1 or max_pending < 1 or pipeline_depth < 1:
+            raise ValueError("Batch size, max pending and pipeline depth must be at least 1")
+
+        self.manager = manager
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_pending = max_pending
+        self.pipeline_depth = pipeline_depth
+        self.offload_threshold = offload_threshold
+        self.executor = executor
+        self.batches = 0
+        self._queue: asyncio.Queue[_Job] = asyncio.Queue(maxsize=max_pending)
+        self._lock = asyncio.Lock()
+        self._batcher: asyncio.Task[None] | None = None
+        self._connections: set[asyncio.Task[None]] = set()
+        self._handlers: dict[str, Callable[[dict], Awaitable[Any]]] = {
+            "encrypt": self._encrypt,
+            "decrypt": self._decrypt,
+            "add": self._add,
+            "get": self._get,
+            "list": self._list,
+            "process": self._process,
+            "save": self._save,
+            "load": self._load,
+        }
+
+    async def start(self, host: str = SERVICE_HOST, port: int = SERVICE_PORT) -> asyncio.Server:
+        self._batcher = asyncio.create_task(self._run_batches())
+
+        return await asyncio.start_server(
+            self.handle_connection, host, port, limit=SERVICE_LINE_LIMIT
+        )
+
+    async def stop(self, timeout: float = SERVICE_SHUTDOWN_TIMEOUT) -> None:
+        if self._connections:
+            _, pending = await asyncio.wait(self._connections, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if self._batcher is not None:
+            self._batcher.cancel()
+            await asyncio.gather(self._batcher, return_exceptions=True)
+            self._batcher = None
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        responses: asyncio.Queue[asyncio.Task[dict] | None] = asyncio.Queue(
+            maxsize=self.pipeline_depth
+        )
+        sender = asyncio.create_task(self._send_responses(responses, writer))
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections.add(task)
+
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    await responses.put(asyncio.create_task(self._respond(line)))
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            try:
+                if not sender.done():
+                    await responses.put(None)
+                await sender
+            finally:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except ConnectionError:
+                    pass
+                self._connections.discard(task)  # type: ignore[arg-type]
+
+    async def _send_responses(
+        self, responses: asyncio.Queue[asyncio.Task[dict] | None], writer: asyncio.StreamWriter
+    ) -> None:
+        while (task := await responses.get()) is not None:
+            try:
+                response = await task
+            except Exception as e:
+                response = {"id": None, "ok": False, "error": str(e)}
+            if writer.is_closing():
+                continue
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            try:
+                await writer.drain()
+            except ConnectionError:
+                writer.close()
+
+    async def _respond(self, line: bytes) -> dict:
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            request_id = request.get("id")
+            op = request.get("op")
+            if not isinstance(op, str):
+                raise ValueError("Request op must be a string")
+            handler = self._handlers.get(op)
+            if handler is None:
+                raise ValueError(f"Unknown operation: {op}")
+            result = await handler(request)
+        except Exception as e:
+            return {"id": request_id, "ok": False, "error": str(e)}
+
+        return {"id": request_id, "ok": True, "result": result}
+
+    async def cipher_text(self, text: str, rot_type: str, decrypt: bool = False) -> str:
+        cipher = cipher_factory(rot_type=rot_type, size=len(text))
+        if decrypt:
+            cipher = cipher.inverse()
+
+        loop = asyncio.get_running_loop()
+        if len(text) >= self.offload_threshold:
+            return await loop.run_in_executor(
+                self.executor, _cipher_chunked, cipher, text, self.offload_threshold
+            )
+
+        future: asyncio.Future[str] = loop.create_future()
+        await self._queue.put((cipher, text, future))
+        return await future
+
+    async def _run_batches(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            await asyncio.sleep(self.batch_delay)
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            self.batches += 1
+            jobs = [(cipher, text) for cipher, text, _ in batch]
+            if sum(len(text) for _, text in jobs) < self.offload_threshold:
+                results = _cipher_batch(jobs)
+            else:
+                loop = asyncio.get_running_loop()
+                try:
+                    results = await loop.run_in_executor(self.executor, _cipher_batch, jobs)
+                except Exception as e:
+                    results = [e] * len(jobs)
+
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def _encrypt(self, request: dict) -> str:
+        return await self.cipher_text(request["text"], request["rot_type"])
+
+    async def _decrypt(self, request: dict) -> str:
+        return await self.cipher_text(request["text"], request["rot_type"], decrypt=True)
+
+    async def _add(self, request: dict) -> int:
+        async with self._lock:
+            self.manager.add_text(request["text"])
+            return len(self.manager.buffer) - 1
+
+    async def _get(self, request: dict) -> dict:
+        async with self._lock:
+            return asdict(self.manager.buffer.get(request["index"]))
+
+    async def _list(self, request: dict) -> dict:
+        buffer = self.manager.buffer
+        page_size = request.get("page_size", PAGE_SIZE)
+        if not isinstance(page_size, int) or page_size < 1:
+            raise ValueError("Page size must be a positive integer")
+
+        async with self._lock:
+            texts = list(buffer.page_strings(page=request.get("page", 0), page_size=page_size))
+            return {"texts": texts, "pages": buffer.page_count(page_size)}
+
+    async def _process(self, request: dict) -> dict:
+        index, rot_type = request["index"], request["rot_type"]
+
+        async with self._lock:
+            if len(self.manager.buffer.get(index).text) < self.offload_threshold:
+                return asdict(self.manager.process_cipher(index=index, rot_type=rot_type))
+
+            loop = asyncio.get_running_loop()
+            text_obj = await loop.run_in_executor(
+                None, self.manager.process_cipher, index, rot_type
+            )
+            return asdict(text_obj)
+
+    async def _save(self, request: dict) -> str:
+        filename = _data_filename(request)
+        async with self._lock:
+            future = self.manager.save_in_background(filename)
+        await asyncio.wrap_future(future)
+
+        return filename
+
+    async def _load(self, request: dict) -> int:
+        filename = _data_filename(request)
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.manager.load_from_file, filename)
+            return len(self.manager.buffer)
+
+
+async def serve(service: CipherService, host: str = SERVICE_HOST, port: int = SERVICE_PORT) -> None:
+    server = await service.start(host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
@@ -1,8 +1,15 @@
+import sys
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Text:
     text: str
     rot_type: str
     status: str
+
+    def __post_init__(self) -> None:
+        if type(self.rot_type) is str:
+            self.rot_type = sys.intern(self.rot_type)
+        if type(self.status) is str:
+            self.status = sys.intern(self.status)
@@ -0,0 +1,44 @@
+import pytest
+
+from src.analysis import CANDIDATES, bigram_histogram, detect_cipher, histogram, rank_ciphers
+from src.cipher import cipher_factory
+from src.constants import ANALYSIS_SAMPLE_SIZE, ROT13, ROT47
+from src.text import Text
+
+
+def encrypt(text, rot_type):
+    return cipher_factory(rot_type).cipher(Text(text=text, rot_type="", status=""))
+
+
+class TestAnalysis:
+    @pytest.mark.parametrize("rot_type", CANDIDATES)
+    @pytest.mark.parametrize("text", ["Hello World", "Attack at dawn", "Python is fun"])
+    def test_detects_every_candidate(self, text, rot_type):
+        assert detect_cipher(encrypt(text, rot_type)) == rot_type
+
+    @pytest.mark.parametrize("refine", [0, 3])
+    def test_ranks_all_candidates_best_first(self, refine):
+        text = encrypt("The quick brown fox jumps over the lazy dog", ROT47)
+
+        ranking = rank_ciphers(text, refine=refine)
+
+        assert ranking[0][0] == ROT47
+        assert sorted(rot_type for rot_type, _ in ranking) == sorted(CANDIDATES)
+        scores = [score for _, score in ranking[refine:]]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_ignores_non_ascii_characters(self):
+        assert detect_cipher(encrypt("Zażółć — meet me at the station 🙂", ROT13)) == ROT13
+
+    @pytest.mark.parametrize("text", ["", "   \n", "東京 🙂"])
+    def test_returns_none_without_printable_ascii(self, text):
+        assert detect_cipher(text) is None
+
+    def test_histograms_count_one_sample(self):
+        text = "ab" * ANALYSIS_SAMPLE_SIZE
+
+        assert histogram(text) == {"a": ANALYSIS_SAMPLE_SIZE // 2, "b": ANALYSIS_SAMPLE_SIZE // 2}
+        assert bigram_histogram(text) == {
+            "ab": ANALYSIS_SAMPLE_SIZE // 2,
+            "ba": ANALYSIS_SAMPLE_SIZE // 2 - 1,
+        }
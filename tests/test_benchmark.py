@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from src.benchmark import (
+    PAYLOADS,
+    BenchmarkResult,
+    compare_results,
+    compression_report,
+    default_engines,
+    load_results,
+    make_payload,
+    memory_report,
+    run_benchmarks,
+    save_results,
+)
+
+
+def result(engine="rot13", payload="ascii", size=10, mb_per_sec=100.0):
+    return BenchmarkResult(
+        engine=engine,
+        payload=payload,
+        size=size,
+        seconds=size / (mb_per_sec * 1_000_000),
+        chars_per_sec=mb_per_sec * 1_000_000,
+        mb_per_sec=mb_per_sec,
+    )
+
+
+class TestBenchmark:
+    @pytest.mark.parametrize("kind", list(PAYLOADS))
+    @pytest.mark.parametrize("size", [0, 10, 1000])
+    def test_make_payload_has_requested_length(self, kind, size):
+        assert len(make_payload(kind, size)) == size
+
+    def test_run_benchmarks_measures_every_combination(self):
+        engines = default_engines()
+
+        results = run_benchmarks(
+            engines, payloads=["ascii", "non_ascii"], sizes=[10, 100], min_time=0, repeat=1
+        )
+
+        assert len(results) == len(engines) * 4
+        assert all(r.seconds > 0 and r.mb_per_sec > 0 for r in results)
+
+    def test_non_ascii_throughput_counts_utf8_bytes(self):
+        engines = {"rot13": default_engines()["rot13"]}
+
+        (measured,) = run_benchmarks(
+            engines, payloads=["non_ascii"], sizes=[100], min_time=0, repeat=1
+        )
+
+        assert measured.mb_per_sec > measured.chars_per_sec / 1_000_000
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        filename = tmp_path / "results.json"
+        results = [result(), result(engine="rot47")]
+
+        save_results(str(filename), results)
+
+        assert load_results(str(filename)) == results
+        assert "python" in json.loads(filename.read_text())
+
+    def test_compare_flags_only_slowdowns_beyond_tolerance(self):
+        baseline = [result(size=10), result(size=100), result(size=1000)]
+        current = [
+            result(size=10, mb_per_sec=95.0),
+            result(size=100, mb_per_sec=80.0),
+            result(size=1000, mb_per_sec=150.0),
+            result(size=5000, mb_per_sec=1.0),
+        ]
+
+        regressions = compare_results(current, baseline, tolerance=0.1)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("rot13 ascii 100:")
+
+    def test_memory_report_shows_compact_layouts_are_smaller(self):
+        report = memory_report(entries=2000)
+
+        assert report["list[Text]"] < report["list[dataclass]"]
+        assert report["ColumnarBuffer"] < report["list[Text]"]
+
+    def test_compression_report_covers_each_codec(self):
+        results = compression_report(entries=200, level=1)
+
+        assert [r.codec for r in results] == ["none", ".gz", ".bz2", ".xz", ".zz"]
+        assert all(r.size < results[0].size and r.ratio > 1 for r in results[1:])
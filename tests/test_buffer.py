@@ -1,6 +1,6 @@
 import pytest
 
-from src.buffer import Buffer
+from src.buffer import Buffer, ColumnarBuffer
 from src.exceptions import EmptyBufferError
 from src.text import Text
 
@@ -10,14 +10,19 @@ def sample_text():
     return Text(text="Dominik", rot_type="rot13", status="decrypted")
 
 
+@pytest.fixture(params=[Buffer, ColumnarBuffer])
+def buffer_cls(request):
+    return request.param
+
+
 @pytest.fixture
-def empty_buffer():
-    return Buffer()
+def empty_buffer(buffer_cls):
+    return buffer_cls()
 
 
 @pytest.fixture
-def filled_buffer(sample_text):
-    buffer = Buffer()
+def filled_buffer(buffer_cls, sample_text):
+    buffer = buffer_cls()
     buffer.add(sample_text)
     return buffer
 
@@ -62,3 +67,333 @@ class TestBuffer:
         data = filled_buffer.to_dict_list()
         empty_buffer.from_dict_list(data)
         assert empty_buffer.texts == filled_buffer.texts
+
+    def test_len_returns_number_of_entries(self, empty_buffer, filled_buffer):
+        assert len(empty_buffer) == 0
+        assert len(filled_buffer) == 1
+
+    def test_find_filters_by_status_and_rot_type(self, empty_buffer):
+        empty_buffer.add(Text(text="a", rot_type="", status="decrypted"))
+        empty_buffer.add(Text(text="b", rot_type="rot13", status="encrypted"))
+        empty_buffer.add(Text(text="c", rot_type="rot47", status="encrypted"))
+
+        assert empty_buffer.find(status="encrypted") == [1, 2]
+        assert empty_buffer.find(rot_type="rot47") == [2]
+        assert empty_buffer.find(status="encrypted", rot_type="rot13") == [1]
+        assert empty_buffer.find() == [0, 1, 2]
+
+    def test_find_unknown_value_returns_no_indices(self, filled_buffer):
+        assert filled_buffer.find(status="missing") == []
+        assert filled_buffer.find(rot_type="missing") == []
+
+    def test_iterates_texts_in_order(self, empty_buffer):
+        texts = [Text(text=str(i), rot_type="", status="decrypted") for i in range(3)]
+        for text_obj in texts:
+            empty_buffer.add(text_obj)
+
+        assert list(empty_buffer) == texts
+
+    def test_page_strings_returns_only_requested_page(self, empty_buffer):
+        for i in range(5):
+            empty_buffer.add(Text(text=f"t{i}", rot_type="", status="decrypted"))
+
+        page = list(empty_buffer.page_strings(page=1, page_size=2))
+
+        assert page == ["3. t2 - rot type: , decrypted", "4. t3 - rot type: , decrypted"]
+        assert list(empty_buffer.page_strings(page=3, page_size=2)) == []
+
+    def test_page_strings_truncates_long_texts(self, empty_buffer):
+        empty_buffer.add(Text(text="abcdefghij", rot_type="rot13", status="encrypted"))
+        empty_buffer.add(Text(text="abc", rot_type="rot13", status="encrypted"))
+
+        page = list(empty_buffer.page_strings(page=0, page_size=10, preview_width=6))
+
+        assert page == [
+            "1. abc... - rot type: rot13, encrypted",
+            "2. abc - rot type: rot13, encrypted",
+        ]
+
+    def test_page_strings_loads_only_page_entries(self, empty_buffer, monkeypatch):
+        for i in range(100):
+            empty_buffer.add(Text(text=str(i), rot_type="", status="decrypted"))
+        loaded = []
+        original = empty_buffer._load
+
+        def counting_load(index):
+            loaded.append(index)
+            return original(index)
+
+        monkeypatch.setattr(empty_buffer, "_load", counting_load)
+
+        lines = empty_buffer.page_strings(page=2, page_size=3)
+
+        assert loaded == []
+        assert len(list(lines)) == 3
+        assert loaded == [6, 7, 8]
+
+    def test_page_strings_raise_when_buffer_is_empty(self, empty_buffer):
+        with pytest.raises(EmptyBufferError):
+            empty_buffer.page_strings(page=0, page_size=10)
+
+    @pytest.mark.parametrize(("entries", "pages"), [(0, 0), (1, 1), (10, 1), (11, 2)])
+    def test_page_count_rounds_up(self, empty_buffer, entries, pages):
+        for i in range(entries):
+            empty_buffer.add(Text(text=str(i), rot_type="", status="decrypted"))
+
+        assert empty_buffer.page_count(page_size=10) == pages
+
+    def test_add_and_update_mark_entries_dirty(self, empty_buffer):
+        empty_buffer.add(Text(text="a", rot_type="", status="decrypted"))
+        empty_buffer.add(Text(text="b", rot_type="", status="decrypted"))
+        empty_buffer.mark_clean()
+
+        empty_buffer.update(1, Text(text="o", rot_type="rot13", status="encrypted"))
+
+        assert empty_buffer.dirty_records() == [
+            (1, {"text": "o", "rot_type": "rot13", "status": "encrypted"})
+        ]
+
+    def test_from_dict_list_leaves_buffer_clean(self, empty_buffer):
+        empty_buffer.add(Text(text="a", rot_type="", status="decrypted"))
+
+        empty_buffer.from_dict_list([{"text": "b", "rot_type": "", "status": "decrypted"}])
+
+        assert empty_buffer.dirty_records() == []
+
+    def test_from_dict_list_consumes_generator(self, empty_buffer):
+        records = ({"text": str(i), "rot_type": "", "status": "decrypted"} for i in range(3))
+
+        empty_buffer.from_dict_list(records)
+
+        assert [t.text for t in empty_buffer] == ["0", "1", "2"]
+
+    def test_from_dict_list_keeps_entries_when_source_fails(self, filled_buffer, sample_text):
+        def records():
+            yield {"text": "new", "rot_type": "", "status": "decrypted"}
+            raise ValueError("broken file")
+
+        with pytest.raises(ValueError):
+            filled_buffer.from_dict_list(records())
+
+        assert filled_buffer.texts == [sample_text]
+
+    def test_replay_applies_appends_and_overwrites(self, filled_buffer):
+        filled_buffer.replay(
+            [
+                (0, {"text": "a", "rot_type": "", "status": "decrypted"}),
+                (1, {"text": "b", "rot_type": "", "status": "decrypted"}),
+                (0, {"text": "n", "rot_type": "rot13", "status": "encrypted"}),
+            ]
+        )
+
+        assert filled_buffer.texts == [
+            Text(text="n", rot_type="rot13", status="encrypted"),
+            Text(text="b", rot_type="", status="decrypted"),
+        ]
+        assert filled_buffer.indices_by_status("encrypted") == [0]
+        assert filled_buffer.dirty_records() == []
+
+    def test_replay_rejects_out_of_order_record(self, filled_buffer, sample_text):
+        with pytest.raises(ValueError):
+            filled_buffer.replay([(2, {"text": "a", "rot_type": "", "status": "decrypted"})])
+
+        assert filled_buffer.texts == [sample_text]
+
+
+class TestColumnarBuffer:
+    def test_stores_repeated_values_once(self):
+        buffer = ColumnarBuffer()
+        for i in range(100):
+            buffer.add(Text(text=str(i), rot_type="rot13", status="encrypted"))
+
+        assert buffer.values == ["rot13", "encrypted"]
+        assert list(buffer.rot_type_codes) == [0] * 100
+        assert list(buffer.status_codes) == [1] * 100
+
+    def test_from_dict_list_replaces_columns(self):
+        buffer = ColumnarBuffer()
+        buffer.add(Text(text="old", rot_type="", status="decrypted"))
+
+        buffer.from_dict_list([{"text": "new", "rot_type": "rot47", "status": "encrypted"}])
+
+        assert buffer.texts == [Text(text="new", rot_type="rot47", status="encrypted")]
+        assert len(buffer) == 1
+
+
+class TestBufferIndexes:
+    @pytest.fixture
+    def buffer(self, buffer_cls):
+        buffer = buffer_cls()
+        buffer.add(Text(text="a", rot_type="", status="decrypted"))
+        buffer.add(Text(text="b", rot_type="rot13", status="encrypted"))
+        buffer.add(Text(text="c", rot_type="rot47", status="encrypted"))
+        buffer.add(Text(text="d", rot_type="rot13", status="encrypted"))
+        return buffer
+
+    def test_add_indexes_status_and_rot_type(self, buffer):
+        assert buffer.indices_by_status("encrypted") == [1, 2, 3]
+        assert buffer.indices_by_rot_type("rot13") == [1, 3]
+        assert buffer.indices_by_rot_type("rot99") == []
+
+    def test_update_moves_entry_between_indexes(self, buffer):
+        buffer.update(1, Text(text="b", rot_type="", status="decrypted"))
+
+        assert buffer.indices_by_status("encrypted") == [2, 3]
+        assert buffer.indices_by_status("decrypted") == [0, 1]
+        assert buffer.indices_by_rot_type("rot13") == [3]
+
+    def test_update_with_negative_index_reindexes_last_entry(self, buffer):
+        buffer.update(-1, Text(text="d", rot_type="rot47", status="encrypted"))
+
+        assert buffer.indices_by_rot_type("rot47") == [2, 3]
+        assert buffer.indices_by_rot_type("rot13") == [1]
+
+    @pytest.mark.parametrize("index", [-5, 4])
+    def test_update_out_of_range_leaves_buffer_unchanged(self, buffer, index):
+        with pytest.raises(IndexError):
+            buffer.update(index, Text(text="X", rot_type="rot13", status="encrypted"))
+
+        assert [text_obj.text for text_obj in buffer] == ["a", "b", "c", "d"]
+        assert buffer.indices_by_status("encrypted") == [1, 2, 3]
+        assert buffer.indices_by_rot_type("rot13") == [1, 3]
+
+    def test_from_dict_list_rebuilds_indexes(self, buffer):
+        buffer.from_dict_list([{"text": "x", "rot_type": "rot47", "status": "encrypted"}])
+
+        assert buffer.indices_by_status("encrypted") == [0]
+        assert buffer.indices_by_status("decrypted") == []
+        assert buffer.indices_by_rot_type("rot47") == [0]
+
+    def test_find_intersects_indexes(self, buffer):
+        assert buffer.find(status="encrypted", rot_type="rot13") == [1, 3]
+        assert buffer.find(status="decrypted", rot_type="rot13") == []
+
+
+class TestBufferHistory:
+    @pytest.fixture
+    def buffer(self, buffer_cls):
+        buffer = buffer_cls()
+        buffer.add(Text(text="a", rot_type="", status="decrypted"))
+        buffer.add(Text(text="b", rot_type="", status="decrypted"))
+        return buffer
+
+    def test_undo_and_redo_update(self, buffer):
+        buffer.update(0, Text(text="n", rot_type="rot13", status="encrypted"))
+
+        assert buffer.undo() == [0]
+        assert buffer.get(0) == Text(text="a", rot_type="", status="decrypted")
+        assert buffer.indices_by_rot_type("rot13") == []
+
+        assert buffer.redo() == [0]
+        assert buffer.get(0) == Text(text="n", rot_type="rot13", status="encrypted")
+        assert buffer.indices_by_rot_type("rot13") == [0]
+
+    def test_undo_add_removes_entry(self, buffer):
+        assert buffer.undo() == [1]
+
+        assert [t.text for t in buffer] == ["a"]
+        assert buffer.indices_by_status("decrypted") == [0]
+        assert buffer.shrunk
+
+        buffer.redo()
+        assert [t.text for t in buffer] == ["a", "b"]
+
+    def test_grouped_changes_are_undone_together(self, buffer):
+        with buffer.history.group():
+            buffer.update(0, Text(text="n", rot_type="rot13", status="encrypted"))
+            buffer.update(1, Text(text="o", rot_type="rot13", status="encrypted"))
+            buffer.update(0, Text(text="a", rot_type="rot26", status="encrypted"))
+
+        assert buffer.undo() == [0, 1]
+        assert [t.text for t in buffer] == ["a", "b"]
+        assert buffer.indices_by_status("encrypted") == []
+
+    def test_new_change_clears_redo(self, buffer):
+        buffer.update(0, Text(text="n", rot_type="rot13", status="encrypted"))
+        buffer.undo()
+        buffer.update(1, Text(text="o", rot_type="rot13", status="encrypted"))
+
+        assert buffer.redo() == []
+        assert buffer.get(0).text == "a"
+
+    def test_nothing_to_undo_returns_empty_list(self, buffer_cls):
+        assert buffer_cls().undo() == []
+
+    def test_loading_clears_history(self, buffer):
+        buffer.from_dict_list([{"text": "x", "rot_type": "", "status": "decrypted"}])
+
+        assert buffer.undo() == []
+        assert [t.text for t in buffer] == ["x"]
+
+
+class CountingSource:
+    def __init__(self, records):
+        self.records = records
+        self.decoded = []
+
+    def __len__(self):
+        return len(self.records)
+
+    def record(self, index):
+        self.decoded.append(index)
+        return dict(self.records[index])
+
+    def meta(self, index):
+        return self.records[index]["rot_type"], self.records[index]["status"]
+
+
+class TestBufferFromSource:
+    @pytest.fixture
+    def source(self):
+        return CountingSource(
+            [
+                {"text": "Uryyb", "rot_type": "rot13", "status": "encrypted"},
+                {"text": "World", "rot_type": "", "status": "decrypted"},
+                {"text": "w6==@", "rot_type": "rot47", "status": "encrypted"},
+            ]
+        )
+
+    def test_get_decodes_only_requested_entry(self, source):
+        buffer = Buffer()
+        buffer.from_source(source)
+
+        assert buffer.get(1) == Text(text="World", rot_type="", status="decrypted")
+        assert source.decoded == [1]
+        assert len(buffer) == 3
+
+    def test_indexes_are_built_without_decoding(self, source):
+        buffer = Buffer()
+        buffer.from_source(source)
+
+        assert buffer.indices_by_status("encrypted") == [0, 2]
+        assert buffer.indices_by_rot_type("rot47") == [2]
+        assert source.decoded == []
+
+    def test_update_and_add_overlay_source(self, source):
+        buffer = Buffer()
+        buffer.from_source(source)
+
+        buffer.update(0, Text(text="Hello", rot_type="", status="decrypted"))
+        buffer.add(Text(text="New", rot_type="", status="decrypted"))
+        buffer.update(-1, Text(text="Newer", rot_type="", status="decrypted"))
+
+        assert [t.text for t in buffer] == ["Hello", "World", "w6==@", "Newer"]
+        assert buffer.indices_by_status("decrypted") == [0, 1, 3]
+        assert [index for index, _ in buffer.dirty_records()] == [0, 3]
+
+    def test_undo_removes_entry_added_over_source(self, source):
+        buffer = Buffer()
+        buffer.from_source(source)
+        buffer.add(Text(text="New", rot_type="", status="decrypted"))
+
+        buffer.undo()
+
+        assert len(buffer) == 3
+        assert buffer.dirty_records() == []
+
+    def test_columnar_buffer_loads_source_eagerly(self, source):
+        buffer = ColumnarBuffer()
+        buffer.from_source(source)
+
+        assert buffer.get(2) == Text(text="w6==@", rot_type="rot47", status="encrypted")
+        assert source.decoded == [0, 1, 2]
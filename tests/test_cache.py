@@ -0,0 +1,70 @@
+import sys
+
+import pytest
+
+from src.cache import ResultCache
+
+
+def key(text):
+    return ("rot13", "encrypted", text)
+
+
+class TestResultCache:
+    def test_get_counts_hits_and_misses(self):
+        cache = ResultCache()
+
+        assert cache.get(key("Hello")) is None
+        cache.put(key("Hello"), "Uryyb")
+
+        assert cache.get(key("Hello")) == "Uryyb"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResultCache(max_entries=2)
+        cache.put(key("a"), "n")
+        cache.put(key("b"), "o")
+        cache.get(key("a"))
+
+        cache.put(key("c"), "p")
+
+        assert cache.get(key("b")) is None
+        assert cache.get(key("a")) == "n"
+        assert (len(cache), cache.evictions) == (2, 1)
+
+    def test_byte_limit_evicts_and_skips_oversized_entries(self):
+        entry_size = sys.getsizeof("a" * 100) * 2
+        cache = ResultCache(max_bytes=entry_size * 2)
+
+        for text in ("a", "b", "c"):
+            cache.put(key(text * 100), text * 100)
+        cache.put(key("d" * 1000), "d" * 1000)
+
+        assert len(cache) == 2
+        assert cache.size_bytes == entry_size * 2
+        assert cache.get(key("a" * 100)) is None
+
+    def test_replacing_entry_keeps_byte_count(self):
+        cache = ResultCache()
+        cache.put(key("a"), "b" * 10)
+        cache.put(key("a"), "n")
+
+        assert cache.size_bytes == sys.getsizeof("a") + sys.getsizeof("n")
+
+    def test_zero_entries_disables_cache(self):
+        cache = ResultCache(max_entries=0)
+        cache.put(key("a"), "n")
+
+        assert len(cache) == 0
+
+    def test_clear_keeps_counters(self):
+        cache = ResultCache()
+        cache.put(key("a"), "n")
+        cache.get(key("a"))
+
+        cache.clear()
+
+        assert (len(cache), cache.size_bytes, cache.hits) == (0, 0, 1)
+
+    def test_negative_limits_raise(self):
+        with pytest.raises(ValueError):
+            ResultCache(max_entries=-1)
@@ -1,9 +1,36 @@
+import pickle
 from unittest.mock import Mock
 
 import pytest
 
-from src.cipher import Cipher, CipherRot13, CipherRot47, cipher_factory
-from src.constants import ROT13, ROT47, STATUS_DECRYPTED, STATUS_ENCRYPTED
+from src.cipher import (
+    ROT8000_RANGES,
+    Cipher,
+    CipherCaesar,
+    CipherRot13,
+    CipherRot18,
+    CipherRot47,
+    CipherRot8000,
+    CompositeCipher,
+    FusedCipher,
+    RangeCipher,
+    RangeTable,
+    cipher_factory,
+    compile_tables,
+    compose,
+    fuse_tables,
+    register_cipher,
+)
+from src.constants import (
+    ALPHABET_DIGITS,
+    ALPHABET_LETTERS,
+    ALPHABET_PRINTABLE,
+    ROT13,
+    ROT47,
+    ROT8000,
+    STATUS_DECRYPTED,
+    STATUS_ENCRYPTED,
+)
 from src.exceptions import UnsupportedCipherError
 from src.text import Text
 
@@ -106,6 +133,20 @@ class TestCipherRot13:
 
         assert result == s
 
+    def test_rot13_table_matches_arithmetic_rotation(self, cipher_rot13):
+        s = "".join(chr(code) for code in range(0x250))
+        expected = "".join(
+            chr((ord(c) - ord("a") + 13) % 26 + ord("a"))
+            if "a" <= c <= "z"
+            else chr((ord(c) - ord("A") + 13) % 26 + ord("A"))
+            if "A" <= c <= "Z"
+            else c
+            for c in s
+        )
+        result = cipher_rot13.cipher(text_obj=Text(text=s, rot_type=ROT13, status=STATUS_DECRYPTED))
+
+        assert result == expected
+
 
 class TestCipherRot47:
     def test_rot47_double_encrypt_returns_original(self, cipher_rot47):
@@ -125,6 +166,267 @@ class TestCipherRot47:
 
         assert result == s
 
+    def test_rot47_table_matches_arithmetic_rotation(self, cipher_rot47):
+        s = "".join(chr(code) for code in range(0x250))
+        expected = "".join(
+            chr(33 + ((ord(c) - 33 + 47) % 94)) if 33 <= ord(c) <= 126 else c for c in s
+        )
+        result = cipher_rot47.cipher(text_obj=Text(text=s, rot_type=ROT47, status=STATUS_DECRYPTED))
+
+        assert result == expected
+
+
+class TestCipherCaesar:
+    @pytest.mark.parametrize(
+        ("shift", "alphabet", "plain", "expected"),
+        [
+            (3, ALPHABET_LETTERS, "Hello, xyz!", "Khoor, abc!"),
+            (-1, ALPHABET_LETTERS, "abc", "zab"),
+            (5, ALPHABET_DIGITS, "a0129", "a5674"),
+            (47, ALPHABET_PRINTABLE, "Hello", "w6==@"),
+        ],
+    )
+    def test_shifts_characters_of_alphabet(self, shift, alphabet, plain, expected):
+        cipher = CipherCaesar(shift=shift, alphabet=alphabet)
+
+        assert cipher.cipher(Text(text=plain, rot_type="", status=STATUS_DECRYPTED)) == expected
+        assert cipher.cipher_bytes(plain.encode()) == expected.encode()
+
+    def test_inverse_restores_original(self):
+        cipher = CipherCaesar(shift=3)
+        once = cipher.cipher(Text(text="Hello World", rot_type="", status=STATUS_DECRYPTED))
+
+        assert cipher.inverse().cipher(Text(text=once, rot_type="", status="")) == "Hello World"
+
+    def test_shift_is_normalized_to_alphabet_size(self):
+        assert CipherCaesar(shift=29).shift == 3
+        assert CipherCaesar(shift=-3, alphabet=ALPHABET_DIGITS).shift == 7
+
+    def test_equivalent_shifts_share_compiled_tables(self):
+        assert CipherCaesar(shift=29).table is CipherCaesar(shift=3).table
+
+    def test_compiled_tables_are_cached(self):
+        compile_tables.cache_clear()
+        CipherCaesar(shift=4)
+        CipherCaesar(shift=4)
+
+        assert compile_tables.cache_info().hits >= 1
+
+    def test_rejects_unknown_alphabet(self):
+        with pytest.raises(UnsupportedCipherError):
+            CipherCaesar(shift=3, alphabet="runes")
+
+    def test_involutions_are_their_own_inverse(self, cipher_rot13, cipher_rot47):
+        assert cipher_rot13.inverse() is cipher_rot13
+        assert cipher_rot47.inverse() is cipher_rot47
+
+    def test_rot18_rotates_letters_by_13_and_digits_by_5(self):
+        cipher = CipherRot18()
+
+        assert cipher.cipher(Text(text="Hello 2025", rot_type="", status="")) == "Uryyb 7570"
+        assert cipher.cipher_bytes(b"Hello 2025") == b"Uryyb 7570"
+
+
+def bmp_text():
+    return "".join(chr(code) for code in range(0x10000) if not 0xD800 <= code <= 0xDFFF)
+
+
+class TestCipherRot8000:
+    def test_round_trips_every_bmp_character(self):
+        cipher = CipherRot8000()
+        text = bmp_text()
+
+        encrypted = cipher.cipher(Text(text=text, rot_type="", status=""))
+
+        assert cipher.inverse() is cipher
+        assert cipher.cipher(Text(text=encrypted, rot_type="", status="")) == text
+        assert encrypted != text
+
+    def test_rotates_multilingual_text_and_keeps_whitespace(self):
+        cipher = CipherRot8000()
+        text = "Zażółć gęślą\tjaźń\n東京 🙂"
+
+        encrypted = cipher.cipher(Text(text=text, rot_type="", status=""))
+
+        assert [i for i, char in enumerate(encrypted) if char == text[i]] == [6, 12, 17, 20, 21]
+        assert encrypted.encode("utf-8")
+
+    def test_output_stays_inside_valid_ranges(self):
+        encrypted = CipherRot8000().cipher(Text(text=bmp_text(), rot_type="", status=""))
+
+        moved = [char for char, plain in zip(encrypted, bmp_text()) if char != plain]
+        assert all(ROT8000_RANGES.position(ord(char)) is not None for char in moved)
+        assert len(moved) == ROT8000_RANGES.count
+
+    def test_table_is_filled_lazily(self):
+        cipher = CipherRot8000()
+
+        cipher.cipher(Text(text="abcabc", rot_type="", status=""))
+
+        assert sorted(cipher.table) == [ord("a"), ord("b"), ord("c")]
+
+    def test_pickled_cipher_drops_cache(self):
+        cipher = CipherRot8000()
+        cipher.cipher(Text(text="abc", rot_type="", status=""))
+
+        restored = pickle.loads(pickle.dumps(cipher))
+
+        assert len(restored.table) == 0
+        assert restored.cipher(Text(text="abc", rot_type="", status="")) == cipher.cipher(
+            Text(text="abc", rot_type="", status="")
+        )
+
+    def test_factory_returns_text_only_cipher(self):
+        cipher = cipher_factory(ROT8000)
+
+        assert isinstance(cipher, CipherRot8000)
+        with pytest.raises(UnsupportedCipherError):
+            cipher.cipher_bytes(b"abc")
+
+    def test_range_table_maps_positions_both_ways(self):
+        ranges = RangeTable(((0, 9), (20, 29)), size=40)
+
+        assert (ranges.count, ranges.starts, ranges.ends) == (20, [10, 30], [19, 39])
+        assert [ranges.position(code) for code in (5, 10, 19, 25, 30, 39)] == [
+            None,
+            0,
+            9,
+            None,
+            10,
+            19,
+        ]
+        assert [ranges.code(position) for position in range(20)] == [
+            *range(10, 20),
+            *range(30, 40),
+        ]
+
+    def test_range_cipher_with_other_shift_has_separate_inverse(self):
+        cipher = RangeCipher(RangeTable(((0, 96),), size=123), shift=3)
+
+        assert cipher.cipher(Text(text="abz", rot_type="", status="")) == "dec"
+        assert cipher.inverse() is not cipher
+        assert cipher.inverse().cipher(Text(text="dec", rot_type="", status="")) == "abz"
+
+
+def apply_each(rot_types, text):
+    for rot_type in rot_types:
+        text = cipher_factory(rot_type).cipher(Text(text=text, rot_type="", status=""))
+    return text
+
+
+class TestCipherComposition:
+    @pytest.mark.parametrize(
+        "rot_types",
+        [(ROT13, ROT47), (ROT47, ROT13), ("caesar:3", "rot5", ROT47, "caesar:7:printable")],
+    )
+    def test_fused_chain_matches_applying_each_cipher(self, rot_types):
+        text = "Hello World 2025 ~!@ Zażółć"
+        cipher = cipher_factory("+".join(rot_types))
+
+        assert isinstance(cipher, FusedCipher)
+        assert cipher.cipher(Text(text=text, rot_type="", status="")) == apply_each(rot_types, text)
+        assert cipher.cipher_bytes(text.encode()) == apply_each(rot_types, text).encode()
+
+    def test_inverse_undoes_chain(self):
+        cipher = cipher_factory("rot13+rot47+caesar:3")
+
+        encrypted = cipher.cipher(Text(text="Hello World!", rot_type="", status=""))
+
+        assert cipher.inverse().cipher(Text(text=encrypted, rot_type="", status="")) == (
+            "Hello World!"
+        )
+        assert cipher.inverse() is cipher.inverse()
+
+    def test_chain_of_disjoint_involutions_is_its_own_inverse(self):
+        cipher = cipher_factory("rot13+rot5")
+
+        assert cipher.inverse() is cipher
+        assert cipher.table == CipherRot18.table
+
+    def test_text_only_ciphers_split_the_chain(self):
+        cipher = cipher_factory(f"{ROT13}+{ROT47}+{ROT8000}")
+        text = "Hello świecie"
+
+        encrypted = cipher.cipher(Text(text=text, rot_type="", status=""))
+
+        assert isinstance(cipher, CompositeCipher)
+        assert [type(step) for step in cipher.steps] == [FusedCipher, CipherRot8000]
+        assert encrypted == apply_each((ROT13, ROT47, ROT8000), text)
+        assert cipher.inverse().cipher(Text(text=encrypted, rot_type="", status="")) == text
+        with pytest.raises(UnsupportedCipherError):
+            cipher.cipher_bytes(b"Hello")
+
+    def test_fuse_tables_drops_identity_mappings(self):
+        assert fuse_tables([CipherRot13.table, CipherRot13.table]) == {}
+        assert fuse_tables([{1: 2, 2: 1}, {2: 3, 3: 2}]) == {1: 3, 2: 1, 3: 2}
+
+    @pytest.mark.parametrize("rot_type", ["rot13+", "+rot13", "rot13+rot99"])
+    def test_rejects_chain_with_unknown_part(self, rot_type):
+        with pytest.raises(UnsupportedCipherError):
+            cipher_factory(rot_type)
+
+    def test_compose_rejects_empty_chain(self):
+        with pytest.raises(UnsupportedCipherError):
+            compose([])
+
+
+class TestCipherBytes:
+    def test_base_cipher_rejects_byte_input(self):
+        class DummyCipher(Cipher):
+            def cipher(self, text_obj):
+                return text_obj.text
+
+        with pytest.raises(UnsupportedCipherError):
+            DummyCipher().cipher_bytes(b"Hello")
+
+    @pytest.mark.parametrize(
+        ("cipher_cls", "expected"),
+        [(CipherRot13, b"Uryyb"), (CipherRot47, b"w6==@")],
+    )
+    def test_bytes_input_returns_new_bytes(self, cipher_cls, expected):
+        data = b"Hello"
+        result = cipher_cls().cipher_bytes(data)
+
+        assert result == expected
+        assert data == b"Hello"
+
+    def test_bytearray_is_transformed_in_place(self, cipher_rot13):
+        data = bytearray(b"Hello")
+        result = cipher_rot13.cipher_bytes(data)
+
+        assert result is data
+        assert data == bytearray(b"Uryyb")
+
+    def test_writable_memoryview_is_transformed_in_place(self, cipher_rot47):
+        data = bytearray(b"xxHelloxx")
+        view = memoryview(data)[2:7]
+        result = cipher_rot47.cipher_bytes(view)
+
+        assert result is view
+        assert data == bytearray(b"xxw6==@xx")
+
+    def test_readonly_memoryview_returns_bytes(self, cipher_rot13):
+        view = memoryview(b"Hello")
+        result = cipher_rot13.cipher_bytes(view)
+
+        assert result == b"Uryyb"
+        assert isinstance(result, bytes)
+
+    @pytest.mark.parametrize("cipher_cls", [CipherRot13, CipherRot47])
+    def test_bytes_match_text_cipher_for_utf8(self, cipher_cls):
+        s = "Zażółć gęślą jaźń! 🙂 ~>@ 123"
+        cipher = cipher_cls()
+        expected = cipher.cipher(Text(text=s, rot_type="", status=STATUS_DECRYPTED))
+
+        assert cipher.cipher_bytes(s.encode()).decode() == expected
+
+    def test_in_place_transform_spans_multiple_chunks(self, monkeypatch, cipher_rot13):
+        monkeypatch.setattr("src.cipher.BYTES_CHUNK_SIZE", 3)
+        data = bytearray(b"Hello World")
+        cipher_rot13.cipher_bytes(data)
+
+        assert data == bytearray(b"Uryyb Jbeyq")
+
 
 class TestCipherFactory:
     def test_returns_cipherrot13_when_rot13_given(self):
@@ -140,3 +442,80 @@ class TestCipherFactory:
     def test_raises_error_when_rot_type_is_invalid(self):
         with pytest.raises(UnsupportedCipherError):
             cipher_factory("rot99")
+
+    @pytest.mark.parametrize(
+        ("rot_type", "plain", "expected"),
+        [
+            ("rot5", "Hello 2025", "Hello 7570"),
+            ("rot18", "Hello 2025", "Uryyb 7570"),
+            ("rot1", "Hello", "Ifmmp"),
+            ("caesar:3", "Hello", "Khoor"),
+            ("caesar:-3", "Khoor", "Hello"),
+            ("caesar:2:digits", "a19", "a31"),
+            ("caesar:1:printable", "a~", "b!"),
+        ],
+    )
+    def test_resolves_parameterized_rot_types(self, rot_type, plain, expected):
+        instance = cipher_factory(rot_type)
+
+        assert instance.cipher(Text(text=plain, rot_type=rot_type, status="")) == expected
+
+    @pytest.mark.parametrize("rot_type", ["caesar:", "caesar:x", "caesar:3:runes", "rot0", "rot"])
+    def test_raises_error_for_malformed_parameterized_rot_type(self, rot_type):
+        with pytest.raises(UnsupportedCipherError):
+            cipher_factory(rot_type)
+
+    def test_returns_shared_instance_for_repeated_lookups(self):
+        assert cipher_factory(ROT13) is cipher_factory(ROT13)
+        assert cipher_factory("caesar:3") is cipher_factory("caesar:3")
+
+    def test_register_cipher_makes_custom_cipher_available(self, monkeypatch):
+        monkeypatch.setattr("src.cipher._factories", {})
+        monkeypatch.setattr("src.cipher._instances", {})
+        created = []
+
+        @register_cipher("upper")
+        class UpperCipher(Cipher):
+            def __init__(self):
+                created.append(self)
+
+            def cipher(self, text_obj):
+                return text_obj.text.upper()
+
+        assert created == []
+
+        instance = cipher_factory("upper")
+
+        assert isinstance(instance, UpperCipher)
+        assert cipher_factory("upper") is instance
+        assert len(created) == 1
+
+    def test_loads_ciphers_from_entry_points_lazily(self, monkeypatch):
+        loaded = []
+
+        class FakeEntryPoint:
+            name = "plugin"
+
+            def load(self):
+                loaded.append(self.name)
+                return CipherRot13
+
+        monkeypatch.setattr("src.cipher._factories", {})
+        monkeypatch.setattr("src.cipher._instances", {})
+        monkeypatch.setattr("src.cipher._entry_points_loaded", False)
+        monkeypatch.setattr("importlib.metadata.entry_points", lambda group: [FakeEntryPoint()])
+
+        with pytest.raises(UnsupportedCipherError):
+            cipher_factory("rot99")
+
+        assert loaded == []
+        assert isinstance(cipher_factory("plugin"), CipherRot13)
+        assert loaded == ["plugin"]
+
+    def test_falls_back_to_pure_python_without_numpy(self, monkeypatch):
+        monkeypatch.setattr("src.cipher_numpy.np", None)
+        monkeypatch.setattr("src.cipher._large_instances", {})
+
+        instance = cipher_factory(ROT13, size=10**9)
+
+        assert isinstance(instance, CipherRot13)
@@ -0,0 +1,53 @@
+import pytest
+
+from src.cipher import CipherCaesar, CipherRot13, CipherRot47, cipher_factory
+from src.constants import NUMPY_THRESHOLD, ROT13, STATUS_DECRYPTED
+from src.text import Text
+
+np = pytest.importorskip("numpy")
+
+from src.cipher_numpy import NumpyCipher, numpy_cipher  # noqa: E402
+
+
+class TestNumpyCipher:
+    @pytest.mark.parametrize("cipher_cls", [CipherRot13, CipherRot47])
+    @pytest.mark.parametrize("text", ["Hello World ~>@", "Zażółć gęślą jaźń 🙂 ~>@", ""])
+    def test_matches_pure_python_cipher(self, cipher_cls, text):
+        text_obj = Text(text=text, rot_type="", status=STATUS_DECRYPTED)
+        inner = cipher_cls()
+
+        assert NumpyCipher(inner).cipher(text_obj) == inner.cipher(text_obj)
+
+    def test_lone_surrogate_falls_back_to_pure_python(self):
+        text_obj = Text(text="Hello \ud800", rot_type="", status=STATUS_DECRYPTED)
+
+        assert NumpyCipher(CipherRot13()).cipher(text_obj) == "Uryyb \ud800"
+
+    def test_cipher_bytes_keeps_in_place_contract(self):
+        data = bytearray(b"Hello")
+
+        assert NumpyCipher(CipherRot13()).cipher_bytes(data) is data
+        assert data == bytearray(b"Uryyb")
+
+    def test_inverse_wraps_inner_inverse(self):
+        inverse = NumpyCipher(CipherCaesar(shift=3)).inverse()
+
+        assert isinstance(inverse, NumpyCipher)
+        assert inverse.cipher(Text(text="Khoor ą", rot_type="", status="")) == "Hello ą"
+
+    def test_numpy_cipher_wraps_only_table_ciphers(self):
+        class Other:
+            pass
+
+        other = Other()
+
+        assert isinstance(numpy_cipher(CipherRot13()), NumpyCipher)
+        assert numpy_cipher(other) is other
+
+
+class TestCipherFactoryNumpy:
+    def test_selects_numpy_backend_above_threshold(self):
+        assert isinstance(cipher_factory(ROT13, size=NUMPY_THRESHOLD), NumpyCipher)
+
+    def test_keeps_pure_python_backend_below_threshold(self):
+        assert isinstance(cipher_factory(ROT13, size=NUMPY_THRESHOLD - 1), CipherRot13)
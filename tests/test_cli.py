@@ -0,0 +1,176 @@
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from src.cipher import Cipher, register_cipher
+from src.cli import main
+
+
+def set_stdin(monkeypatch, data):
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+
+
+class TestCli:
+    def test_encrypt_pipes_stdin_to_stdout(self, monkeypatch, capsysbinary):
+        set_stdin(monkeypatch, "Hello Zażółć 🙂\n".encode() * 3)
+
+        assert main(["encrypt", "--rot", "rot13", "--chunk-size", "4"]) == 0
+
+        assert capsysbinary.readouterr().out == "Uryyb Mnżółć 🙂\n".encode() * 3
+
+    def test_decrypt_inverts_caesar_shift(self, monkeypatch, capsysbinary):
+        set_stdin(monkeypatch, b"Khoor")
+
+        assert main(["decrypt", "--rot", "caesar:3"]) == 0
+
+        assert capsysbinary.readouterr().out == b"Hello"
+
+    def test_pipe_falls_back_to_text_for_text_only_ciphers(self, monkeypatch, capsysbinary):
+        monkeypatch.setattr("src.cipher._factories", {})
+        monkeypatch.setattr("src.cipher._instances", {})
+
+        @register_cipher("upper")
+        class UpperCipher(Cipher):
+            def cipher(self, text_obj):
+                return text_obj.text.upper()
+
+        set_stdin(monkeypatch, "zażółć".encode())
+
+        assert main(["encrypt", "--rot", "upper", "--chunk-size", "3"]) == 0
+
+        assert capsysbinary.readouterr().out == "ZAŻÓŁĆ".encode()
+
+    def test_rot8000_pipe_round_trips_multilingual_text(self, monkeypatch, capsysbinary):
+        set_stdin(monkeypatch, "Zażółć 東京".encode())
+        assert main(["encrypt", "--rot", "rot8000", "--chunk-size", "3"]) == 0
+        encrypted = capsysbinary.readouterr().out
+
+        set_stdin(monkeypatch, encrypted)
+        assert main(["decrypt", "--rot", "rot8000"]) == 0
+
+        assert encrypted != "Zażółć 東京".encode()
+        assert capsysbinary.readouterr().out == "Zażółć 東京".encode()
+
+    def test_pipe_reports_unsupported_cipher(self, monkeypatch, capsys):
+        set_stdin(monkeypatch, b"Hello")
+
+        assert main(["encrypt", "--rot", "rot99"]) == 1
+        assert "Error:" in capsys.readouterr().err
+
+    def test_detect_prints_most_likely_rot_types(self, monkeypatch, capsys):
+        set_stdin(monkeypatch, b"Wkh txlfn eurzq ira")
+
+        assert main(["detect", "--top", "2"]) == 0
+
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 2
+        assert lines[0].split()[0] == "caesar:3"
+
+    def test_detect_reports_text_without_ascii(self, monkeypatch, capsys):
+        set_stdin(monkeypatch, "東京".encode())
+
+        assert main(["detect"]) == 1
+        assert "Error:" in capsys.readouterr().err
+
+    def test_pipe_does_not_import_heavy_modules(self):
+        code = (
+            "import sys, io; sys.stdin = io.TextIOWrapper(io.BytesIO(b'a'));"
+            "from src.cli import main; main(['encrypt']);"
+            "print(sorted({'json', 'asyncio', 'src.menu', 'src.manager'} & set(sys.modules)))"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout == "n[]\n"
+
+    def test_convert_changes_buffer_file_format(self, tmp_path, capsys):
+        source = tmp_path / "session.json"
+        records = [{"text": "Uryyb", "rot_type": "rot13", "status": "encrypted"}]
+        source.write_text(json.dumps(records))
+
+        assert main(["convert", str(source), str(tmp_path / "session.jsonl.gz")]) == 0
+        assert main(["convert", str(tmp_path / "session.jsonl.gz"), str(tmp_path / "s.bin")]) == 0
+        assert main(["convert", str(tmp_path / "s.bin"), str(tmp_path / "out.json")]) == 0
+
+        assert json.loads((tmp_path / "out.json").read_text()) == records
+        assert "1 entries written" in capsys.readouterr().err
+
+    def test_stream_ciphers_input_into_output(self, tmp_path, capsys):
+        source = tmp_path / "input.txt"
+        target = tmp_path / "output.txt"
+        source.write_text("Hello")
+
+        code = main(["stream", str(source), str(target), "--rot", "rot47", "--chunk-size", "2"])
+
+        assert code == 0
+        assert target.read_text() == "w6==@"
+        assert "5 bytes written" in capsys.readouterr().err
+
+    def test_stream_reports_missing_input(self, tmp_path, capsys):
+        code = main(["stream", str(tmp_path / "missing"), str(tmp_path / "out")])
+
+        assert code == 1
+        assert "Error:" in capsys.readouterr().err
+
+    def test_stream_reports_unsupported_cipher(self, tmp_path, capsys):
+        source = tmp_path / "input.txt"
+        source.write_text("Hello")
+
+        code = main(["stream", str(source), str(tmp_path / "out"), "--rot", "rot99"])
+
+        assert code == 1
+        assert "Unsupported rot type: rot99" in capsys.readouterr().err
+
+    def test_inplace_rewrites_file_and_reports_bytes(self, tmp_path, capsys):
+        filename = tmp_path / "data.txt"
+        filename.write_text("Hello")
+
+        code = main(["inplace", str(filename), "--rot", "rot13"])
+
+        assert code == 0
+        assert filename.read_text() == "Uryyb"
+        assert "5 bytes processed" in capsys.readouterr().err
+
+    def test_bench_writes_results_and_passes_against_itself(self, tmp_path, capsys):
+        output = tmp_path / "bench.json"
+        args = ["bench", "--sizes", "10", "--payloads", "ascii", "--engines", "rot13"]
+        args += ["--min-time", "0", "--repeat", "1"]
+
+        assert main(args + ["--output", str(output)]) == 0
+        assert main(args + ["--compare", str(output), "--tolerance", "1"]) == 0
+        assert "rot13" in capsys.readouterr().out
+
+    def test_bench_rejects_unknown_engine(self, capsys):
+        code = main(["bench", "--sizes", "10", "--engines", "rot99"])
+
+        assert code == 1
+        assert "Unknown engines: rot99" in capsys.readouterr().err
+
+    def test_bench_memory_reports_each_layout(self, capsys):
+        assert main(["bench", "--memory", "100"]) == 0
+
+        out = capsys.readouterr().out
+        assert "ColumnarBuffer" in out
+        assert "list[Text]" in out
+
+    def test_bench_compression_reports_each_codec(self, capsys):
+        assert main(["bench", "--compression", "50", "--level", "1"]) == 0
+
+        out = capsys.readouterr().out
+        assert ".gz    level 1" in out
+        assert ".xz    level 1" in out
+
+    def test_loadgen_reports_unreachable_service(self, capsys):
+        code = main(["loadgen", "--port", "1", "--requests", "1", "--connections", "1"])
+
+        assert code == 1
+        assert "Error:" in capsys.readouterr().err
+
+    def test_missing_command_exits_with_usage(self):
+        with pytest.raises(SystemExit):
+            main([])
@@ -1,8 +1,13 @@
+import gzip
 import json
+import mmap
+import os
 
 import pytest
 
-from src.file_handler import FileHandler
+from src.file_handler import FileHandler, compression_suffix
+
+CODECS = [".gz", ".bz2", ".xz", ".zz"]
 
 
 @pytest.fixture
@@ -47,3 +52,298 @@ class TestFileHandler:
 
         with pytest.raises(json.JSONDecodeError):
             file_handler.load_from_file(str(broken_file))
+
+    def test_read_chunks_yields_fixed_size_pieces(self, tmp_path, file_handler):
+        filename = tmp_path / "input.bin"
+        filename.write_bytes(b"abcdefgh")
+
+        chunks = list(file_handler.read_chunks(str(filename), chunk_size=3))
+
+        assert chunks == [b"abc", b"def", b"gh"]
+
+    def test_read_chunks_of_empty_file_yields_nothing(self, tmp_path, file_handler):
+        filename = tmp_path / "empty.bin"
+        filename.write_bytes(b"")
+
+        assert list(file_handler.read_chunks(str(filename))) == []
+
+    def test_write_chunks_writes_all_chunks_and_returns_size(self, tmp_path, file_handler):
+        filename = tmp_path / "output.bin"
+
+        written = file_handler.write_chunks(str(filename), iter([b"abc", b"de"]))
+
+        assert written == 5
+        assert filename.read_bytes() == b"abcde"
+
+    def test_map_in_place_transforms_every_window(self, tmp_path, file_handler):
+        filename = tmp_path / "data.bin"
+        size = mmap.ALLOCATIONGRANULARITY * 2 + 10
+        filename.write_bytes(b"a" * size)
+        windows = []
+
+        def upper(view):
+            windows.append(len(view))
+            view[:] = bytes(view).upper()
+
+        processed = file_handler.map_in_place(str(filename), upper, window_size=1)
+
+        assert processed == size
+        assert windows == [mmap.ALLOCATIONGRANULARITY, mmap.ALLOCATIONGRANULARITY, 10]
+        assert filename.read_bytes() == b"A" * size
+
+    def test_map_in_place_on_empty_file_processes_nothing(self, tmp_path, file_handler):
+        filename = tmp_path / "empty.bin"
+        filename.write_bytes(b"")
+
+        assert file_handler.map_in_place(str(filename), lambda view: None) == 0
+
+    def test_append_journal_adds_indexed_json_lines(self, tmp_path, file_handler):
+        filename = tmp_path / "buffer.jsonl"
+        record = {"text": "Uryyb", "rot_type": "rot13", "status": "encrypted"}
+
+        assert file_handler.append_journal(str(filename), [(0, record)]) == 1
+        assert file_handler.append_journal(str(filename), [(0, record), (1, record)]) == 2
+
+        lines = filename.read_text().splitlines()
+        assert [json.loads(line)["index"] for line in lines] == [0, 0, 1]
+
+    def test_read_journal_yields_indexed_records(self, tmp_path, file_handler):
+        filename = tmp_path / "buffer.jsonl"
+        file_handler.append_journal(
+            str(filename),
+            [
+                (0, {"text": "Hello", "rot_type": "", "status": "decrypted"}),
+                (0, {"text": "Uryyb", "rot_type": "rot13", "status": "encrypted"}),
+            ],
+        )
+
+        journal = file_handler.read_journal(str(filename))
+
+        assert list(journal) == [
+            (0, {"text": "Hello", "rot_type": "", "status": "decrypted"}),
+            (0, {"text": "Uryyb", "rot_type": "rot13", "status": "encrypted"}),
+        ]
+        assert (journal.lines, journal.torn) == (2, False)
+
+    def test_read_journal_stops_at_torn_last_line(self, tmp_path, file_handler):
+        filename = tmp_path / "buffer.jsonl"
+        file_handler.append_journal(
+            str(filename), [(0, {"text": "a", "rot_type": "", "status": ""})]
+        )
+        with open(filename, "a") as journal_file:
+            journal_file.write('{"index": 1, "te')
+
+        journal = file_handler.read_journal(str(filename))
+
+        assert list(journal) == [(0, {"text": "a", "rot_type": "", "status": ""})]
+        assert (journal.lines, journal.torn) == (1, True)
+
+    def test_write_journal_replaces_file_with_one_line_per_record(self, tmp_path, file_handler):
+        filename = tmp_path / "buffer.jsonl"
+        filename.write_text("stale\n")
+        buffer_data = [{"text": "a", "rot_type": "", "status": "decrypted"}]
+
+        file_handler.write_journal(str(filename), buffer_data)
+
+        assert list(file_handler.read_journal(str(filename))) == [(0, buffer_data[0])]
+        assert not (tmp_path / "buffer.jsonl.tmp").exists()
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+    def test_iter_json_array_yields_records_across_chunks(self, tmp_path, file_handler, chunk_size):
+        filename = tmp_path / "buffer.json"
+        buffer_data = [
+            {"text": "Uryyb ]}, [", "rot_type": "rot13", "status": "encrypted"},
+            {"text": "Zażółć", "rot_type": "", "status": "decrypted"},
+        ]
+        filename.write_text(json.dumps(buffer_data, indent=4))
+
+        records = file_handler.iter_json_array(str(filename), chunk_size=chunk_size)
+
+        assert list(records) == buffer_data
+
+    def test_iter_json_array_handles_empty_array(self, tmp_path, file_handler):
+        filename = tmp_path / "buffer.json"
+        filename.write_text(" [ ]\n")
+
+        assert list(file_handler.iter_json_array(str(filename))) == []
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "",
+            "[",
+            '[{"a": 1}',
+            '[{"a": 1},]',
+            '{"a": 1}',
+            '[{"a": 1} {"b": 2}]',
+            "[1,2] garbage",
+            '[{"a": 1}]]',
+            "[]\n[]",
+        ],
+    )
+    def test_iter_json_array_raises_on_invalid_json(self, tmp_path, file_handler, content):
+        filename = tmp_path / "broken.json"
+        filename.write_text(content)
+
+        with pytest.raises(json.JSONDecodeError):
+            list(file_handler.iter_json_array(str(filename), chunk_size=2))
+
+    def test_binary_round_trip_gives_random_access(self, tmp_path, file_handler):
+        filename = tmp_path / "buffer.bin"
+        buffer_data = [
+            {"text": "Uryyb", "rot_type": "rot13", "status": "encrypted"},
+            {"text": "Zażółć 🙂", "rot_type": "", "status": "decrypted"},
+            {"text": "", "rot_type": "caesar:3", "status": "encrypted"},
+        ]
+
+        file_handler.save_binary(str(filename), iter(buffer_data))
+        source = file_handler.open_binary(str(filename))
+
+        assert len(source) == 3
+        assert source.record(1) == buffer_data[1]
+        assert source.meta(2) == ("caesar:3", "encrypted")
+        assert [source.record(i) for i in range(3)] == buffer_data
+        with pytest.raises(IndexError):
+            source.record(3)
+        source.close()
+        assert not (tmp_path / "buffer.bin.tmp").exists()
+
+    def test_binary_save_of_empty_buffer(self, tmp_path, file_handler):
+        filename = tmp_path / "buffer.bin"
+
+        file_handler.save_binary(str(filename), [])
+
+        assert len(file_handler.open_binary(str(filename))) == 0
+
+    def test_binary_save_rejects_too_many_distinct_values(self, tmp_path, file_handler):
+        records = [{"text": "", "rot_type": f"caesar:{i}", "status": ""} for i in range(300)]
+
+        with pytest.raises(ValueError):
+            file_handler.save_binary(str(tmp_path / "buffer.bin"), records)
+
+    @pytest.mark.parametrize("truncate", [0, 4, 20, 40])
+    def test_open_binary_rejects_truncated_file(self, tmp_path, file_handler, truncate):
+        filename = tmp_path / "buffer.bin"
+        file_handler.save_binary(str(filename), [{"text": "Hi", "rot_type": "", "status": ""}])
+        filename.write_bytes(filename.read_bytes()[:truncate])
+
+        with pytest.raises(ValueError):
+            file_handler.open_binary(str(filename))
+
+    def test_open_binary_rejects_other_files(self, tmp_path, file_handler):
+        filename = tmp_path / "buffer.bin"
+        filename.write_text('[{"text": "Hello", "rot_type": "", "status": "decrypted"}]')
+
+        with pytest.raises(ValueError):
+            file_handler.open_binary(str(filename))
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_compressed_save_and_load_round_trip(self, tmp_path, file_handler, codec):
+        filename = tmp_path / f"buffer.json{codec}"
+        buffer_data = [{"text": "Uryyb " * 100, "rot_type": "rot13", "status": "encrypted"}] * 50
+
+        file_handler.save_to_file(str(filename), buffer_data)
+
+        assert filename.stat().st_size < len(json.dumps(buffer_data)) // 10
+        assert file_handler.load_from_file(str(filename)) == buffer_data
+        assert list(file_handler.iter_json_array(str(filename), chunk_size=7)) == buffer_data
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_compressed_journal_appends_and_rewrites(self, tmp_path, file_handler, codec):
+        filename = tmp_path / f"buffer.jsonl{codec}"
+        record = {"text": "a", "rot_type": "", "status": "decrypted"}
+
+        file_handler.write_journal(str(filename), [record])
+        file_handler.append_journal(str(filename), [(0, record), (1, record)])
+        journal = file_handler.read_journal(str(filename))
+
+        assert list(journal) == [(0, record), (0, record), (1, record)]
+        assert (journal.lines, journal.torn) == (3, False)
+        assert not (tmp_path / f"buffer.jsonl{codec}.tmp").exists()
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_truncated_compressed_journal_is_torn(self, tmp_path, file_handler, codec):
+        filename = tmp_path / f"buffer.jsonl{codec}"
+        record = {"text": "a", "rot_type": "", "status": "decrypted"}
+        file_handler.write_journal(str(filename), [record])
+        file_handler.append_journal(str(filename), [(0, {**record, "text": "b" * 5000})])
+        filename.write_bytes(filename.read_bytes()[:-8])
+
+        journal = file_handler.read_journal(str(filename))
+
+        assert list(journal)[:1] == [(0, record)]
+        assert journal.torn is True
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_compressed_chunks_round_trip(self, tmp_path, file_handler, codec):
+        filename = tmp_path / f"stream{codec}"
+        data = bytes(range(256)) * 1000
+
+        file_handler.write_chunks(str(filename), [data[:1000], data[1000:]])
+
+        assert b"".join(file_handler.read_chunks(str(filename), chunk_size=4096)) == data
+
+    def test_compression_level_is_used_and_validated(self, tmp_path):
+        filename = tmp_path / "buffer.json.gz"
+        buffer_data = [{"text": "Hello world " * 1000, "rot_type": "", "status": ""}]
+
+        FileHandler(compression_level=0).save_to_file(str(filename), buffer_data)
+        stored_size = filename.stat().st_size
+        FileHandler(compression_level=9).save_to_file(str(filename), buffer_data)
+
+        assert filename.stat().st_size < stored_size
+        assert json.loads(gzip.decompress(filename.read_bytes())) == buffer_data
+        with pytest.raises(ValueError):
+            FileHandler(compression_level=10)
+
+    def test_compression_suffix_recognizes_codecs_only(self):
+        assert compression_suffix("data/buffer.jsonl.xz") == ".xz"
+        assert compression_suffix("data/buffer.json") == ""
+
+    def test_binary_files_cannot_be_compressed(self, tmp_path, file_handler):
+        with pytest.raises(ValueError):
+            file_handler.save_binary(str(tmp_path / "buffer.bin.gz"), [])
+
+    def test_failed_save_keeps_previous_file(self, tmp_path, file_handler):
+        filename = tmp_path / "buffer.json"
+        buffer_data = [{"text": "a", "rot_type": "", "status": "decrypted"}]
+        file_handler.save_to_file(str(filename), buffer_data)
+
+        with pytest.raises(TypeError):
+            file_handler.save_to_file(str(filename), buffer_data + [{"text": object()}])
+
+        assert json.loads(filename.read_text()) == buffer_data
+        assert not (tmp_path / "buffer.json.tmp").exists()
+
+    @pytest.mark.parametrize(
+        "policy, on_save, on_close",
+        [("never", 0, 0), ("always", 4, 0), ("on-close", 2, 2), ("deferred", 0, 4)],
+    )
+    def test_fsync_policy(self, tmp_path, monkeypatch, policy, on_save, on_close):
+        synced = []
+        monkeypatch.setattr(os, "fsync", synced.append)
+        file_handler = FileHandler(fsync=policy)
+
+        file_handler.save_to_file(str(tmp_path / "buffer.json"), [])
+        file_handler.append_journal(str(tmp_path / "buffer.jsonl"), [])
+        saved = len(synced)
+        file_handler.close()
+
+        assert saved == on_save
+        assert len(synced) - saved == on_close
+
+    def test_on_close_syncs_new_file_before_replacing_old_one(self, tmp_path, monkeypatch):
+        events = []
+        replace = os.replace
+        monkeypatch.setattr(os, "fsync", lambda fd: events.append("fsync"))
+        monkeypatch.setattr(
+            os, "replace", lambda src, dst: (events.append("replace"), replace(src, dst))
+        )
+
+        FileHandler().save_to_file(str(tmp_path / "buffer.json"), [])
+
+        assert events == ["fsync", "replace", "fsync"]
+
+    def test_invalid_fsync_policy_is_rejected(self):
+        with pytest.raises(ValueError):
+            FileHandler(fsync="sometimes")
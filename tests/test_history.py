@@ -0,0 +1,67 @@
+import sys
+
+import pytest
+
+from src.constants import HISTORY_CHANGE_OVERHEAD
+from src.history import History
+from src.text import Text
+
+
+def text(value):
+    return Text(text=value, rot_type="", status="decrypted")
+
+
+class TestHistory:
+    def test_size_counts_only_changed_entries(self):
+        history = History()
+        history.record(0, text("a"), text("b"))
+        history.record(1, None, text("c"))
+
+        expected = 2 * HISTORY_CHANGE_OVERHEAD + 3 * sys.getsizeof("a")
+        assert history.size_bytes == expected
+        assert history.undo_depth == 2
+
+    def test_oldest_operations_are_dropped_over_memory_limit(self):
+        history = History(max_bytes=3 * (HISTORY_CHANGE_OVERHEAD + 2 * sys.getsizeof("a")))
+        for value in "abcde":
+            history.record(0, text(value), text(value))
+
+        assert history.undo_depth == 3
+        assert [history.undo()[0][1].text for _ in range(3)] == ["e", "d", "c"]
+        assert history.undo() == []
+
+    def test_operation_larger_than_limit_is_not_kept(self):
+        history = History(max_bytes=HISTORY_CHANGE_OVERHEAD)
+        history.record(0, text("a"), text("b"))
+
+        assert (history.undo_depth, history.size_bytes) == (0, 0)
+
+    def test_nested_groups_record_one_operation(self):
+        history = History()
+        with history.group():
+            history.record(0, text("a"), text("b"))
+            with history.group():
+                history.record(1, text("c"), text("d"))
+
+        assert history.undo_depth == 1
+        assert [index for index, _, _ in history.undo()] == [0, 1]
+
+    def test_empty_group_records_nothing(self):
+        history = History()
+        with history.group():
+            pass
+
+        assert history.undo_depth == 0
+
+    def test_recording_discards_redo(self):
+        history = History()
+        history.record(0, text("a"), text("b"))
+        history.undo()
+        history.record(0, text("a"), text("c"))
+
+        assert (history.redo_depth, history.undo_depth) == (0, 1)
+        assert history.size_bytes == HISTORY_CHANGE_OVERHEAD + 2 * sys.getsizeof("a")
+
+    def test_negative_limit_raises(self):
+        with pytest.raises(ValueError):
+            History(max_bytes=-1)
@@ -3,10 +3,11 @@ from unittest.mock import Mock
 import pytest
 
 from src.buffer import Buffer
-from src.constants import ROT13, ROT47, STATUS_DECRYPTED, STATUS_ENCRYPTED
+from src.constants import ROT13, ROT47, ROT8000, STATUS_DECRYPTED, STATUS_ENCRYPTED
 from src.exceptions import RotTypeMismatchError, UnsupportedCipherError
 from src.file_handler import FileHandler
-from src.manager import Manager
+from src.manager import BatchResult, Manager
+from src.parallel import ParallelCipher
 from src.text import Text
 
 
@@ -33,7 +34,14 @@ class TestManager:
 
     @pytest.mark.parametrize(
         ("rot_type", "plain_text", "expected_cipher"),
-        [(ROT13, "Hello", "Uryyb"), (ROT47, "Hello", "w6==@")],
+        [
+            (ROT13, "Hello", "Uryyb"),
+            (ROT47, "Hello", "w6==@"),
+            ("caesar:3", "Hello", "Khoor"),
+            ("rot5", "Hello 123", "Hello 678"),
+            ("rot8000", "Hello, świat", "濖濳濺濺濽澺 烆瀅濷濯瀂"),
+            ("rot13+rot47", "Hello World!", "&CJJ3 y36JBP"),
+        ],
     )
     def test_process_cipher_encrypts_decrypts_text(
         self,
@@ -86,24 +94,533 @@ class TestManager:
 
         assert buffer.texts[0] == Text(text="Hello", rot_type="", status=STATUS_DECRYPTED)
 
-    def test_save_to_file_passes_serialized_buffer_to_handler(self, file_handler_mock):
-        buffer_mock = Mock(spec=Buffer)
-        manager = Manager(buffer=buffer_mock, file_handler=file_handler_mock)
+    def test_save_to_file_passes_serialized_buffer_to_handler(
+        self, buffer, manager, file_handler_mock
+    ):
+        buffer.add(Text(text="Uryyb", rot_type=ROT13, status=STATUS_ENCRYPTED))
         buffer_data = [{"text": "Uryyb", "rot_type": ROT13, "status": STATUS_ENCRYPTED}]
-        buffer_mock.to_dict_list.return_value = buffer_data
 
         manager.save_to_file("filename")
 
-        buffer_mock.to_dict_list.assert_called_once_with()
         file_handler_mock.save_to_file.assert_called_once_with("data/filename.json", buffer_data)
 
     def test_load_from_file_populates_buffer_with_loaded_data(self, file_handler_mock):
         buffer_mock = Mock(spec=Buffer)
         manager = Manager(buffer=buffer_mock, file_handler=file_handler_mock)
-        loaded_data = [{"text": "Hello", "rot_type": "", "status": STATUS_DECRYPTED}]
-        file_handler_mock.load_from_file.return_value = loaded_data
+        loaded_data = iter([{"text": "Hello", "rot_type": "", "status": STATUS_DECRYPTED}])
+        file_handler_mock.iter_json_array.return_value = loaded_data
 
         manager.load_from_file("filename")
 
-        file_handler_mock.load_from_file.assert_called_once_with("data/filename.json")
+        file_handler_mock.iter_json_array.assert_called_once_with("data/filename.json")
         buffer_mock.from_dict_list.assert_called_once_with(loaded_data)
+
+    @pytest.mark.parametrize("chunk_size", [1, 4, 1024])
+    def test_stream_cipher_writes_ciphered_file(self, tmp_path, buffer, chunk_size):
+        manager = Manager(buffer=buffer, file_handler=FileHandler())
+        source = tmp_path / "input.txt"
+        target = tmp_path / "output.txt"
+        source.write_text("Hello World\nZażółć 🙂\n", encoding="utf-8")
+
+        written = manager.stream_cipher(str(source), str(target), ROT13, chunk_size=chunk_size)
+
+        assert target.read_text(encoding="utf-8") == "Uryyb Jbeyq\nMnżółć 🙂\n"
+        assert written == source.stat().st_size
+        assert buffer.texts == []
+
+    def test_stream_cipher_rejects_non_positive_chunk_size(self, tmp_path, manager):
+        with pytest.raises(ValueError):
+            manager.stream_cipher("in", "out", ROT13, chunk_size=0)
+
+    def test_stream_cipher_raises_for_unsupported_cipher(self, manager):
+        with pytest.raises(UnsupportedCipherError):
+            manager.stream_cipher("in", "out", "rot99")
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_stream_cipher_rejects_text_only_cipher_before_touching_output(
+        self, tmp_path, buffer, workers
+    ):
+        manager = Manager(buffer=buffer, file_handler=FileHandler(), workers=workers)
+        source = tmp_path / "input.txt"
+        target = tmp_path / "output.txt"
+        source.write_text("Hello")
+        target.write_text("keep me")
+
+        with pytest.raises(UnsupportedCipherError):
+            manager.stream_cipher(str(source), str(target), ROT8000)
+
+        assert target.read_text() == "keep me"
+        manager.close()
+
+    @pytest.mark.parametrize("rot_type", [ROT13, ROT47])
+    def test_cipher_file_in_place_twice_restores_original(self, tmp_path, buffer, rot_type):
+        manager = Manager(buffer=buffer, file_handler=FileHandler())
+        filename = tmp_path / "data.txt"
+        original = "Hello World ~>@\nZażółć 🙂\n".encode() * 1000
+        filename.write_bytes(original)
+
+        processed = manager.cipher_file_in_place(str(filename), rot_type, window_size=1)
+
+        assert processed == len(original)
+        assert filename.read_bytes() != original
+
+        manager.cipher_file_in_place(str(filename), rot_type)
+
+        assert filename.read_bytes() == original
+
+    def test_cipher_file_in_place_rejects_non_positive_window(self, manager):
+        with pytest.raises(ValueError):
+            manager.cipher_file_in_place("data.txt", ROT13, window_size=0)
+
+    def test_manager_rejects_non_positive_workers(self, buffer, file_handler_mock):
+        with pytest.raises(ValueError):
+            Manager(buffer=buffer, file_handler=file_handler_mock, workers=0)
+
+    def test_process_cipher_with_workers_shards_large_text(self, buffer):
+        manager = Manager(
+            buffer=buffer, file_handler=FileHandler(), workers=2, parallel_threshold=4
+        )
+        buffer.add(Text(text="Hello World " * 10, rot_type="", status=STATUS_DECRYPTED))
+
+        try:
+            encrypted = manager.process_cipher(index=0, rot_type=ROT13)
+        finally:
+            manager.close()
+
+        assert encrypted.text == "Uryyb Jbeyq " * 10
+        assert encrypted.status == STATUS_ENCRYPTED
+
+    def test_stream_cipher_with_workers_keeps_chunk_order(self, tmp_path, buffer):
+        manager = Manager(buffer=buffer, file_handler=FileHandler(), workers=2)
+        source = tmp_path / "input.txt"
+        target = tmp_path / "output.txt"
+        source.write_text("Hello World\n" * 100)
+
+        try:
+            manager.stream_cipher(str(source), str(target), ROT13, chunk_size=7)
+        finally:
+            manager.close()
+
+        assert target.read_text() == "Uryyb Jbeyq\n" * 100
+
+    def test_process_all_encrypts_every_entry(self, buffer, manager):
+        for word in ("Hello", "World"):
+            manager.add_text(word)
+
+        result = manager.process_all(rot_type=ROT13)
+
+        assert result == BatchResult(processed=[0, 1], failed={})
+        assert buffer.texts == [
+            Text(text="Uryyb", rot_type=ROT13, status=STATUS_ENCRYPTED),
+            Text(text="Jbeyq", rot_type=ROT13, status=STATUS_ENCRYPTED),
+        ]
+
+    def test_process_batch_collects_failures_without_aborting(self, buffer, manager):
+        buffer.add(Text(text="Uryyb", rot_type=ROT13, status=STATUS_ENCRYPTED))
+        buffer.add(Text(text="w6==@", rot_type=ROT47, status=STATUS_ENCRYPTED))
+        buffer.add(Text(text="Hello", rot_type="", status="unknown"))
+
+        result = manager.process_batch(indices=[0, 1, 2, 5], rot_type=ROT13)
+
+        assert result.processed == [0]
+        assert set(result.failed) == {1, 2, 5}
+        assert "Mismatch rot type" in result.failed[1]
+        assert buffer.texts[0] == Text(text="Hello", rot_type="", status=STATUS_DECRYPTED)
+        assert buffer.texts[1] == Text(text="w6==@", rot_type=ROT47, status=STATUS_ENCRYPTED)
+
+    def test_process_batch_uses_entry_rot_type_when_none_given(self, buffer, manager):
+        buffer.add(Text(text="Uryyb", rot_type=ROT13, status=STATUS_ENCRYPTED))
+        buffer.add(Text(text="w6==@", rot_type=ROT47, status=STATUS_ENCRYPTED))
+        buffer.add(Text(text="Hello", rot_type="", status=STATUS_DECRYPTED))
+
+        result = manager.process_all()
+
+        assert result.processed == [0, 1]
+        assert list(result.failed) == [2]
+        assert [t.text for t in buffer.texts] == ["Hello", "Hello", "Hello"]
+
+    def test_process_batch_builds_one_cipher_per_rot_type(self, buffer, manager, monkeypatch):
+        calls = []
+        original = manager._get_cipher
+
+        def counting_get_cipher(rot_type, size=0):
+            calls.append(rot_type)
+            return original(rot_type=rot_type, size=size)
+
+        monkeypatch.setattr(manager, "_get_cipher", counting_get_cipher)
+        for _ in range(5):
+            buffer.add(Text(text="Uryyb", rot_type=ROT13, status=STATUS_ENCRYPTED))
+            buffer.add(Text(text="w6==@", rot_type=ROT47, status=STATUS_ENCRYPTED))
+
+        manager.process_all()
+
+        assert calls == [ROT13, ROT47]
+
+    def test_process_batch_shards_large_entries_across_workers(
+        self, buffer, file_handler_mock, monkeypatch
+    ):
+        calls = []
+        original = ParallelCipher.cipher
+
+        def counting_cipher(self, text_obj):
+            calls.append(len(text_obj.text))
+            return original(self, text_obj)
+
+        monkeypatch.setattr(ParallelCipher, "cipher", counting_cipher)
+        manager = Manager(
+            buffer=buffer, file_handler=file_handler_mock, workers=2, parallel_threshold=10
+        )
+        manager.add_text("Hello")
+        manager.add_text("Hello World, long enough")
+        manager.add_text("Another long enough text")
+
+        try:
+            manager.process_all(rot_type=ROT13)
+        finally:
+            manager.close()
+
+        assert calls == [24, 24]
+        assert buffer.get(1).text == "Uryyb Jbeyq, ybat rabhtu"
+        assert buffer.get(0).text == "Uryyb"
+
+    def test_process_batch_raises_for_unsupported_cipher(self, buffer, manager):
+        buffer.add(Text(text="Hello", rot_type="", status=STATUS_DECRYPTED))
+
+        with pytest.raises(UnsupportedCipherError):
+            manager.process_all(rot_type="rot99")
+
+    def test_process_range_clamps_to_buffer(self, buffer, manager):
+        for word in ("a", "b", "c"):
+            manager.add_text(word)
+
+        result = manager.process_range(start=1, stop=10, rot_type=ROT13)
+
+        assert result.processed == [1, 2]
+        assert buffer.texts[0].status == STATUS_DECRYPTED
+
+    def test_process_matching_filters_entries(self, buffer, manager):
+        buffer.add(Text(text="Uryyb", rot_type=ROT13, status=STATUS_ENCRYPTED))
+        buffer.add(Text(text="w6==@", rot_type=ROT47, status=STATUS_ENCRYPTED))
+        buffer.add(Text(text="Hello", rot_type="", status=STATUS_DECRYPTED))
+
+        result = manager.process_matching(rot_type=ROT13, current_rot_type=ROT13)
+
+        assert result == BatchResult(processed=[0], failed={})
+        assert buffer.texts[0] == Text(text="Hello", rot_type="", status=STATUS_DECRYPTED)
+        assert buffer.texts[1].status == STATUS_ENCRYPTED
+
+    def test_undo_reverts_whole_batch(self, buffer, manager):
+        for word in ("Hello", "World", "Zebra"):
+            manager.add_text(word)
+        manager.process_all(rot_type=ROT13)
+
+        assert buffer.undo() == [0, 1, 2]
+        assert [t.status for t in buffer] == [STATUS_DECRYPTED] * 3
+        assert buffer.redo() == [0, 1, 2]
+        assert [t.text for t in buffer] == ["Uryyb", "Jbeyq", "Mroen"]
+
+    def test_process_cipher_detects_missing_rot_type(self, buffer, manager):
+        buffer.add(Text(text="Khoor Zruog", rot_type="", status=STATUS_ENCRYPTED))
+
+        decrypted = manager.process_cipher(index=0, rot_type="")
+
+        assert decrypted == Text(text="Hello World", rot_type="", status=STATUS_DECRYPTED)
+
+    def test_process_cipher_without_rot_type_uses_stored_one(self, buffer, manager):
+        buffer.add(Text(text="w6==@", rot_type=ROT47, status=STATUS_ENCRYPTED))
+
+        assert manager.process_cipher(index=0, rot_type="").text == "Hello"
+
+    def test_detect_rot_type_raises_when_text_has_no_ascii(self, buffer, manager):
+        buffer.add(Text(text="東京", rot_type="", status=STATUS_ENCRYPTED))
+
+        with pytest.raises(ValueError):
+            manager.detect_rot_type(0)
+
+    def test_classify_buffer_suggests_rot_types_without_storing_them(self, buffer, manager):
+        buffer.add(Text(text="Uryyb Jbeyq", rot_type="", status=STATUS_ENCRYPTED))
+        buffer.add(Text(text="Hello", rot_type="", status=STATUS_DECRYPTED))
+        buffer.add(Text(text="w6==@ (@C=5", rot_type="", status=STATUS_ENCRYPTED))
+        buffer.add(Text(text="東京", rot_type="", status=STATUS_ENCRYPTED))
+
+        assert manager.classify_buffer() == {0: ROT13, 2: ROT47}
+        assert buffer.indices_by_rot_type("") == [0, 1, 2, 3]
+
+    def test_wrong_guess_does_not_block_explicit_rot_type(self, buffer, manager):
+        buffer.add(Text(text="Jnefmnjn", rot_type="", status=STATUS_ENCRYPTED))
+        manager.classify_buffer()
+
+        decrypted = manager.process_cipher(index=0, rot_type=ROT13)
+
+        assert decrypted.text == "Warszawa"
+
+    def test_repeated_cipher_results_come_from_cache(self, buffer, manager):
+        for _ in range(3):
+            manager.add_text("Hello")
+
+        manager.process_all(rot_type=ROT47)
+
+        assert [t.text for t in buffer.texts] == ["w6==@"] * 3
+        assert (manager.cache.hits, manager.cache.misses) == (2, 1)
+
+    def test_decrypt_returns_original_plaintext_from_cache(self, buffer, manager, monkeypatch):
+        manager.add_text("Hello")
+        manager.process_cipher(index=0, rot_type="caesar:3")
+        cipher = Mock(side_effect=AssertionError("decryption should not be recomputed"))
+        monkeypatch.setattr("src.cipher.TableCipher.cipher", cipher)
+
+        decrypted = manager.process_cipher(index=0, rot_type="caesar:3")
+
+        assert decrypted == Text(text="Hello", rot_type="", status=STATUS_DECRYPTED)
+        assert manager.cache.hits == 1
+
+    def test_involution_shares_cache_entries_for_both_directions(self, buffer, manager):
+        buffer.add(Text(text="Uryyb", rot_type=ROT13, status=STATUS_ENCRYPTED))
+        manager.add_text("Uryyb")
+
+        manager.process_all(rot_type=ROT13)
+
+        assert [t.text for t in buffer.texts] == ["Hello", "Hello"]
+        assert manager.cache.hits == 1
+
+    def test_cache_can_be_disabled(self, buffer, file_handler_mock):
+        manager = Manager(buffer=buffer, file_handler=file_handler_mock, cache_entries=0)
+        manager.add_text("Hello")
+        manager.add_text("Hello")
+
+        manager.process_all(rot_type=ROT13)
+
+        assert manager.cache.hits == 0
+        assert len(manager.cache) == 0
+
+    def test_save_to_file_keeps_explicit_json_extension(self, file_handler_mock, manager):
+        manager.save_to_file("filename.json")
+
+        file_handler_mock.save_to_file.assert_called_once_with("data/filename.json", [])
+
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            ("session.gz", "data/session.json.gz"),
+            ("session.json.xz", "data/session.json.xz"),
+            ("session.jsonl.bz2", "data/session.jsonl.bz2"),
+        ],
+    )
+    def test_save_to_file_keeps_compression_suffix(
+        self, manager, file_handler_mock, filename, expected
+    ):
+        manager.save_to_file(filename)
+
+        assert file_handler_mock.method_calls[0].args[0] == expected
+
+
+class TestManagerJournal:
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch, buffer):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        return Manager(buffer=buffer, file_handler=FileHandler())
+
+    def journal_lines(self, tmp_path):
+        return (tmp_path / "data" / "session.jsonl").read_text().splitlines()
+
+    def test_first_save_writes_every_entry(self, tmp_path, manager):
+        manager.add_text("Hello")
+        manager.add_text("World")
+
+        manager.save_to_file("session.jsonl")
+
+        assert len(self.journal_lines(tmp_path)) == 2
+
+    def test_later_saves_append_only_changed_entries(self, tmp_path, manager):
+        for word in ("Hello", "World", "Again"):
+            manager.add_text(word)
+        manager.save_to_file("session.jsonl")
+
+        manager.process_cipher(index=1, rot_type=ROT13)
+        manager.save_to_file("session.jsonl")
+        manager.save_to_file("session.jsonl")
+
+        lines = self.journal_lines(tmp_path)
+        assert len(lines) == 4
+        assert '"Jbeyq"' in lines[-1]
+
+    def test_save_compacts_when_journal_grows_too_long(self, tmp_path, manager):
+        manager.add_text("Hello")
+        manager.save_to_file("session.jsonl")
+
+        for _ in range(3):
+            manager.process_cipher(index=0, rot_type=ROT13)
+            manager.save_to_file("session.jsonl")
+
+        assert len(self.journal_lines(tmp_path)) <= 2
+
+    def test_save_after_undoing_add_rewrites_journal(self, tmp_path, manager):
+        for word in ("Hello", "World", "Again"):
+            manager.add_text(word)
+        manager.save_to_file("session.jsonl")
+
+        manager.buffer.undo()
+        manager.save_to_file("session.jsonl")
+
+        loaded = Manager(buffer=Buffer(), file_handler=FileHandler())
+        loaded.load_from_file("session.jsonl")
+        assert [t.text for t in loaded.buffer] == ["Hello", "World"]
+
+    def test_load_replays_journal_and_appends_afterwards(self, tmp_path, manager, buffer):
+        for word in ("Hello", "World"):
+            manager.add_text(word)
+        manager.save_to_file("session.jsonl")
+        manager.process_cipher(index=0, rot_type=ROT13)
+        manager.save_to_file("session.jsonl")
+
+        loaded = Manager(buffer=Buffer(), file_handler=FileHandler())
+        loaded.load_from_file("session.jsonl")
+        loaded.add_text("New")
+        loaded.save_to_file("session.jsonl")
+
+        assert [t.text for t in loaded.buffer.texts] == ["Uryyb", "World", "New"]
+        assert len(self.journal_lines(tmp_path)) == 4
+
+    def test_save_after_loading_torn_journal_rewrites_file(self, tmp_path, manager):
+        manager.add_text("Hello")
+        manager.save_to_file("session.jsonl")
+        with open(tmp_path / "data" / "session.jsonl", "a") as journal_file:
+            journal_file.write('{"index": 1')
+
+        manager.load_from_file("session.jsonl")
+        manager.save_to_file("session.jsonl")
+
+        assert len(self.journal_lines(tmp_path)) == 1
+
+    def test_iter_file_yields_texts_lazily(self, tmp_path, manager):
+        (tmp_path / "data" / "session.json").write_text(
+            '[{"text": "Hello", "rot_type": "", "status": "decrypted"}, {"broken"'
+        )
+
+        texts = manager.iter_file("session.json")
+
+        assert next(texts) == Text(text="Hello", rot_type="", status=STATUS_DECRYPTED)
+        with pytest.raises(ValueError):
+            next(texts)
+
+    def test_iter_file_reads_compacted_journal(self, manager):
+        manager.add_text("Hello")
+        manager.add_text("World")
+        manager.save_to_file("session.jsonl")
+
+        assert [t.text for t in manager.iter_file("session.jsonl")] == ["Hello", "World"]
+
+    def test_iter_file_rejects_journal_with_overwrites(self, manager):
+        manager.add_text("Hello")
+        manager.add_text("World")
+        manager.save_to_file("session.jsonl")
+        manager.process_cipher(index=0, rot_type=ROT13)
+        manager.save_to_file("session.jsonl")
+
+        with pytest.raises(ValueError):
+            list(manager.iter_file("session.jsonl"))
+
+    def test_load_keeps_buffer_when_file_is_corrupted(self, tmp_path, manager, buffer):
+        manager.add_text("Hello")
+        (tmp_path / "data" / "broken.json").write_text(
+            '[{"text": "Other", "rot_type": "", "status": "decrypted"}, {"broken"'
+        )
+
+        with pytest.raises(ValueError):
+            manager.load_from_file("broken.json")
+
+        assert buffer.texts == [Text(text="Hello", rot_type="", status=STATUS_DECRYPTED)]
+
+    def test_binary_save_and_load(self, manager):
+        manager.add_text("Hello")
+        manager.add_text("World")
+        manager.process_cipher(index=1, rot_type=ROT47)
+        manager.save_to_file("session.bin")
+
+        loaded = Manager(buffer=Buffer(), file_handler=FileHandler())
+        loaded.load_from_file("session.bin")
+
+        assert list(loaded.buffer) == list(manager.buffer)
+        assert loaded.buffer.indices_by_rot_type(ROT47) == [1]
+        assert [t.text for t in loaded.iter_file("session.bin")] == ["Hello", "(@C=5"]
+
+    def test_binary_file_can_be_saved_over_while_loaded(self, manager):
+        manager.add_text("Hello")
+        manager.save_to_file("session.bin")
+        manager.load_from_file("session.bin")
+
+        manager.add_text("World")
+        manager.process_cipher(index=0, rot_type=ROT13)
+        manager.save_to_file("session.bin")
+        manager.load_from_file("session.bin")
+
+        assert [t.text for t in manager.buffer] == ["Uryyb", "World"]
+
+    def test_compressed_journal_appends_changes(self, tmp_path, manager):
+        manager.add_text("Hello")
+        manager.add_text("World")
+        manager.save_to_file("session.jsonl.gz")
+        manager.process_cipher(index=0, rot_type=ROT13)
+        manager.save_to_file("session.jsonl.gz")
+
+        loaded = Manager(buffer=Buffer(), file_handler=FileHandler())
+        loaded.load_from_file("session.jsonl.gz")
+
+        assert list(loaded.buffer) == list(manager.buffer)
+        assert loaded._journal_lines == 3
+        assert (tmp_path / "data" / "session.jsonl.gz").read_bytes()[:2] == b"\x1f\x8b"
+
+    def test_compressed_json_round_trip(self, manager):
+        manager.add_text("Hello")
+        manager.save_to_file("session.xz")
+
+        assert [t.text for t in manager.iter_file("session.json.xz")] == ["Hello"]
+
+    def test_background_save_writes_snapshot_taken_at_call(self, manager):
+        manager.add_text("Hello")
+
+        future = manager.save_in_background("session")
+        manager.add_text("World")
+        manager.process_cipher(index=0, rot_type=ROT13)
+        future.result()
+
+        assert [t.text for t in manager.iter_file("session")] == ["Hello"]
+        assert manager.saving is False
+
+    def test_background_saves_run_in_order(self, manager):
+        manager.add_text("Hello")
+        manager.save_in_background("session.jsonl")
+        for word in ("World", "Again"):
+            manager.add_text(word)
+            manager.save_in_background("session.jsonl")
+
+        loaded = Manager(buffer=Buffer(), file_handler=FileHandler())
+        manager.wait_for_saves()
+        loaded.load_from_file("session.jsonl")
+
+        assert [t.text for t in loaded.buffer] == ["Hello", "World", "Again"]
+
+    def test_failed_background_save_forces_compaction(self, tmp_path, manager, monkeypatch):
+        manager.add_text("Hello")
+        manager.save_to_file("session.jsonl")
+        manager.add_text("World")
+
+        def fail(filename, records):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(manager.file_handler, "append_journal", fail)
+        future = manager.save_in_background("session.jsonl")
+
+        assert isinstance(future.exception(), OSError)
+        manager.save_to_file("session.jsonl")
+        assert len(self.journal_lines(tmp_path)) == 2
+
+    def test_close_waits_for_background_saves(self, tmp_path, manager):
+        manager.add_text("Hello")
+        future = manager.save_in_background("session")
+
+        manager.close()
+
+        assert future.done()
+        assert (tmp_path / "data" / "session.json").exists()
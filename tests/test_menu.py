@@ -1,10 +1,17 @@
+import gzip
 import json
+from concurrent.futures import Future
 from types import SimpleNamespace
 
 import pytest
 
+from src.buffer import Buffer
+from src.constants import PAGE_SIZE
 from src.exceptions import EmptyBufferError, RotTypeMismatchError
+from src.file_handler import FileHandler
+from src.manager import Manager
 from src.menu import Menu
+from src.text import Text
 
 
 def create_menu_with_manager(manager):
@@ -13,6 +20,13 @@ def create_menu_with_manager(manager):
     return menu
 
 
+def create_buffer(entries):
+    buffer = Buffer()
+    for i in range(entries):
+        buffer.add(Text(text=f"text {i + 1}", rot_type="", status="decrypted"))
+    return buffer
+
+
 class TestMenu:
     def test_add_text_adds_to_manager_and_prints(self, monkeypatch, capsys):
         recorded = {}
@@ -66,8 +80,11 @@ class TestMenu:
 
     def test_show_buffer_prints_lines_and_returns_true(self, capsys):
         class StubBuffer:
-            def all_strings(self):
-                return ["first", "second"]
+            def page_strings(self, page, page_size, preview_width=None):
+                return iter(["first", "second"])
+
+            def page_count(self, page_size):
+                return 1
 
         menu = create_menu_with_manager(SimpleNamespace(buffer=StubBuffer()))
 
@@ -78,9 +95,34 @@ class TestMenu:
         assert "first" in captured
         assert "second" in captured
 
+    def test_show_buffer_prints_requested_page_with_footer(self, capsys):
+        menu = create_menu_with_manager(SimpleNamespace(buffer=create_buffer(PAGE_SIZE + 1)))
+
+        assert menu.show_buffer(page=1) is True
+
+        captured = capsys.readouterr().out
+        assert f"{PAGE_SIZE + 1}. text {PAGE_SIZE + 1}" in captured
+        assert "1. text 1 " not in captured
+        assert "Page 2/2" in captured
+
+    def test_browse_buffer_moves_between_pages(self, monkeypatch, capsys):
+        menu = create_menu_with_manager(SimpleNamespace(buffer=create_buffer(PAGE_SIZE + 1)))
+        inputs = iter(["n", "n", "p", ""])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+
+        menu.browse_buffer()
+
+        captured = capsys.readouterr().out
+        assert [line for line in captured.splitlines() if line.startswith("Page")] == [
+            "Page 1/2",
+            "Page 2/2",
+            "Page 2/2",
+            "Page 1/2",
+        ]
+
     def test_show_buffer_handles_empty_buffer_error(self, capsys):
         class StubBuffer:
-            def all_strings(self):
+            def page_strings(self, page, page_size, preview_width=None):
                 raise EmptyBufferError("Buffer is empty")
 
         menu = create_menu_with_manager(SimpleNamespace(buffer=StubBuffer()))
@@ -95,8 +137,11 @@ class TestMenu:
             def __init__(self):
                 self.requested_index = None
 
-            def all_strings(self):
-                return ["stored text"]
+            def page_strings(self, page, page_size, preview_width=None):
+                return iter(["stored text"])
+
+            def page_count(self, page_size):
+                return 1
 
             def get(self, index):
                 self.requested_index = index
@@ -125,6 +170,25 @@ class TestMenu:
         assert menu.manager.process_calls == [(0, "rot13")]
         assert "Text is encrypted" in captured
 
+    def test_encrypt_decrypt_can_select_text_on_next_page(self, monkeypatch, capsys):
+        process_calls = []
+
+        def process_cipher(index, rot_type):
+            process_calls.append((index, rot_type))
+            return SimpleNamespace(status="encrypted")
+
+        manager = SimpleNamespace(
+            buffer=create_buffer(PAGE_SIZE + 1), process_cipher=process_cipher
+        )
+        menu = create_menu_with_manager(manager)
+        inputs = iter(["n", str(PAGE_SIZE + 1), "rot13"])
+        monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+
+        menu.encrypt_decrypt()
+
+        assert process_calls == [(PAGE_SIZE, "rot13")]
+        assert "Page 2/2" in capsys.readouterr().out
+
     def test_encrypt_decrypt_returns_when_buffer_empty(self, monkeypatch):
         class StubManager:
             def __init__(self):
@@ -146,8 +210,11 @@ class TestMenu:
             def __init__(self):
                 self.requested_indices = []
 
-            def all_strings(self):
-                return ["stored text"]
+            def page_strings(self, page, page_size, preview_width=None):
+                return iter(["stored text"])
+
+            def page_count(self, page_size):
+                return 1
 
             def get(self, index):
                 self.requested_indices.append(index)
@@ -179,8 +246,11 @@ class TestMenu:
             def __init__(self):
                 self.requested_indices = []
 
-            def all_strings(self):
-                return ["stored text"]
+            def page_strings(self, page, page_size, preview_width=None):
+                return iter(["stored text"])
+
+            def page_count(self, page_size):
+                return 1
 
             def get(self, index):
                 self.requested_indices.append(index)
@@ -211,37 +281,45 @@ class TestMenu:
         assert menu.manager.buffer.requested_indices == [0, 0]
         assert menu.manager.process_calls == [(0, "rot13"), (0, "rot47")]
 
-    def test_save_to_file_success(self, monkeypatch, capsys):
+    def test_save_to_file_starts_background_save(self, monkeypatch, capsys):
         class StubManager:
             def __init__(self):
+                self.future = Future()
                 self.saved_filename = None
 
-            def save_to_file(self, filename):
+            def save_in_background(self, filename):
                 self.saved_filename = filename
+                return self.future
 
         menu = create_menu_with_manager(StubManager())
 
         monkeypatch.setattr("builtins.input", lambda _: "session1")
 
         menu.save_to_file()
+        menu.report_saves()
 
         captured = capsys.readouterr().out
         assert menu.manager.saved_filename == "session1"
-        assert "File saved" in captured
+        assert "Saving 'session1' in the background" in captured
+        assert "File 'session1' saved" not in captured
 
-    def test_save_to_file_handles_os_error(self, monkeypatch, capsys):
-        class StubManager:
-            def save_to_file(self, filename):
-                raise OSError("disk full")
+        menu.manager.future.set_result(None)
+        menu.report_saves()
+        menu.report_saves()
 
-        menu = create_menu_with_manager(StubManager())
+        assert capsys.readouterr().out == "File 'session1' saved\n"
 
-        monkeypatch.setattr("builtins.input", lambda _: "session1")
+    def test_report_saves_shows_background_error(self, capsys):
+        future = Future()
+        future.set_exception(OSError("disk full"))
+        menu = create_menu_with_manager(SimpleNamespace())
+        menu.pending_saves.append(("session1", future))
 
-        menu.save_to_file()
+        menu.report_saves()
 
         captured = capsys.readouterr().out
-        assert "Error saving file: disk full" in captured
+        assert "Error saving file 'session1': disk full" in captured
+        assert menu.pending_saves == []
 
     def test_load_from_file_success(self, monkeypatch, capsys):
         class StubManager:
@@ -289,9 +367,64 @@ class TestMenu:
         captured = capsys.readouterr().out
         assert "File corrupted or invalid JSON" in captured
 
+    def test_load_from_file_handles_corrupted_journal(self, monkeypatch, capsys):
+        class StubManager:
+            def load_from_file(self, filename):
+                raise ValueError("Journal line 1 has invalid index 2")
+
+        menu = create_menu_with_manager(StubManager())
+
+        monkeypatch.setattr("builtins.input", lambda _: "session1.jsonl")
+
+        menu.load_from_file()
+
+        captured = capsys.readouterr().out
+        assert "File corrupted: Journal line 1 has invalid index 2" in captured
+
+    @pytest.mark.parametrize(
+        ("filename", "data"),
+        [
+            ("bad.json.gz", b"not gzip at all"),
+            ("bad.json.gz", gzip.compress(b'[{"text": "a", "rot_type": "", "status": "dec')[:-12]),
+            ("bad.json.xz", b"not xz at all"),
+            ("bad.json.bz2", b"not bz2 at all"),
+        ],
+        ids=["gzip-header", "gzip-truncated", "xz", "bz2"],
+    )
+    def test_load_from_file_handles_corrupted_compressed_file(
+        self, monkeypatch, capsys, tmp_path, filename, data
+    ):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        (tmp_path / "data" / filename).write_bytes(data)
+        menu = create_menu_with_manager(Manager(buffer=Buffer(), file_handler=FileHandler()))
+
+        monkeypatch.setattr("builtins.input", lambda _: filename)
+
+        menu.load_from_file()
+
+        captured = capsys.readouterr().out
+        assert "Cannot read file" in captured
+
+    def test_undo_and_redo_report_changes(self, capsys):
+        menu = Menu()
+        menu.manager.add_text("Hello")
+        menu.manager.process_cipher(index=0, rot_type="rot13")
+
+        menu.undo()
+        menu.redo()
+        menu.redo()
+
+        captured = capsys.readouterr().out
+        assert "Undone changes to 1 text(s)" in captured
+        assert "Redone changes to 1 text(s)" in captured
+        assert "Nothing to redo" in captured
+        assert menu.manager.buffer.get(0).text == "Uryyb"
+
     def test_exit_program_prints_and_exits(self, capsys):
         class StubManager:
-            pass
+            def close(self):
+                pass
 
         menu = create_menu_with_manager(StubManager())
 
@@ -301,3 +434,19 @@ class TestMenu:
         captured = capsys.readouterr().out
         assert "Good bye!" in captured
         assert exc.value.code == 0
+
+    def test_exit_program_waits_for_pending_saves(self, capsys):
+        future = Future()
+
+        class StubManager:
+            def close(self):
+                future.set_result(None)
+
+        menu = create_menu_with_manager(StubManager())
+        menu.pending_saves.append(("session1", future))
+
+        with pytest.raises(SystemExit):
+            menu.exit_program()
+
+        captured = capsys.readouterr().out
+        assert captured.index("File 'session1' saved") < captured.index("Good bye!")
@@ -0,0 +1,86 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from src.cipher import CipherCaesar, CipherRot13, CipherRot47
+from src.constants import STATUS_DECRYPTED
+from src.parallel import ParallelCipher, parallel_cipher_chunks
+from src.text import Text
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+class TestParallelCipher:
+    @pytest.mark.parametrize("cipher_cls", [CipherRot13, CipherRot47])
+    def test_sharded_text_matches_serial_cipher(self, executor, cipher_cls):
+        text_obj = Text(text="Hello World ~>@ ąę 🙂 " * 50, rot_type="", status=STATUS_DECRYPTED)
+        cipher = ParallelCipher(cipher_cls(), executor, threshold=10, chunk_size=7)
+
+        assert cipher.cipher(text_obj) == cipher_cls().cipher(text_obj)
+
+    def test_small_text_stays_serial(self):
+        executor = Mock()
+        cipher = ParallelCipher(CipherRot13(), executor, threshold=100)
+
+        result = cipher.cipher(Text(text="Hello", rot_type="", status=STATUS_DECRYPTED))
+
+        assert result == "Uryyb"
+        executor.map.assert_not_called()
+
+    def test_sharded_bytes_match_serial_cipher(self, executor):
+        data = b"Hello World " * 100
+        cipher = ParallelCipher(CipherRot47(), executor, threshold=10, chunk_size=13)
+
+        assert cipher.cipher_bytes(data) == CipherRot47().cipher_bytes(data)
+
+    def test_writable_buffer_is_ciphered_in_place(self, executor):
+        data = bytearray(b"Hello World " * 100)
+        cipher = ParallelCipher(CipherRot13(), executor, threshold=10, chunk_size=13)
+
+        assert cipher.cipher_bytes(data) is data
+        assert data == bytearray(b"Uryyb Jbeyq " * 100)
+
+    def test_process_pool_workers_cipher_text(self):
+        text_obj = Text(text="Hello " * 100, rot_type="", status=STATUS_DECRYPTED)
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            cipher = ParallelCipher(CipherRot13(), pool, threshold=10, chunk_size=64)
+
+            assert cipher.cipher(text_obj) == "Uryyb " * 100
+
+    def test_inverse_wraps_inner_inverse(self, executor):
+        text_obj = Text(text="Hello " * 10, rot_type="", status=STATUS_DECRYPTED)
+        cipher = ParallelCipher(CipherCaesar(shift=3), executor, threshold=10, chunk_size=7)
+
+        encrypted = cipher.cipher(text_obj)
+        decrypted = cipher.inverse().cipher(Text(text=encrypted, rot_type="", status=""))
+
+        assert encrypted == "Khoor " * 10
+        assert decrypted == text_obj.text
+
+
+class TestParallelCipherChunks:
+    def test_results_keep_input_order(self, executor):
+        chunks = [b"Hello", b" ", b"World"] * 10
+
+        result = list(parallel_cipher_chunks(executor, CipherRot13(), iter(chunks), max_pending=2))
+
+        assert result == [b"Uryyb", b" ", b"Jbeyq"] * 10
+
+    def test_limits_chunks_in_flight(self):
+        executor = Mock()
+        consumed = []
+
+        def chunks():
+            for chunk in (b"a", b"b", b"c", b"d"):
+                consumed.append(chunk)
+                yield chunk
+
+        pipeline = parallel_cipher_chunks(executor, CipherRot13(), chunks(), max_pending=2)
+        next(pipeline)
+
+        assert consumed == [b"a", b"b"]
@@ -0,0 +1,226 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.buffer import Buffer
+from src.constants import ROT13, ROT47
+from src.file_handler import FileHandler
+from src.loadgen import percentile, run_load
+from src.manager import Manager
+from src.service import CipherService
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    manager = Manager(buffer=Buffer(), file_handler=FileHandler())
+    yield manager
+    manager.close()
+
+
+def call(service, requests):
+    async def run():
+        server = await service.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"".join(json.dumps(r).encode() + b"\n" for r in requests))
+            await writer.drain()
+            responses = [
+                json.loads(await asyncio.wait_for(reader.readline(), timeout=5)) for _ in requests
+            ]
+            writer.close()
+            await writer.wait_closed()
+            return responses
+        finally:
+            server.close()
+            await server.wait_closed()
+            await service.stop()
+
+    return asyncio.run(run())
+
+
+class TestCipherService:
+    def test_encrypt_and_decrypt(self, manager):
+        responses = call(
+            CipherService(manager),
+            [
+                {"id": 1, "op": "encrypt", "text": "Hello", "rot_type": ROT13},
+                {"id": 2, "op": "decrypt", "text": "Khoor", "rot_type": "caesar:3"},
+            ],
+        )
+
+        assert responses == [
+            {"id": 1, "ok": True, "result": "Uryyb"},
+            {"id": 2, "ok": True, "result": "Hello"},
+        ]
+
+    def test_pipelined_requests_are_batched_and_answered_in_order(self, manager):
+        service = CipherService(manager)
+        requests = [
+            {"id": i, "op": "encrypt", "text": f"text {i}", "rot_type": ROT47} for i in range(100)
+        ]
+
+        responses = call(service, requests)
+
+        assert [r["id"] for r in responses] == list(range(100))
+        assert all(r["ok"] for r in responses)
+        assert service.batches < 100
+
+    def test_errors_are_reported_per_request(self, manager):
+        responses = call(
+            CipherService(manager),
+            [
+                {"id": 1, "op": "encrypt", "text": "Hello", "rot_type": "rot99"},
+                {"id": 2, "op": "shout"},
+                [1, 2],
+                {"id": 3, "op": "get", "index": 0},
+                {"id": 4, "op": "encrypt", "text": "Hello", "rot_type": ROT13},
+            ],
+        )
+
+        assert [r["ok"] for r in responses] == [False, False, False, False, True]
+        assert responses[1]["error"] == "Unknown operation: shout"
+
+    def test_unexpected_errors_keep_connection_open(self, manager):
+        responses = call(
+            CipherService(manager),
+            [
+                {"id": 1, "op": "encrypt", "text": [1], "rot_type": ROT13},
+                {"id": 2, "op": "add", "text": "Hello"},
+                {"id": 3, "op": "list", "page_size": 0},
+                {"id": 4, "op": 7},
+                {"id": 5, "op": "encrypt", "text": "Hello", "rot_type": ROT13},
+            ],
+        )
+
+        assert [r["id"] for r in responses] == [1, 2, 3, 4, 5]
+        assert [r["ok"] for r in responses] == [False, True, False, False, True]
+        assert responses[2]["error"] == "Page size must be a positive integer"
+        assert responses[3]["error"] == "Request op must be a string"
+
+    @pytest.mark.parametrize("op", ["save", "load"])
+    @pytest.mark.parametrize(
+        "filename", ["../outside.json", "/tmp/outside.json", "nested/../../outside", "..", ""]
+    )
+    def test_file_names_cannot_leave_data_dir(self, manager, tmp_path, op, filename):
+        (tmp_path / "outside.json").write_text("[]")
+        responses = call(
+            CipherService(manager),
+            [
+                {"id": 1, "op": "add", "text": "Hello"},
+                {"id": 2, "op": op, "filename": filename},
+            ],
+        )
+
+        assert responses[1] == {
+            "id": 2,
+            "ok": False,
+            "error": "File name must be a plain name inside the data directory",
+        }
+        assert (tmp_path / "outside.json").read_text() == "[]"
+        assert len(manager.buffer) == 1
+
+    def test_failing_response_task_does_not_stop_sender(self, manager, monkeypatch):
+        service = CipherService(manager)
+        respond = service._respond
+
+        async def flaky_respond(line):
+            if b"boom" in line:
+                raise RuntimeError("boom")
+            return await respond(line)
+
+        monkeypatch.setattr(service, "_respond", flaky_respond)
+
+        responses = call(
+            service,
+            [
+                {"id": 1, "op": "boom"},
+                {"id": 2, "op": "encrypt", "text": "Hello", "rot_type": ROT13},
+            ],
+        )
+
+        assert responses == [
+            {"id": None, "ok": False, "error": "boom"},
+            {"id": 2, "ok": True, "result": "Uryyb"},
+        ]
+
+    def test_large_payloads_are_offloaded(self, manager):
+        text = "Hello world " * 1000
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            service = CipherService(manager, offload_threshold=1000, executor=executor)
+
+            (response,) = call(
+                service, [{"id": 1, "op": "encrypt", "text": text, "rot_type": ROT13}]
+            )
+
+        assert response["result"] == "Uryyb jbeyq " * 1000
+        assert service.batches == 0
+
+    def test_small_queue_applies_backpressure_without_losing_requests(self, manager):
+        service = CipherService(manager, batch_size=2, max_pending=1, pipeline_depth=2)
+        requests = [{"id": i, "op": "encrypt", "text": "a", "rot_type": ROT13} for i in range(50)]
+
+        responses = call(service, requests)
+
+        assert [r["result"] for r in responses] == ["n"] * 50
+
+    def test_buffer_operations_go_through_manager(self, manager):
+        responses = call(
+            CipherService(manager),
+            [
+                {"id": 1, "op": "add", "text": "Hello"},
+                {"id": 2, "op": "process", "index": 0, "rot_type": ROT13},
+                {"id": 3, "op": "save", "filename": "session"},
+                {"id": 4, "op": "add", "text": "World"},
+                {"id": 5, "op": "list", "page": 0, "page_size": 10},
+                {"id": 6, "op": "load", "filename": "session"},
+                {"id": 7, "op": "get", "index": 0},
+            ],
+        )
+
+        assert [r["result"] for r in responses] == [
+            0,
+            {"text": "Uryyb", "rot_type": ROT13, "status": "encrypted"},
+            "session",
+            1,
+            {
+                "texts": [
+                    "1. Uryyb - rot type: rot13, encrypted",
+                    "2. World - rot type: , decrypted",
+                ],
+                "pages": 1,
+            },
+            1,
+            {"text": "Uryyb", "rot_type": ROT13, "status": "encrypted"},
+        ]
+
+
+class TestLoadGenerator:
+    def test_run_load_reports_latency_and_throughput(self, manager):
+        async def run():
+            service = CipherService(manager)
+            server = await service.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                return await run_load(port=port, requests=101, connections=3, pipeline=4)
+            finally:
+                server.close()
+                await server.wait_closed()
+                await service.stop()
+
+        report = asyncio.run(run())
+
+        assert (report.requests, report.errors) == (101, 0)
+        assert 0 < report.p50_ms <= report.p99_ms
+        assert report.requests_per_sec > 0
+
+    def test_percentile_uses_nearest_rank(self):
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 0.5) == 51.0
+        assert percentile(values, 0.99) == 100.0
+        assert percentile([3.0], 0.99) == 3.0
@@ -1,3 +1,5 @@
+import pytest
+
 from src.text import Text
 
 
@@ -22,3 +24,17 @@ class TestText:
     def test_pass_int_as_attribute(self):
         obj = Text(text=4, rot_type="rot13", status="decrypted")
         assert obj.text == 4
+
+    def test_uses_slots_instead_of_instance_dict(self):
+        obj = Text(text="Dominik", rot_type="rot13", status="decrypted")
+
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.extra = "value"
+
+    def test_interns_rot_type_and_status(self):
+        first = Text(text="a", rot_type="".join(["rot", "13"]), status="".join(["de", "crypted"]))
+        second = Text(text="b", rot_type="".join(["rot", "13"]), status="".join(["de", "crypted"]))
+
+        assert first.rot_type is second.rot_type
+        assert first.status is second.status